@@ -5,7 +5,7 @@ from alembic import context
 from sqlalchemy import engine_from_config, pool
 
 from recipe_api.shared.config import settings
-from recipe_api.shared.models import Recipe, UserRecipeInteraction, GenerationLog  # noqa: F401
+from recipe_api.shared.models import Recipe, UserRecipeInteraction, GenerationLog, EmbeddingCacheEntry, EmbeddingVersion, RecipeEmbedding, JobCheckpoint  # noqa: F401
 from sqlmodel import SQLModel
 
 config = context.config
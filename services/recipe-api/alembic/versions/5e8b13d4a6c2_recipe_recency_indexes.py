@@ -0,0 +1,31 @@
+"""recipe_recency_indexes
+
+Revision ID: 5e8b13d4a6c2
+Revises: d7a2c95e1f60
+Create Date: 2026-10-18 14:02:47.218593
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8b13d4a6c2'
+down_revision: str | None = 'd7a2c95e1f60'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The single-column indexes are prefixes of the new composite ones.
+    op.create_index('ix_recipes_status_created_at', 'recipes', ['status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_recipes_created_by_created_at', 'recipes', ['created_by', 'created_at', 'id'], unique=False)
+    op.drop_index(op.f('ix_recipes_status'), table_name='recipes')
+    op.drop_index(op.f('ix_recipes_created_by'), table_name='recipes')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_recipes_created_by'), 'recipes', ['created_by'], unique=False)
+    op.create_index(op.f('ix_recipes_status'), 'recipes', ['status'], unique=False)
+    op.drop_index('ix_recipes_created_by_created_at', table_name='recipes')
+    op.drop_index('ix_recipes_status_created_at', table_name='recipes')
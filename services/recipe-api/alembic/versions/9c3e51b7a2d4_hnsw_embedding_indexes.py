@@ -0,0 +1,36 @@
+"""hnsw_embedding_indexes
+
+Revision ID: 9c3e51b7a2d4
+Revises: 45d271720390
+Create Date: 2026-10-18 10:12:31.402118
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3e51b7a2d4'
+down_revision: str | None = '45d271720390'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+EMBEDDING_INDEXES = {
+    'idx_description_embedding': 'description_embedding',
+    'idx_ingredient_embedding': 'ingredient_embedding',
+}
+
+
+def upgrade() -> None:
+    # HNSW needs no training data, so unlike ivfflat (lists=100, built on an
+    # empty table) it keeps its recall as the corpus grows.
+    for index_name, column in EMBEDDING_INDEXES.items():
+        op.drop_index(index_name, table_name='recipes')
+        op.create_index(index_name, 'recipes', [column], unique=False, postgresql_using='hnsw', postgresql_with={'m': 16, 'ef_construction': 64}, postgresql_ops={column: 'vector_cosine_ops'})
+
+
+def downgrade() -> None:
+    for index_name, column in EMBEDDING_INDEXES.items():
+        op.drop_index(index_name, table_name='recipes')
+        op.create_index(index_name, 'recipes', [column], unique=False, postgresql_using='ivfflat', postgresql_with={'lists': 100}, postgresql_ops={column: 'vector_cosine_ops'})
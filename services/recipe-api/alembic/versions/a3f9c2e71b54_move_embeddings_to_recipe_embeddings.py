@@ -0,0 +1,79 @@
+"""move_embeddings_to_recipe_embeddings
+
+Revision ID: a3f9c2e71b54
+Revises: 5e8b13d4a6c2
+Create Date: 2026-10-18 15:21:06.540317
+
+"""
+from collections.abc import Sequence
+
+import pgvector.sqlalchemy
+import sqlalchemy as sa
+from alembic import op
+
+from recipe_api.shared.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f9c2e71b54'
+down_revision: str | None = '5e8b13d4a6c2'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+EMBEDDING_INDEXES = {
+    'idx_description_embedding': 'description_embedding',
+    'idx_ingredient_embedding': 'ingredient_embedding',
+}
+
+
+def upgrade() -> None:
+    # Recipes embedded before any re-embed ran belong to the configured model.
+    op.execute(
+        sa.text(
+            "INSERT INTO embedding_versions (model, status, created_at, activated_at) "
+            "SELECT :model, 'ACTIVE', now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc' "
+            "WHERE NOT EXISTS (SELECT 1 FROM embedding_versions WHERE status = 'ACTIVE')"
+        ).bindparams(model=settings.embedding_model)
+    )
+    # `recipes` held the active version's vectors; they win over any copy a
+    # previous swap left behind.
+    op.execute(
+        "INSERT INTO recipe_embeddings "
+        "(recipe_id, version_id, description_embedding, ingredient_embedding, updated_at) "
+        "SELECT r.id, v.id, r.description_embedding, r.ingredient_embedding, r.updated_at "
+        "FROM recipes r JOIN embedding_versions v ON v.status = 'ACTIVE' "
+        "WHERE r.description_embedding IS NOT NULL OR r.ingredient_embedding IS NOT NULL "
+        "ON CONFLICT (recipe_id, version_id) DO UPDATE SET "
+        "description_embedding = EXCLUDED.description_embedding, "
+        "ingredient_embedding = EXCLUDED.ingredient_embedding, "
+        "updated_at = EXCLUDED.updated_at"
+    )
+    op.execute(
+        "DELETE FROM recipe_embeddings e USING embedding_versions v "
+        "WHERE e.version_id = v.id AND v.status = 'RETIRED'"
+    )
+
+    for index_name, column in EMBEDDING_INDEXES.items():
+        op.drop_index(index_name, table_name='recipes')
+        op.drop_column('recipes', column)
+        # HNSW needs a fixed dimension.
+        op.alter_column('recipe_embeddings', column, type_=pgvector.sqlalchemy.vector.VECTOR(dim=384), postgresql_using=f'{column}::vector(384)')
+        op.create_index(index_name, 'recipe_embeddings', [column], unique=False, postgresql_using='hnsw', postgresql_with={'m': 16, 'ef_construction': 64}, postgresql_ops={column: 'vector_cosine_ops'})
+
+
+def downgrade() -> None:
+    for index_name, column in EMBEDDING_INDEXES.items():
+        op.drop_index(index_name, table_name='recipe_embeddings')
+        op.alter_column('recipe_embeddings', column, type_=pgvector.sqlalchemy.vector.VECTOR())
+        op.add_column('recipes', sa.Column(column, pgvector.sqlalchemy.vector.VECTOR(dim=384), nullable=True))
+
+    op.execute(
+        "UPDATE recipes r SET "
+        "description_embedding = e.description_embedding, "
+        "ingredient_embedding = e.ingredient_embedding "
+        "FROM recipe_embeddings e JOIN embedding_versions v ON v.id = e.version_id "
+        "WHERE e.recipe_id = r.id AND v.status = 'ACTIVE'"
+    )
+
+    for index_name, column in EMBEDDING_INDEXES.items():
+        op.create_index(index_name, 'recipes', [column], unique=False, postgresql_using='hnsw', postgresql_with={'m': 16, 'ef_construction': 64}, postgresql_ops={column: 'vector_cosine_ops'})
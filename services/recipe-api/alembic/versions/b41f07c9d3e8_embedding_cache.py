@@ -0,0 +1,33 @@
+"""embedding_cache
+
+Revision ID: b41f07c9d3e8
+Revises: 9c3e51b7a2d4
+Create Date: 2026-10-18 11:03:47.218305
+
+"""
+from collections.abc import Sequence
+
+import pgvector.sqlalchemy
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41f07c9d3e8'
+down_revision: str | None = '9c3e51b7a2d4'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table('embedding_cache',
+    sa.Column('model', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+    sa.Column('content_hash', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+    sa.Column('embedding', pgvector.sqlalchemy.vector.VECTOR(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('model', 'content_hash')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('embedding_cache')
@@ -0,0 +1,29 @@
+"""embedding_cache_last_used_at
+
+Revision ID: c8e27f4a91d5
+Revises: e6d48a1f9b27
+Create Date: 2026-10-18 21:12:40.517382
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e27f4a91d5'
+down_revision: str | None = 'e6d48a1f9b27'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('embedding_cache', sa.Column('last_used_at', sa.DateTime(), nullable=True))
+    op.execute('UPDATE embedding_cache SET last_used_at = created_at')
+    op.alter_column('embedding_cache', 'last_used_at', nullable=False)
+    op.create_index(op.f('ix_embedding_cache_last_used_at'), 'embedding_cache', ['last_used_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_embedding_cache_last_used_at'), table_name='embedding_cache')
+    op.drop_column('embedding_cache', 'last_used_at')
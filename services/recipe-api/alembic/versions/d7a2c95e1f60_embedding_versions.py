@@ -0,0 +1,57 @@
+"""embedding_versions
+
+Revision ID: d7a2c95e1f60
+Revises: b41f07c9d3e8
+Create Date: 2026-10-18 11:48:09.613027
+
+"""
+from collections.abc import Sequence
+
+import pgvector.sqlalchemy
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a2c95e1f60'
+down_revision: str | None = 'b41f07c9d3e8'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    sa.Enum('BACKFILLING', 'ACTIVE', 'RETIRED', name='embeddingversionstatus').create(op.get_bind())
+    op.create_table('embedding_versions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('model', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+    sa.Column('status', postgresql.ENUM('BACKFILLING', 'ACTIVE', 'RETIRED', name='embeddingversionstatus', create_type=False), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('activated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_embedding_versions_single_active', 'embedding_versions', ['status'], unique=True, postgresql_where=sa.text("status = 'ACTIVE'"))
+    op.create_table('recipe_embeddings',
+    sa.Column('recipe_id', sa.Uuid(), nullable=False),
+    sa.Column('version_id', sa.Integer(), nullable=False),
+    sa.Column('description_embedding', pgvector.sqlalchemy.vector.VECTOR(), nullable=True),
+    sa.Column('ingredient_embedding', pgvector.sqlalchemy.vector.VECTOR(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['recipe_id'], ['recipes.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['version_id'], ['embedding_versions.id'], ),
+    sa.PrimaryKeyConstraint('recipe_id', 'version_id')
+    )
+    op.create_table('job_checkpoints',
+    sa.Column('name', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+    sa.Column('position', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('job_checkpoints')
+    op.drop_table('recipe_embeddings')
+    op.drop_index('idx_embedding_versions_single_active', table_name='embedding_versions', postgresql_where=sa.text("status = 'ACTIVE'"))
+    op.drop_table('embedding_versions')
+    sa.Enum('BACKFILLING', 'ACTIVE', 'RETIRED', name='embeddingversionstatus').drop(op.get_bind())
@@ -0,0 +1,24 @@
+"""interaction_updated_at_index
+
+Revision ID: e6d48a1f9b27
+Revises: a3f9c2e71b54
+Create Date: 2026-10-18 17:36:12.804155
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6d48a1f9b27'
+down_revision: str | None = 'a3f9c2e71b54'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_user_recipe_updated_at', 'user_recipe_interactions', ['updated_at', 'recipe_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_user_recipe_updated_at', table_name='user_recipe_interactions')
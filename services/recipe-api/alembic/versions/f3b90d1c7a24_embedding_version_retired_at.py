@@ -0,0 +1,26 @@
+"""embedding_version_retired_at
+
+Revision ID: f3b90d1c7a24
+Revises: c8e27f4a91d5
+Create Date: 2026-10-18 23:04:11.902716
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b90d1c7a24'
+down_revision: str | None = 'c8e27f4a91d5'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('embedding_versions', sa.Column('retired_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE embedding_versions SET retired_at = now() WHERE status = 'RETIRED'")
+
+
+def downgrade() -> None:
+    op.drop_column('embedding_versions', 'retired_at')
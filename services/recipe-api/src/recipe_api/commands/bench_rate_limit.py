@@ -0,0 +1,121 @@
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from recipe_api.shared.config import settings
+
+
+async def _redis_calls(redis: Any) -> int:
+    stats = await redis.info("commandstats")
+    return sum(value["calls"] for value in stats.values())
+
+
+def _fastapi_limiter_app(times: int) -> Any:
+    from fastapi import Depends, FastAPI
+    from fastapi_limiter.depends import RateLimiter
+
+    from recipe_api.shared.rate_limit import get_rate_limit_key
+
+    app = FastAPI(dependencies=[Depends(RateLimiter(times=times, seconds=60, identifier=get_rate_limit_key))])
+
+    @app.post("/search", dependencies=[Depends(RateLimiter(times=times, seconds=60, identifier=get_rate_limit_key))])
+    async def search() -> dict[str, bool]:
+        return {"ok": True}
+
+    return app
+
+
+def _lua_limiter_app(times: int) -> Any:
+    from fastapi import Depends, FastAPI
+
+    from recipe_api.shared.rate_limit import RateLimit, RateLimiter, rate_limit
+
+    app = FastAPI(dependencies=[Depends(RateLimiter(RateLimit(times=times, seconds=60)))])
+
+    @app.post("/search")
+    @rate_limit(RateLimit(times=times, seconds=60))
+    async def search() -> dict[str, bool]:
+        return {"ok": True}
+
+    return app
+
+
+def _unlimited_app(times: int) -> Any:
+    from fastapi import FastAPI
+
+    app = FastAPI()
+
+    @app.post("/search")
+    async def search() -> dict[str, bool]:
+        return {"ok": True}
+
+    return app
+
+
+async def _run(name: str, build: Callable[[int], Any], requests: int, clients: int) -> None:
+    import httpx
+    from fastapi_limiter import FastAPILimiter
+
+    from recipe_api.shared.redis import get_redis
+
+    redis = get_redis()
+    await FastAPILimiter.init(redis, prefix=f"bench-{uuid.uuid4()}")
+    # Limits high enough that nothing is rejected: this measures overhead only.
+    app = build(requests * 10)
+    latencies: list[float] = []
+
+    async def client() -> None:
+        # Each client is its own IP, so it gets its own counters.
+        transport = httpx.ASGITransport(app=app, client=(str(uuid.uuid4()), 0))
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+            for _ in range(requests // clients):
+                started = time.perf_counter()
+                response = await http.post("/search")
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code == 200, response.text
+
+    calls_before = await _redis_calls(redis)
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+    redis_calls = await _redis_calls(redis) - calls_before
+
+    latencies.sort()
+    print(
+        f"{name:<16} {len(latencies) / elapsed:>9.0f} req/s  "
+        f"p50 {statistics.median(latencies) * 1000:6.2f}ms  "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:6.2f}ms  "
+        f"{redis_calls / len(latencies):5.2f} Redis calls/request"
+    )
+
+
+def bench_rate_limit() -> None:
+    parser = argparse.ArgumentParser(
+        prog="bench-rate-limit",
+        description="Compare the per-request overhead of the rate limiters against Redis.",
+    )
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per limiter")
+    parser.add_argument("--clients", type=int, default=20, help="Concurrent clients")
+    args = parser.parse_args()
+
+    print(f"Redis at {settings.redis_url}: {args.requests} requests from {args.clients} clients")
+    asyncio.run(_bench(args.requests, args.clients))
+
+
+async def _bench(requests: int, clients: int) -> None:
+    from recipe_api.shared.redis import close_redis
+
+    # One event loop for every limiter: the shared Redis client is bound to it.
+    try:
+        for name, build in (
+            ("no limiter", _unlimited_app),
+            ("fastapi-limiter", _fastapi_limiter_app),
+            ("lua + leases", _lua_limiter_app),
+        ):
+            await _run(name, build, requests, clients)
+    finally:
+        await close_redis()
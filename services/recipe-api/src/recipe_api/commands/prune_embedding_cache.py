@@ -0,0 +1,29 @@
+import argparse
+
+from recipe_api.shared.config import settings
+
+
+def prune_embedding_cache() -> None:
+    parser = argparse.ArgumentParser(
+        prog="prune-embedding-cache",
+        description="Delete cached document embeddings that have not been used recently.",
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=settings.embedding_cache_retention_days,
+        help="Delete entries unused for this many days",
+    )
+    args = parser.parse_args()
+
+    from datetime import timedelta
+
+    from sqlmodel import Session
+
+    from recipe_api.shared.db import engine
+    from recipe_api.shared.services.embedding_cache import prune_embedding_cache as prune
+
+    with Session(engine) as session:
+        deleted = prune(session, timedelta(days=args.days))
+        session.commit()
+    print(f"Deleted {deleted} embedding cache entries unused for {args.days} days")
@@ -0,0 +1,44 @@
+import argparse
+import sys
+
+from recipe_api.shared.config import settings
+
+
+def reconcile_counts() -> None:
+    parser = argparse.ArgumentParser(
+        prog="reconcile-counts",
+        description="Recompute recipe like/favorite counts from user interactions.",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.counter_reconcile_batch_size, help="Recipes per batch"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Check every recipe, not just those with interactions since the last run",
+    )
+    args = parser.parse_args()
+
+    from recipe_api.features.users.reconcile import CountReconciler, ReconcileResult
+    from recipe_api.shared.db import engine
+
+    def report(result: ReconcileResult) -> None:
+        print(f"  {result.checked} recipes checked in {result.elapsed_seconds:.1f}s")
+
+    reconciler = CountReconciler(engine, args.batch_size, on_batch=report)
+    print("Reconciling all recipe counts..." if args.full else "Reconciling recently touched recipe counts...")
+
+    try:
+        result = reconciler.run(full=args.full)
+    except KeyboardInterrupt:
+        print("\nReconcile stopped; corrected batches are committed")
+        sys.exit(1)
+
+    for drift in result.drift:
+        print(f"  {drift.recipe_id} {drift.counter}: {drift.stored} -> {drift.actual}")
+    print(
+        f"Checked {result.checked} recipes, corrected {result.corrected} "
+        f"({len(result.drift)} drifted counters) in {result.elapsed_seconds:.1f}s"
+    )
+    if result.deferred:
+        print(f"Deferred {result.deferred} recipes with toggles still settling to the next run")
@@ -0,0 +1,86 @@
+import argparse
+import sys
+
+from recipe_api.shared.config import settings
+
+
+def reembed() -> None:
+    parser = argparse.ArgumentParser(
+        prog="reembed",
+        description="Re-embed every recipe with a model and switch search over to it.",
+    )
+    parser.add_argument("--model", default=settings.embedding_model, help="Model to embed with")
+    parser.add_argument("--batch-size", type=int, default=512, help="Recipes per batch")
+    parser.add_argument(
+        "--no-swap",
+        action="store_true",
+        help="Only backfill; run again without this flag to activate the new version",
+    )
+    parser.add_argument(
+        "--prune-retired",
+        action="store_true",
+        help="Only delete the vectors of versions retired long enough ago, then exit",
+    )
+    args = parser.parse_args()
+
+    from datetime import timedelta
+
+    from sqlmodel import Session
+
+    from recipe_api.features.search.reembed import (
+        ReembedPipeline,
+        ReembedProgress,
+        prune_retired_embeddings,
+    )
+    from recipe_api.shared.db import engine
+    from recipe_api.shared.services.embedding_cache import prune_embedding_cache
+    from recipe_api.shared.services.embeddings import EmbeddingService
+
+    # Retired versions stay searchable for a grace period after a swap;
+    # whichever run comes next drops them.
+    with Session(engine) as session:
+        pruned = prune_retired_embeddings(session)
+        session.commit()
+    print(f"Pruned {pruned} embeddings of retired versions")
+    if args.prune_retired:
+        return
+
+    embedding_service = EmbeddingService(args.model)
+    dimension = embedding_service.model.get_sentence_embedding_dimension()
+    if dimension != settings.embedding_dimension:
+        print(
+            f"Error: {args.model} produces {dimension}-dim vectors, "
+            f"but the recipe embedding columns are {settings.embedding_dimension}-dim."
+        )
+        sys.exit(1)
+
+    def report(progress: ReembedProgress) -> None:
+        print(
+            f"  {progress.processed} recipes in {progress.elapsed_seconds:.1f}s "
+            f"({progress.recipes_per_second:.1f} recipes/s)"
+        )
+
+    pipeline = ReembedPipeline(engine, embedding_service, args.batch_size, on_progress=report)
+    version = pipeline.get_or_create_version()
+    print(f"Backfilling embedding version {version.id} ({args.model})...")
+
+    try:
+        progress = pipeline.backfill(version)
+    except KeyboardInterrupt:
+        print("\nRe-embed stopped, run again to resume from the last checkpoint")
+        sys.exit(1)
+    print(f"Backfilled {progress.processed} recipes ({progress.recipes_per_second:.1f} recipes/s)")
+
+    if args.no_swap:
+        return
+
+    caught_up = pipeline.swap(version)
+    print(f"Version {version.id} is active ({caught_up} recipes edited during the backfill re-encoded)")
+
+    # The backfill touched every live text, so what is left unused is stale.
+    with Session(engine) as session:
+        pruned = prune_embedding_cache(
+            session, timedelta(days=settings.embedding_cache_retention_days)
+        )
+        session.commit()
+    print(f"Pruned {pruned} unused embedding cache entries")
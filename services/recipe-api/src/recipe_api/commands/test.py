@@ -17,10 +17,14 @@ def _run_pytest(test: list[str]) -> None:
         sys.exit(1)
 
 def all_tests() -> None:
-    _run_pytest([])
+    _run_pytest(["-m", "not benchmark"])
 
 def unit_tests() -> None:
     _run_pytest(["-m", "unit"])
 
 def e2e_tests() -> None:
     _run_pytest(["-m", "e2e"])
+
+def benchmark_tests() -> None:
+    # -s, so each benchmark's summary line shows up.
+    _run_pytest(["-m", "benchmark", "-s"])
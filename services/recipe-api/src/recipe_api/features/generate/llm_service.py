@@ -1,8 +1,6 @@
 import json
 import time
-
-import instructor
-from openai import OpenAI
+from typing import TYPE_CHECKING
 
 from recipe_api.features.generate.prompts import RecipePrompts
 from recipe_api.features.generate.schemas import (
@@ -12,31 +10,33 @@ from recipe_api.features.generate.schemas import (
     RecipeReviewList,
 )
 from recipe_api.shared.config import settings
+from recipe_api.shared.services.llm import get_async_openai_client
+
+if TYPE_CHECKING:
+    import instructor
 
-_cached_client: instructor.Instructor | None = None
+_cached_client: "instructor.AsyncInstructor | None" = None
 
 
 class GenerationLLMService:
-    def __init__(self) -> None:
-        pass
+    def __init__(self, client: "instructor.AsyncInstructor | None" = None) -> None:
+        self._client = client
 
     @property
-    def client(self) -> instructor.Instructor:
-        return self._get_instructor_client()
+    def client(self) -> "instructor.AsyncInstructor":
+        return self._client or self._get_instructor_client()
 
-    def _get_instructor_client(self) -> instructor.Instructor:
+    def _get_instructor_client(self) -> "instructor.AsyncInstructor":
         global _cached_client
         if _cached_client is None:
-            openai_client = OpenAI(
-                base_url=settings.vllm_base_url,
-                api_key=settings.vllm_api_key or "EMPTY",
-            )
+            import instructor
+
             _cached_client = instructor.from_openai(
-                openai_client, mode=instructor.Mode.JSON
+                get_async_openai_client(), mode=instructor.Mode.JSON
             )
         return _cached_client
 
-    def generate_content(
+    async def generate_content(
         self,
         input_data: GenerateRecipeInput,
     ) -> tuple[dict, str, int]:
@@ -50,7 +50,7 @@ class GenerationLLMService:
 
         start_time = time.time()
         try:
-            result = self.client.chat.completions.create(
+            result = await self.client.chat.completions.create(
                 model=settings.vllm_model,
                 messages=[
                     {"role": "system", "content": RecipePrompts.GENERATE_SYSTEM},
@@ -66,11 +66,11 @@ class GenerationLLMService:
         except Exception:
             raise
 
-    def review_quality(self, recipe_data: dict) -> tuple[dict, str]:
+    async def review_quality(self, recipe_data: dict) -> tuple[dict, str]:
         recipes_json = json.dumps([recipe_data], indent=2)
         prompt = RecipePrompts.build_review_user_prompt(recipes_json)
 
-        result = self.client.chat.completions.create(
+        result = await self.client.chat.completions.create(
             model=settings.vllm_model,
             messages=[
                 {"role": "system", "content": RecipePrompts.REVIEW_SYSTEM},
@@ -88,7 +88,7 @@ class GenerationLLMService:
 
         return {"needs_fixes": False}, "{}"
 
-    def fix_issues(
+    async def fix_issues(
         self,
         recipe_data: dict,
         review_data: dict,
@@ -112,7 +112,7 @@ class GenerationLLMService:
             issues_json=json.dumps(issues, indent=2),
         )
 
-        result = self.client.chat.completions.create(
+        result = await self.client.chat.completions.create(
             model=settings.vllm_model,
             messages=[
                 {"role": "system", "content": RecipePrompts.FIX_SYSTEM},
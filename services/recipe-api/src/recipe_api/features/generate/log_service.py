@@ -1,7 +1,7 @@
 import uuid
 from typing import Any
 
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from recipe_api.shared.config import settings
 from recipe_api.shared.models.generation_log import GenerationLog
@@ -9,10 +9,10 @@ from recipe_api.shared.models.generation_log import LogGenerationStep as LogStep
 
 
 class GenerationLogService:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
-    def log_llm_call(
+    async def log_llm_call(
         self,
         recipe_id: uuid.UUID,
         workflow_id: str,
@@ -38,4 +38,4 @@ class GenerationLogService:
             duration_ms=duration_ms,
         )
         self.session.add(log)
-        self.session.commit()
+        await self.session.commit()
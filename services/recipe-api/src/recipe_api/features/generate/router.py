@@ -1,7 +1,6 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_limiter.depends import RateLimiter
 from temporalio.client import Client
 
 from recipe_api.features.generate.schemas import (
@@ -11,15 +10,18 @@ from recipe_api.features.generate.schemas import (
     GenerateStatusResponse,
 )
 from recipe_api.features.generate.service import GenerateService
-from recipe_api.shared.deps import CurrentUserDep, SessionDep
-from recipe_api.shared.rate_limit import get_rate_limit_key
+from recipe_api.shared.deps import AsyncSessionDep, CurrentUserDep
+from recipe_api.shared.rate_limit import RateLimit, body_cost, rate_limit
 from recipe_api.shared.temporal import get_temporal_client
 
 router = APIRouter(prefix="/generate", tags=["generate"])
 
+# Each generated recipe is drafted, reviewed and fixed by the LLM.
+LLM_CALLS_PER_RECIPE = 3
+
 
 async def get_generate_service(
-    session: SessionDep,
+    session: AsyncSessionDep,
     temporal_client: Annotated[Client, Depends(get_temporal_client)],
 ) -> GenerateService:
     return GenerateService(temporal_client, session)
@@ -30,7 +32,10 @@ async def get_generate_service(
     response_model=GenerateResponse,
     status_code=status.HTTP_202_ACCEPTED,
     summary="Start recipe generation",
-    dependencies=[Depends(RateLimiter(times=5, hours=1, identifier=get_rate_limit_key))],
+)
+@rate_limit(
+    RateLimit(times=5 * LLM_CALLS_PER_RECIPE, seconds=60 * 60),
+    cost=body_cost(GenerateRequest, lambda request: request.amount * LLM_CALLS_PER_RECIPE),
 )
 async def start_generation(
     request: GenerateRequest,
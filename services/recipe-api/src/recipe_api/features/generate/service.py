@@ -1,6 +1,7 @@
 import uuid
 
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from temporalio.client import Client
 
 from recipe_api.features.generate.schemas import (
@@ -15,7 +16,7 @@ from recipe_api.workflows.recipe_generation import RecipeGenerationWorkflow
 
 
 class GenerateService:
-    def __init__(self, temporal_client: Client, session: Session):
+    def __init__(self, temporal_client: Client, session: AsyncSession):
         self.client = temporal_client
         self.session = session
 
@@ -51,11 +52,12 @@ class GenerateService:
         return base_workflow_id, workflow_ids
 
     async def get_status(self, workflow_id: str) -> dict:
-        recipes = self.session.exec(
+        result = await self.session.exec(
             select(Recipe).where(
                 Recipe.workflow_id.startswith(workflow_id)  # type: ignore[union-attr]
             )
-        ).all()
+        )
+        recipes = result.all()
 
         if not recipes:
             return {
@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+import httpx
+import instructor
+import pytest
+from openai import AsyncOpenAI
+
+from recipe_api.features.generate.llm_service import GenerationLLMService
+from recipe_api.features.generate.schemas import GenerateRecipeInput
+
+RECIPE = {
+    "name": "Garlic chicken",
+    "description": "Pan-seared chicken with garlic.",
+    "ingredients": [{"name": "chicken", "amount": "2", "unit": "pieces"}],
+    "instructions": ["Sear the chicken.", "Add the garlic."],
+    "food_type": "DINNER",
+}
+
+
+class FakeVLLM:
+    """Answers chat completions after a delay, tracking requests in flight."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return httpx.Response(
+            200,
+            json={
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "test",
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": json.dumps(RECIPE)},
+                    }
+                ],
+            },
+        )
+
+
+def _service(vllm: FakeVLLM) -> GenerationLLMService:
+    openai_client = AsyncOpenAI(
+        base_url="http://vllm.test/v1",
+        api_key="EMPTY",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(vllm)),
+    )
+    return GenerationLLMService(instructor.from_openai(openai_client, mode=instructor.Mode.JSON))
+
+
+@pytest.mark.unit
+async def test_generation_calls_run_concurrently() -> None:
+    vllm = FakeVLLM(delay=0.2)
+    service = _service(vllm)
+    request = GenerateRecipeInput(prompt="chicken dinner", user_id="user", workflow_id="wf")
+
+    results = await asyncio.gather(*(service.generate_content(request) for _ in range(5)))
+
+    assert [data["name"] for data, _, _ in results] == [RECIPE["name"]] * 5
+    assert vllm.max_in_flight == 5
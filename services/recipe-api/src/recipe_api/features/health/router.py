@@ -1,5 +1,6 @@
+from fastapi import APIRouter, Request, Response, status
 
-from fastapi import APIRouter
+from recipe_api.features.health.schemas import ReadinessResponse
 
 router = APIRouter(tags=["health"])
 
@@ -11,3 +12,23 @@ def root() -> dict[str, str]:
 @router.get("/health")
 def health() -> dict[str, str]:
     return {"status": "healthy"}
+
+
+@router.get(
+    "/ready",
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessResponse}},
+)
+def ready(request: Request, response: Response) -> ReadinessResponse:
+    """Passes once startup warmup is done; point load balancer health checks here."""
+    warmup = getattr(request.app.state, "warmup", None)
+    if warmup is None:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return ReadinessResponse(ready=False, pending=["startup"], errors={})
+
+    if not warmup.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ReadinessResponse(
+        ready=warmup.ready,
+        pending=sorted(warmup.pending),
+        errors=dict(warmup.errors),
+    )
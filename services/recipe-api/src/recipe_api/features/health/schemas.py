@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class ReadinessResponse(BaseModel):
+    ready: bool
+    pending: list[str]
+    errors: dict[str, str]
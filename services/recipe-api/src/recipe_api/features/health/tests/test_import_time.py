@@ -0,0 +1,48 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import recipe_api
+
+# Cumulative `python -X importtime` budget for `import recipe_api.main`.
+IMPORT_TIME_BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", "2500"))
+
+# Loaded on first use only; importing any of them eagerly adds seconds.
+LAZY_MODULES = ["torch", "sentence_transformers", "instructor", "openai", "clerk_backend_api"]
+
+
+def _import_app() -> subprocess.CompletedProcess[str]:
+    code = (
+        "import sys, recipe_api.main; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(Path(recipe_api.__file__).parents[1])},
+    )
+
+
+@pytest.mark.unit
+def test_heavy_dependencies_are_not_imported_eagerly() -> None:
+    result = _import_app()
+    assert result.stdout.strip() == ""
+
+
+@pytest.mark.unit
+def test_app_import_time_budget() -> None:
+    result = _import_app()
+    match = re.search(r"import time:\s+\d+ \|\s+(\d+) \| recipe_api\.main$", result.stderr, re.M)
+    assert match is not None
+
+    cumulative_ms = int(match.group(1)) / 1000
+    assert cumulative_ms < IMPORT_TIME_BUDGET_MS, (
+        f"importing recipe_api.main took {cumulative_ms:.0f}ms "
+        f"(budget {IMPORT_TIME_BUDGET_MS:.0f}ms)"
+    )
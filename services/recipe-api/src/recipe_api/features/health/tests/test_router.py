@@ -1,7 +1,11 @@
+import asyncio
+
 import pytest
+from fastapi.testclient import TestClient
 
+from recipe_api.shared.warmup import Warmup, WarmupStep
 from recipe_api_client import Client as ApiClient
-from recipe_api_client.api.health import health_health_get, root_get
+from recipe_api_client.api.health import health_health_get, ready_ready_get, root_get
 
 
 @pytest.mark.e2e
@@ -19,3 +23,22 @@ def test_health(user1_client: ApiClient) -> None:
     assert response.status_code == 200
     assert response.parsed is not None
     assert response.parsed["status"] == "healthy"
+
+
+@pytest.mark.e2e
+def test_ready_waits_for_warmup(client: TestClient, user1_client: ApiClient) -> None:
+    async def never_finishes() -> None:
+        await asyncio.Event().wait()
+
+    client.app.state.warmup = Warmup([WarmupStep("embedding_model", never_finishes)])  # type: ignore[attr-defined]
+    response = ready_ready_get.sync_detailed(client=user1_client)
+    assert response.status_code == 503
+    assert response.parsed is not None
+    assert response.parsed.ready is False
+    assert response.parsed.pending == ["embedding_model"]
+
+    client.app.state.warmup = Warmup([])  # type: ignore[attr-defined]
+    response = ready_ready_get.sync_detailed(client=user1_client)
+    assert response.status_code == 200
+    assert response.parsed is not None
+    assert response.parsed.ready is True
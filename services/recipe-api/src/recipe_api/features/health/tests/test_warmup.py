@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from recipe_api.shared.warmup import Warmup, WarmupStep
+
+
+def _flaky(failures: int) -> WarmupStep:
+    calls = 0
+
+    async def run() -> None:
+        nonlocal calls
+        calls += 1
+        if calls <= failures:
+            raise ConnectionError(f"attempt {calls} failed")
+
+    return WarmupStep(f"flaky-{failures}", run)
+
+
+@pytest.mark.unit
+async def test_ready_once_required_steps_succeed() -> None:
+    warmup = Warmup([_flaky(0), _flaky(2)], retry_seconds=0.001)
+    assert not warmup.ready
+
+    await asyncio.wait_for(warmup.run(), timeout=1)
+
+    assert warmup.ready
+    assert warmup.errors == {}
+
+
+@pytest.mark.unit
+async def test_optional_step_does_not_hold_back_readiness() -> None:
+    connected = asyncio.Event()
+
+    async def connect() -> None:
+        if not connected.is_set():
+            raise ConnectionError("temporal unavailable")
+
+    warmup = Warmup(
+        [_flaky(0), WarmupStep("temporal", connect, required=False)],
+        retry_seconds=0.001,
+    )
+    task = asyncio.create_task(warmup.run())
+    while not warmup.ready:
+        await asyncio.sleep(0.001)
+
+    assert warmup.errors == {"temporal": "temporal unavailable"}
+    assert not task.done()
+
+    connected.set()
+    await asyncio.wait_for(task, timeout=1)
+    assert warmup.errors == {}
@@ -0,0 +1,28 @@
+import base64
+import binascii
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+RecipeCursor = tuple[datetime, uuid.UUID]
+
+
+def encode_cursor(created_at: datetime, recipe_id: uuid.UUID) -> str:
+    raw = f"{created_at.isoformat()}|{recipe_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> RecipeCursor:
+    """Inverse of `encode_cursor`. Clients treat cursors as opaque strings."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, recipe_id = raw.split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(recipe_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
@@ -1,60 +1,74 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 
+from recipe_api.features.recipes.pagination import NEXT_CURSOR_HEADER
 from recipe_api.features.recipes.schemas import RecipeCreate, RecipeRead, RecipeUpdate
 from recipe_api.features.recipes.service import RecipeService
-from recipe_api.shared.deps import CurrentUserDep, OptionalUserDep, SessionDep
+from recipe_api.shared.deps import AsyncSessionDep, CurrentUserDep, OptionalUserDep
 from recipe_api.shared.models.recipe import Recipe
-from recipe_api.shared.services.embeddings import EmbeddingService, get_embedding_service
+from recipe_api.shared.services.embedding_executor import (
+    EmbeddingExecutor,
+    get_embedding_executor,
+)
 
 router = APIRouter(prefix="/recipes", tags=["recipes"])
 
 
-def get_recipe_service(
-    session: SessionDep,
-    embedding_service: Annotated[EmbeddingService, Depends(get_embedding_service)],
+async def get_recipe_service(
+    session: AsyncSessionDep,
+    embedding_executor: Annotated[EmbeddingExecutor, Depends(get_embedding_executor)],
 ) -> RecipeService:
-    return RecipeService(session, embedding_service)
+    return RecipeService(session, embedding_executor)
 
 
 @router.post("/", response_model=RecipeRead, status_code=status.HTTP_201_CREATED)
-def create_recipe(
+async def create_recipe(
     recipe: RecipeCreate,
     current_user: CurrentUserDep,
     service: Annotated[RecipeService, Depends(get_recipe_service)],
 ) -> Recipe:
-    return service.create_recipe(recipe, current_user)
+    return await service.create_recipe(recipe, current_user)
 
 
 @router.get("/{recipe_id}", response_model=RecipeRead)
-def get_recipe(
+async def get_recipe(
     recipe_id: uuid.UUID,
     service: Annotated[RecipeService, Depends(get_recipe_service)],
     current_user: OptionalUserDep,
-) -> Recipe:
-    return service.get_recipe(recipe_id, current_user)
+) -> RecipeRead:
+    return await service.read_recipe(recipe_id, current_user)
 
 
 @router.get("/", response_model=list[RecipeRead])
-def list_recipes(
+async def list_recipes(
+    response: Response,
     service: Annotated[RecipeService, Depends(get_recipe_service)],
     current_user: OptionalUserDep,
-    skip: int = 0,
-    limit: int = 20,
-) -> list[Recipe]:
-    return service.list_recipes(skip, limit, current_user)
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    skip: Annotated[int | None, Query(ge=0, deprecated=True)] = None,
+) -> list[RecipeRead]:
+    """Newest first. Pass the `X-Next-Cursor` response header back as `cursor`
+    for the next page; the header is absent on the last page."""
+    if skip is not None:
+        return await service.list_recipes(skip, limit, current_user)
+
+    recipes, next_cursor = await service.list_recipes_page(cursor, limit, current_user)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return recipes
 
 
 @router.patch("/{recipe_id}", response_model=RecipeRead)
-def update_recipe(
+async def update_recipe(
     recipe_id: uuid.UUID,
     recipe_update: RecipeUpdate,
     current_user: CurrentUserDep,
     service: Annotated[RecipeService, Depends(get_recipe_service)],
 ) -> Recipe:
-    return service.update_recipe(recipe_id, recipe_update, current_user)
+    return await service.update_recipe(recipe_id, recipe_update, current_user)
 
 
 # @router.delete("/{recipe_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1,11 +1,19 @@
 import uuid
 from datetime import datetime
+from typing import Any
 
 from fastapi import HTTPException, status
-from sqlalchemy import or_
-from sqlmodel import Session, select
-
-from recipe_api.features.recipes.schemas import RecipeCreate, RecipeUpdate
+from sqlalchemy import and_, or_, tuple_, union_all
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
+
+from recipe_api.features.recipes.pagination import RecipeCursor, decode_cursor, encode_cursor
+from recipe_api.features.recipes.schemas import RecipeCreate, RecipeRead, RecipeUpdate
+from recipe_api.features.search.cache import bump_search_corpus_version_async
+from recipe_api.features.users.counters import counter_buffer
+from recipe_api.features.users.viewer_state import NO_VIEWER_STATE, load_viewer_state
+from recipe_api.shared.models.embedding_version import RecipeEmbedding
 from recipe_api.shared.models.recipe import (
     FoodType,
     GenerationStatus,
@@ -13,40 +21,62 @@ from recipe_api.shared.models.recipe import (
     Recipe,
     RecipeStatus,
 )
-from recipe_api.shared.services.embeddings import EmbeddingService
+from recipe_api.shared.services.embedding_cache import EmbeddingCache
+from recipe_api.shared.services.embedding_executor import EmbeddingExecutor
+from recipe_api.shared.services.embedding_versions import active_embedding_model
+
+
+def ingredient_text(ingredients: list[dict[str, Any]]) -> str:
+    return " ".join([ing.get("name", "") for ing in ingredients])
 
 
 class RecipeService:
-    def __init__(self, session: Session, embedding_service: EmbeddingService):
+    def __init__(self, session: AsyncSession, embedding_executor: EmbeddingExecutor):
         self.session = session
-        self.embedding_service = embedding_service
+        self.embedding_executor = embedding_executor
+        self.embedding_cache = EmbeddingCache(
+            embedding_executor.embedding_service, embedding_executor
+        )
 
-    def create_recipe(self, recipe_create: RecipeCreate, user_id: str) -> Recipe:
-        description_embedding = self.embedding_service.encode(recipe_create.description)
-        ingredient_text = " ".join([ing.name for ing in recipe_create.ingredients])
-        ingredient_embedding = self.embedding_service.encode(ingredient_text)
+    async def create_recipe(self, recipe_create: RecipeCreate, user_id: str) -> Recipe:
+        ingredients = [ing.model_dump() for ing in recipe_create.ingredients]
+        # Locked first, so the texts are encoded with the version's model.
+        version = await active_embedding_model.for_write(self.session)
+        embeddings = await self.embedding_cache.encode_batch_async(
+            self.session, [recipe_create.description, ingredient_text(ingredients)]
+        )
+        description_embedding, ingredient_embedding = embeddings
 
         db_recipe = Recipe(
             name=recipe_create.name,
             description=recipe_create.description,
-            ingredients=[ing.model_dump() for ing in recipe_create.ingredients],
+            ingredients=ingredients,
             instructions=recipe_create.instructions,
             food_type=recipe_create.food_type,
             status=recipe_create.status,
             is_generated=False,
             created_by=user_id,
-            description_embedding=description_embedding,
-            ingredient_embedding=ingredient_embedding,
         )
 
         self.session.add(db_recipe)
-        self.session.commit()
-        self.session.refresh(db_recipe)
+        self.session.add(
+            RecipeEmbedding(
+                recipe_id=db_recipe.id,
+                version_id=version.id,
+                description_embedding=description_embedding,
+                ingredient_embedding=ingredient_embedding,
+            )
+        )
+        await self.session.commit()
+        await self.session.refresh(db_recipe)
+
+        if db_recipe.status == RecipeStatus.PUBLISHED:
+            await bump_search_corpus_version_async()
 
         return db_recipe
 
-    def get_recipe(self, recipe_id: uuid.UUID, user_id: str | None = None) -> Recipe:
-        recipe = self.session.get(Recipe, recipe_id)
+    async def get_recipe(self, recipe_id: uuid.UUID, user_id: str | None = None) -> Recipe:
+        recipe = await self.session.get(Recipe, recipe_id)
         if not recipe:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -63,9 +93,16 @@ class RecipeService:
 
         return recipe
 
-    def list_recipes(
+    async def read_recipe(self, recipe_id: uuid.UUID, user_id: str | None = None) -> RecipeRead:
+        """`get_recipe` as served to clients, with pending counter deltas."""
+        recipe = await self.get_recipe(recipe_id, user_id)
+        (recipe_read,) = await counter_buffer.merge([RecipeRead.model_validate(recipe)])
+        return recipe_read
+
+    async def list_recipes(
         self, skip: int = 0, limit: int = 20, user_id: str | None = None
-    ) -> list[Recipe]:
+    ) -> list[RecipeRead]:
+        """Offset pagination, kept for older clients; see `list_recipes_page`."""
         visibility_filter = Recipe.status == RecipeStatus.PUBLISHED
         if user_id is not None:
             visibility_filter = or_(
@@ -73,19 +110,93 @@ class RecipeService:
                 Recipe.created_by == user_id,  # type: ignore[arg-type]
             )
 
-        recipes = self.session.exec(
+        result = await self.session.exec(
             select(Recipe)
             .where(visibility_filter)
             .order_by(Recipe.created_at.desc())  # type: ignore[union-attr]
             .offset(skip)
             .limit(limit)
-        ).all()
-        return list(recipes)
+        )
+        return await self._with_viewer_state(list(result.all()), user_id)
+
+    async def list_recipes_page(
+        self, cursor: str | None = None, limit: int = 20, user_id: str | None = None
+    ) -> tuple[list[RecipeRead], str | None]:
+        """Newest-first keyset pagination over (created_at, id).
+
+        Published recipes and the viewer's own unpublished ones are separate
+        index-backed branches, each reading at most `limit + 1` rows past the
+        cursor, so every page costs the same however deep it is. Returns the
+        page and the cursor of the next one, or None on the last page.
+        """
+        after = decode_cursor(cursor) if cursor else None
+        branches = [
+            self._recency_statement(Recipe.status == RecipeStatus.PUBLISHED, after, limit + 1)
+        ]
+        if user_id is not None:
+            branches.append(
+                self._recency_statement(
+                    and_(
+                        Recipe.created_by == user_id,  # type: ignore[arg-type]
+                        Recipe.status != RecipeStatus.PUBLISHED,  # type: ignore[arg-type]
+                    ),
+                    after,
+                    limit + 1,
+                )
+            )
+        page = union_all(*branches).subquery("page")
 
-    def update_recipe(
+        result = await self.session.exec(
+            select(Recipe)
+            .join(page, page.c.id == Recipe.id)
+            .order_by(page.c.created_at.desc(), page.c.id.desc())
+            .limit(limit + 1)
+        )
+        recipes = list(result.all())
+
+        next_cursor = None
+        if len(recipes) > limit:
+            recipes = recipes[:limit]
+            next_cursor = encode_cursor(recipes[-1].created_at, recipes[-1].id)
+
+        return await self._with_viewer_state(recipes, user_id), next_cursor
+
+    def _recency_statement(
+        self, visibility: Any, after: RecipeCursor | None, limit: int
+    ) -> SelectOfScalar[Any]:
+        statement = select(Recipe.id, Recipe.created_at).where(visibility)
+        if after is not None:
+            statement = statement.where(tuple_(col(Recipe.created_at), col(Recipe.id)) < after)
+        return statement.order_by(
+            col(Recipe.created_at).desc(), col(Recipe.id).desc()
+        ).limit(limit)
+
+    async def _with_viewer_state(
+        self, recipes: list[Recipe], user_id: str | None
+    ) -> list[RecipeRead]:
+        viewer_state = await load_viewer_state(self.session, user_id, (r.id for r in recipes))
+
+        return await counter_buffer.merge([
+            RecipeRead.model_validate(recipe).model_copy(
+                update=viewer_state.get(recipe.id, NO_VIEWER_STATE)._asdict()
+            )
+            for recipe in recipes
+        ])
+
+    async def _stored_embeddings(self, recipe_id: uuid.UUID) -> RecipeEmbedding:
+        """The recipe's row for the active embedding version, new if it has none.
+
+        Call before encoding: it locks the version for this transaction and
+        settles which model the new vectors must come from.
+        """
+        version = await active_embedding_model.for_write(self.session)
+        stored = await self.session.get(RecipeEmbedding, (recipe_id, version.id))
+        return stored or RecipeEmbedding(recipe_id=recipe_id, version_id=version.id)
+
+    async def update_recipe(
         self, recipe_id: uuid.UUID, recipe_update: RecipeUpdate, user_id: str
     ) -> Recipe:
-        recipe = self.get_recipe(recipe_id, user_id)
+        recipe = await self.get_recipe(recipe_id, user_id)
 
         if recipe.created_by != user_id:
             raise HTTPException(
@@ -93,38 +204,50 @@ class RecipeService:
                 detail="You can only update your own recipes",
             )
 
+        was_published = recipe.status == RecipeStatus.PUBLISHED
+        old_description = recipe.description
+        old_ingredient_text = ingredient_text(recipe.ingredients)
         update_data = recipe_update.model_dump(exclude_unset=True)
 
         for field, value in update_data.items():
             setattr(recipe, field, value)
 
-        if "description" in update_data:
-            recipe.description_embedding = self.embedding_service.encode(recipe.description)
-
-        if "ingredients" in update_data:
-            ingredient_text = " ".join([ing.get("name", "") for ing in recipe.ingredients])
-            recipe.ingredient_embedding = self.embedding_service.encode(ingredient_text)
-
-        if (
-            recipe.status == RecipeStatus.PUBLISHED
-            and (recipe.description_embedding is None or recipe.ingredient_embedding is None)
+        # Only re-embed text that actually changed, or that a published recipe
+        # is still missing an embedding for.
+        is_published = recipe.status == RecipeStatus.PUBLISHED
+        stored = await self._stored_embeddings(recipe.id)
+        texts: dict[str, str] = {}
+        if (stored.description_embedding is None and is_published) or (
+            "description" in update_data and recipe.description != old_description
+        ):
+            texts["description_embedding"] = recipe.description
+        new_ingredient_text = ingredient_text(recipe.ingredients)
+        if (stored.ingredient_embedding is None and is_published) or (
+            "ingredients" in update_data and new_ingredient_text != old_ingredient_text
         ):
-            if recipe.description_embedding is None:
-                recipe.description_embedding = self.embedding_service.encode(recipe.description)
+            texts["ingredient_embedding"] = new_ingredient_text
 
-            if recipe.ingredient_embedding is None:
-                ingredient_text = " ".join([ing.get("name", "") for ing in recipe.ingredients])
-                recipe.ingredient_embedding = self.embedding_service.encode(ingredient_text)
+        embeddings = await self.embedding_cache.encode_batch_async(
+            self.session, list(texts.values())
+        )
+        for field, embedding in zip(texts, embeddings, strict=True):
+            setattr(stored, field, embedding)
 
         recipe.updated_at = datetime.utcnow()
 
         self.session.add(recipe)
-        self.session.commit()
-        self.session.refresh(recipe)
+        if texts:
+            stored.updated_at = recipe.updated_at
+            self.session.add(stored)
+        await self.session.commit()
+        await self.session.refresh(recipe)
+
+        if was_published or recipe.status == RecipeStatus.PUBLISHED:
+            await bump_search_corpus_version_async()
 
         return recipe
 
-    def create_placeholder(
+    async def create_placeholder(
         self,
         user_id: str,
         workflow_id: str,
@@ -140,18 +263,18 @@ class RecipeService:
             generation_prompt=prompt,
         )
         self.session.add(recipe)
-        self.session.commit()
-        self.session.refresh(recipe)
+        await self.session.commit()
+        await self.session.refresh(recipe)
         return recipe
 
-    def update_generation_status(
+    async def update_generation_status(
         self,
         recipe_id: uuid.UUID,
         step: GenerationStep | None = None,
         status: GenerationStatus | None = None,
         error: str | None = None,
     ) -> None:
-        recipe = self.get_recipe(recipe_id)
+        recipe = await self.get_recipe(recipe_id)
         if step:
             recipe.generation_step = step
         if status:
@@ -160,9 +283,9 @@ class RecipeService:
             recipe.generation_error = error
         recipe.updated_at = datetime.utcnow()
         self.session.add(recipe)
-        self.session.commit()
+        await self.session.commit()
 
-    def finalize_generated_recipe(
+    async def finalize_generated_recipe(
         self,
         recipe_id: uuid.UUID,
         name: str,
@@ -171,7 +294,7 @@ class RecipeService:
         instructions: str | list[str],
         food_type_str: str | None,
     ) -> Recipe:
-        recipe = self.get_recipe(recipe_id)
+        recipe = await self.get_recipe(recipe_id)
 
         food_type = None
         if food_type_str:
@@ -183,23 +306,32 @@ class RecipeService:
         if isinstance(instructions, list):
             instructions = "\n".join(instructions)
 
-        description_embedding = self.embedding_service.encode(description)
-        ingredient_text = " ".join([ing.get("name", "") for ing in ingredients])
-        ingredient_embedding = self.embedding_service.encode(ingredient_text)
+        stored = await self._stored_embeddings(recipe.id)
+        embeddings = await self.embedding_cache.encode_batch_async(
+            self.session, [description, ingredient_text(ingredients)]
+        )
+        description_embedding, ingredient_embedding = embeddings
 
         recipe.name = name
         recipe.description = description
         recipe.ingredients = ingredients
         recipe.instructions = instructions
         recipe.food_type = food_type
-        recipe.description_embedding = description_embedding
-        recipe.ingredient_embedding = ingredient_embedding
 
         recipe.generation_step = GenerationStep.COMPLETED
         recipe.generation_status = GenerationStatus.COMPLETED
         recipe.updated_at = datetime.utcnow()
 
+        stored.description_embedding = description_embedding
+        stored.ingredient_embedding = ingredient_embedding
+        stored.updated_at = recipe.updated_at
+
         self.session.add(recipe)
-        self.session.commit()
-        self.session.refresh(recipe)
+        self.session.add(stored)
+        await self.session.commit()
+        await self.session.refresh(recipe)
+
+        if recipe.status == RecipeStatus.PUBLISHED:
+            await bump_search_corpus_version_async()
+
         return recipe
@@ -0,0 +1,26 @@
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from recipe_api.features.recipes.pagination import decode_cursor, encode_cursor
+
+
+@pytest.mark.unit
+def test_cursor_round_trips() -> None:
+    created_at = datetime(2026, 10, 18, 14, 2, 47, 218593)
+    recipe_id = uuid.uuid4()
+
+    cursor = encode_cursor(created_at, recipe_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, recipe_id)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "!!!", encode_cursor(datetime(2026, 1, 1), uuid.uuid4())[:-4]])
+def test_invalid_cursor_is_a_bad_request(cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+    assert exc_info.value.status_code == 400
@@ -10,6 +10,7 @@ from recipe_api_client.api.recipes import (
     list_recipes_recipes_get,
     update_recipe_recipes_recipe_id_patch,
 )
+from recipe_api_client.api.users import toggle_favorite_users_recipes_recipe_id_favorite_post
 from recipe_api_client.models.food_type import FoodType
 from recipe_api_client.models.ingredient_item import IngredientItem
 from recipe_api_client.models.recipe_create import RecipeCreate
@@ -179,6 +180,43 @@ def test_list_recipes_pagination(user1_client: AuthenticatedClient) -> None:
     assert isinstance(recipes, list)
 
 
+@pytest.mark.e2e
+def test_list_recipes_cursor_pagination(user1_client: AuthenticatedClient) -> None:
+    created = []
+    for i in range(3):
+        recipe = create_test_recipe(user1_client, title=f"Cursor Test {i}", description=f"Recipe {i}")
+        if i != 1:
+            update_recipe_recipes_recipe_id_patch.sync_detailed(
+                client=user1_client, recipe_id=recipe.id, body=RecipeUpdate(status=RecipeStatus.PUBLISHED)
+            )
+        created.append(recipe.id)
+
+    seen: list[uuid.UUID] = []
+    cursor: str | None = None
+    while True:
+        response = list_recipes_recipes_get.sync_detailed(
+            client=user1_client, limit=2, **({"cursor": cursor} if cursor else {})
+        )
+        assert response.status_code == 200
+        assert isinstance(response.parsed, list)
+        assert len(response.parsed) <= 2
+        seen.extend(recipe.id for recipe in response.parsed)
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+
+    assert len(seen) == len(set(seen))
+    # The owner's draft is merged in, newest first.
+    positions = [seen.index(recipe_id) for recipe_id in reversed(created)]
+    assert positions == sorted(positions)
+
+
+@pytest.mark.e2e
+def test_list_recipes_rejects_invalid_cursor(user1_client: AuthenticatedClient) -> None:
+    response = list_recipes_recipes_get.sync_detailed(client=user1_client, cursor="not-a-cursor")
+    assert response.status_code == 400
+
+
 # =============================================================================
 # Data Integrity Tests
 # =============================================================================
@@ -323,3 +361,30 @@ def test_owner_can_publish_recipe(user1_client: AuthenticatedClient) -> None:
     assert response.status_code == 200
     assert isinstance(response.parsed, RecipeRead)
     assert response.parsed.status == RecipeStatus.PUBLISHED
+
+
+@pytest.mark.e2e
+def test_list_recipes_includes_viewer_state(
+    user1_client: AuthenticatedClient,
+    user2_client: AuthenticatedClient,
+) -> None:
+    recipe = create_test_recipe(user1_client, title="Viewer State", description="Flags per viewer")
+    update_recipe_recipes_recipe_id_patch.sync_detailed(
+        client=user1_client, recipe_id=recipe.id, body=RecipeUpdate(status=RecipeStatus.PUBLISHED)
+    )
+    toggle_favorite_users_recipes_recipe_id_favorite_post.sync_detailed(
+        client=user1_client, recipe_id=recipe.id
+    )
+
+    response = list_recipes_recipes_get.sync_detailed(client=user1_client)
+    assert response.status_code == 200
+    assert isinstance(response.parsed, list)
+    listed = next(r for r in response.parsed if r.id == recipe.id)
+    assert listed.is_favorited is True
+    assert listed.is_liked is False
+
+    response = list_recipes_recipes_get.sync_detailed(client=user2_client)
+    assert response.status_code == 200
+    assert isinstance(response.parsed, list)
+    listed = next(r for r in response.parsed if r.id == recipe.id)
+    assert listed.is_favorited is False
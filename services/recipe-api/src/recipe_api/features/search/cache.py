@@ -0,0 +1,239 @@
+import base64
+import contextlib
+import hashlib
+import json
+import threading
+import time
+import uuid
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+
+from recipe_api.features.search.schemas import RecipeSearchResult, SearchRequest
+from recipe_api.shared.config import settings
+from recipe_api.shared.redis import get_redis, get_sync_redis
+from recipe_api.shared.services.embedding_executor import (
+    EmbeddingExecutor,
+    get_embedding_executor,
+)
+from recipe_api.shared.services.embeddings import EmbeddingService, get_embedding_service
+
+CORPUS_VERSION_KEY = "search:corpus-version"
+QUERY_EMBEDDING_INDEX_KEY = "search:query-embedding-index"
+
+# Indexes one stored query vector and trims the index past the cap.
+#
+# KEYS: the index (a sorted set of entry keys scored by insertion time in
+# ms). ARGV: entry key, ttl_seconds, now_ms, max_entries. Members whose
+# entry already expired are dropped first. The entry keys popped past the
+# cap are returned for the caller to unlink: a script may only touch the
+# keys it declares, and entries hash to other Redis Cluster slots.
+INDEX_QUERY_EMBEDDING_LUA = """
+local ttl_ms = tonumber(ARGV[2]) * 1000
+local now = tonumber(ARGV[3])
+redis.call('ZADD', KEYS[1], now, ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - ttl_ms)
+local evicted = {}
+local over = redis.call('ZCARD', KEYS[1]) - tonumber(ARGV[4])
+if over > 0 then
+    local popped = redis.call('ZPOPMIN', KEYS[1], over)
+    for i = 1, #popped, 2 do
+        evicted[#evicted + 1] = popped[i]
+    end
+end
+redis.call('PEXPIRE', KEYS[1], ttl_ms)
+return evicted
+"""
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def _pack_vector(vector: list[float]) -> str:
+    return base64.b64encode(array("f", vector).tobytes()).decode("ascii")
+
+
+def _unpack_vector(raw: str) -> list[float]:
+    return array("f", base64.b64decode(raw)).tolist()
+
+
+class QueryEmbeddingCache:
+    """Two-level cache of search query vectors.
+
+    Lookups go to an in-process LRU first, then to Redis (shared across API
+    replicas), and only run the model when both miss. Redis entries expire
+    after `query_embedding_cache_ttl_seconds`, and past
+    `query_embedding_cache_redis_max_entries` the oldest are evicted. Only
+    normalized queries up to `query_embedding_cache_max_query_length` are
+    cached. Redis errors degrade to a miss.
+    """
+
+    def __init__(self, executor: EmbeddingExecutor) -> None:
+        self.executor = executor
+        self.maxsize = settings.query_embedding_cache_size
+        self.ttl_seconds = settings.query_embedding_cache_ttl_seconds
+        self.redis_max_entries = settings.query_embedding_cache_redis_max_entries
+        self._index_script: AsyncScript | None = None
+        self._local: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"local_hits": 0, "redis_hits": 0, "misses": 0, "uncacheable": 0}
+
+    def _key(self, model_id: str, normalized: str) -> str:
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return f"search:query-embedding:{model_id}:{digest}"
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    def _get_local(self, key: str) -> list[float] | None:
+        with self._lock:
+            vector = self._local.get(key)
+            if vector is not None:
+                self._local.move_to_end(key)
+                self._stats["local_hits"] += 1
+            return vector
+
+    def _set_local(self, key: str, vector: list[float]) -> None:
+        with self._lock:
+            self._local[key] = vector
+            self._local.move_to_end(key)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+    async def encode(self, query: str) -> list[float]:
+        normalized = normalize_query(query)
+        model_id = await self.executor.embedding_service.current_model_id()
+        if len(normalized) > settings.query_embedding_cache_max_query_length:
+            self._count("uncacheable")
+            return await self.executor.encode(normalized)
+
+        # Keyed by model too, so a re-embed swap never serves stale vectors.
+        key = self._key(model_id, normalized)
+        vector = self._get_local(key)
+        if vector is not None:
+            return vector
+
+        try:
+            raw = await get_redis().get(key)
+        except RedisError:
+            raw = None
+
+        if raw is not None:
+            self._count("redis_hits")
+            vector = _unpack_vector(raw)
+        else:
+            self._count("misses")
+            vector = await self.executor.encode(normalized)
+            with contextlib.suppress(RedisError):
+                await self._store(key, vector)
+
+        self._set_local(key, vector)
+        return vector
+
+    async def _store(self, key: str, vector: list[float]) -> None:
+        redis = get_redis()
+        if self._index_script is None:
+            self._index_script = redis.register_script(INDEX_QUERY_EMBEDDING_LUA)
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.set(key, _pack_vector(vector), ex=self.ttl_seconds)
+            await self._index_script(
+                keys=[QUERY_EMBEDDING_INDEX_KEY],
+                args=[key, self.ttl_seconds, int(time.time() * 1000), self.redis_max_entries],
+                client=pipe,
+            )
+            _, evicted = await pipe.execute()
+        if evicted:
+            # One UNLINK per key: evicted entries may live on different slots.
+            async with redis.pipeline(transaction=False) as pipe:
+                for member in evicted:
+                    pipe.unlink(member)
+                await pipe.execute()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._stats, "local_size": len(self._local), "local_maxsize": self.maxsize}
+
+
+@lru_cache
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    return QueryEmbeddingCache(get_embedding_executor())
+
+
+def bump_search_corpus_version() -> None:
+    """Invalidate every cached search result after a published recipe changed."""
+    with contextlib.suppress(RedisError):
+        get_sync_redis().incr(CORPUS_VERSION_KEY)
+
+
+async def bump_search_corpus_version_async() -> None:
+    with contextlib.suppress(RedisError):
+        await get_redis().incr(CORPUS_VERSION_KEY)
+
+
+@dataclass
+class SearchCacheLookup:
+    key: str
+    corpus_version: str
+    hits: list[tuple[uuid.UUID, float]] | None
+
+
+class SearchResultCache:
+    """Ordered recipe ids and scores per (query, limit, ranking params).
+
+    Entries are stamped with the corpus version they were computed against and
+    are ignored once `bump_search_corpus_version` moved it on, so a lookup is a
+    single MGET. Viewer flags are not cached; callers layer them on per request.
+    The TTL bounds how stale the popularity part of the score can get.
+    """
+
+    def __init__(self, embedding_service: EmbeddingService) -> None:
+        self.embedding_service = embedding_service
+        self.ttl_seconds = settings.search_result_cache_ttl_seconds
+
+    def _key(self, model_id: str, request: SearchRequest, boost_popular: bool) -> str:
+        params = [
+            model_id,
+            normalize_query(request.query),
+            request.limit,
+            request.quality,
+            boost_popular,
+            settings.search_similarity_weight,
+            settings.search_popularity_weight,
+            settings.search_popularity_scale,
+            settings.search_candidate_window,
+        ]
+        digest = hashlib.sha256(json.dumps(params, default=str).encode("utf-8")).hexdigest()
+        return f"search:results:{digest}"
+
+    async def get(self, request: SearchRequest, boost_popular: bool) -> SearchCacheLookup:
+        key = self._key(await self.embedding_service.current_model_id(), request, boost_popular)
+        try:
+            version, raw = await get_redis().mget(CORPUS_VERSION_KEY, key)
+        except RedisError:
+            version, raw = None, None
+
+        lookup = SearchCacheLookup(key=key, corpus_version=version or "0", hits=None)
+        if raw is not None:
+            entry = json.loads(raw)
+            if entry["corpus_version"] == lookup.corpus_version:
+                lookup.hits = [(uuid.UUID(recipe_id), score) for recipe_id, score in entry["hits"]]
+        return lookup
+
+    async def set(self, lookup: SearchCacheLookup, results: list[RecipeSearchResult]) -> None:
+        entry = {
+            "corpus_version": lookup.corpus_version,
+            "hits": [[str(result.id), result.similarity_score] for result in results],
+        }
+        with contextlib.suppress(RedisError):
+            await get_redis().set(lookup.key, json.dumps(entry), ex=self.ttl_seconds)
+
+
+@lru_cache
+def get_search_result_cache() -> SearchResultCache:
+    return SearchResultCache(get_embedding_service())
@@ -0,0 +1,259 @@
+import time
+import uuid
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Engine, and_, delete, or_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, col, select
+
+from recipe_api.features.recipes.service import ingredient_text
+from recipe_api.features.search.cache import bump_search_corpus_version
+from recipe_api.shared.config import settings
+from recipe_api.shared.models.embedding_version import (
+    EmbeddingVersion,
+    EmbeddingVersionStatus,
+    RecipeEmbedding,
+)
+from recipe_api.shared.models.job_checkpoint import JobCheckpoint
+from recipe_api.shared.models.recipe import Recipe
+from recipe_api.shared.services.embedding_cache import EmbeddingCache
+from recipe_api.shared.services.embedding_versions import (
+    activate_default_version,
+    active_embedding_model,
+    select_active_version,
+)
+from recipe_api.shared.services.embeddings import EmbeddingService
+
+RecipeRow = tuple[uuid.UUID, str, list[dict[str, Any]], datetime]
+
+
+def retired_grace() -> timedelta:
+    """How long a retired version's vectors outlive the swap: well past the
+    point where every process has reloaded the active version."""
+    return max(timedelta(minutes=10), timedelta(seconds=settings.embedding_version_refresh_seconds * 2))
+
+
+def prune_retired_embeddings(session: Session, grace: timedelta | None = None) -> int:
+    """Delete the vectors of versions retired more than `grace` ago (by
+    default `retired_grace()`); returns how many rows.
+
+    Keeps the ANN indexes down to one vector space. Rolling back to an
+    earlier model is a re-embed, mostly served by the cache.
+    """
+    retired_before = datetime.utcnow() - (grace if grace is not None else retired_grace())
+    result = session.exec(
+        delete(RecipeEmbedding).where(
+            col(RecipeEmbedding.version_id).in_(
+                select(EmbeddingVersion.id).where(
+                    EmbeddingVersion.status == EmbeddingVersionStatus.RETIRED,
+                    col(EmbeddingVersion.retired_at) < retired_before,
+                )
+            )
+        )
+    )
+    return result.rowcount
+
+
+@dataclass
+class ReembedProgress:
+    version_id: int
+    processed: int
+    elapsed_seconds: float
+
+    @property
+    def recipes_per_second(self) -> float:
+        return self.processed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class ReembedPipeline:
+    """Backfills every recipe's embeddings for a new model, then swaps search over.
+
+    Recipes are streamed in id order over a server-side cursor, encoded in
+    large batches (through the content-hash cache, so a rollback to an earlier
+    model is mostly lookups) and upserted into `recipe_embeddings` under a
+    BACKFILLING version. Each batch commits together with a checkpoint, so an
+    interrupted run resumes after the last committed id.
+
+    `swap` then, in one transaction, re-encodes recipes edited during the
+    backfill and makes the version ACTIVE. The retired version's rows stay
+    until `prune_retired_embeddings`: other processes keep searching them with the old
+    model until their cached version refreshes, so search never mixes
+    vector spaces.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        embedding_service: EmbeddingService,
+        batch_size: int = 512,
+        on_progress: Callable[[ReembedProgress], None] | None = None,
+    ) -> None:
+        self.engine = engine
+        self.embedding_service = embedding_service
+        self.embedding_cache = EmbeddingCache(embedding_service)
+        self.batch_size = batch_size
+        self.on_progress = on_progress
+
+    def get_or_create_version(self) -> EmbeddingVersion:
+        """Resume the model's unfinished backfill, if there is one."""
+        with Session(self.engine, expire_on_commit=False) as session:
+            version = session.exec(
+                select(EmbeddingVersion).where(
+                    EmbeddingVersion.model == self.embedding_service.model_name,
+                    EmbeddingVersion.status == EmbeddingVersionStatus.BACKFILLING,
+                )
+            ).first()
+            if version is None:
+                version = EmbeddingVersion(model=self.embedding_service.model_name)
+                session.add(version)
+                session.commit()
+            return version
+
+    def checkpoint_name(self, version: EmbeddingVersion) -> str:
+        return f"reembed:{version.id}"
+
+    def backfill(self, version: EmbeddingVersion) -> ReembedProgress:
+        assert version.id is not None
+        checkpoint_name = self.checkpoint_name(version)
+        with Session(self.engine) as session:
+            checkpoint = session.get(JobCheckpoint, checkpoint_name)
+            after = uuid.UUID(checkpoint.position) if checkpoint else None
+        source_version_id = self._active_version_id()
+
+        processed = 0
+        started = time.perf_counter()
+        for batch in self._stream(source_version_id, after):
+            with Session(self.engine) as session:
+                self._write(session, version.id, batch)
+                session.merge(JobCheckpoint(name=checkpoint_name, position=str(batch[-1][0])))
+                session.commit()
+
+            processed += len(batch)
+            progress = ReembedProgress(version.id, processed, time.perf_counter() - started)
+            if self.on_progress:
+                self.on_progress(progress)
+
+        return ReembedProgress(version.id, processed, time.perf_counter() - started)
+
+    def swap(self, version: EmbeddingVersion) -> int:
+        """Activate a finished backfill. Returns the number of caught-up recipes."""
+        assert version.id is not None
+        with Session(self.engine) as session:
+            session.exec(
+                select(EmbeddingVersion).where(EmbeddingVersion.id == version.id).with_for_update()
+            ).one()
+            source_version_id = session.exec(
+                select(EmbeddingVersion.id)
+                .where(EmbeddingVersion.status == EmbeddingVersionStatus.ACTIVE)
+                .with_for_update()
+            ).first()
+
+            stale: list[RecipeRow] = []
+            if source_version_id is not None:
+                stale = list(
+                    session.exec(
+                        self._embeddable(source_version_id)
+                        .outerjoin(
+                            RecipeEmbedding,
+                            (col(RecipeEmbedding.recipe_id) == Recipe.id)
+                            & (col(RecipeEmbedding.version_id) == version.id),
+                        )
+                        .where(
+                            or_(
+                                col(RecipeEmbedding.recipe_id).is_(None),
+                                col(Recipe.updated_at) > RecipeEmbedding.updated_at,
+                            )
+                        )
+                        .with_for_update(of=Recipe)
+                    ).all()
+                )
+            if stale:
+                self._write(session, version.id, stale)
+
+            now = datetime.utcnow()
+            session.exec(
+                update(EmbeddingVersion)
+                .where(col(EmbeddingVersion.status) == EmbeddingVersionStatus.ACTIVE)
+                .values(status=EmbeddingVersionStatus.RETIRED, retired_at=now)
+            )
+            session.exec(
+                update(EmbeddingVersion)
+                .where(col(EmbeddingVersion.id) == version.id)
+                .values(status=EmbeddingVersionStatus.ACTIVE, activated_at=now)
+            )
+            checkpoint = session.get(JobCheckpoint, self.checkpoint_name(version))
+            if checkpoint:
+                session.delete(checkpoint)
+            session.commit()
+
+        active_embedding_model.invalidate()
+        bump_search_corpus_version()
+        return len(stale)
+
+    def _active_version_id(self) -> int:
+        with Session(self.engine) as session:
+            row = session.exec(select_active_version()).first()
+            if row is None:
+                session.exec(activate_default_version())
+                session.commit()
+                row = session.exec(select_active_version()).one()
+            version_id: int = row[0]
+            return version_id
+
+    def _embeddable(self, source_version_id: int) -> Any:
+        """Recipes embedded under the currently active version."""
+        source = aliased(RecipeEmbedding)
+        return select(Recipe.id, Recipe.description, Recipe.ingredients, Recipe.updated_at).join(
+            source,
+            and_(
+                col(source.recipe_id) == Recipe.id,
+                col(source.version_id) == source_version_id,
+            ),
+        )
+
+    def _stream(
+        self, source_version_id: int, after: uuid.UUID | None
+    ) -> Iterator[list[RecipeRow]]:
+        statement = self._embeddable(source_version_id).order_by(Recipe.id)
+        if after is not None:
+            statement = statement.where(col(Recipe.id) > after)
+
+        # A dedicated connection, so the per-batch commits don't close the cursor.
+        with Session(self.engine) as session:
+            result = session.exec(statement.execution_options(yield_per=self.batch_size))
+            for partition in result.partitions():
+                yield list(partition)
+
+    def _write(self, session: Session, version_id: int, rows: Sequence[RecipeRow]) -> None:
+        texts = [description for _, description, _, _ in rows]
+        texts += [ingredient_text(ingredients) for _, _, ingredients, _ in rows]
+        embeddings = self.embedding_cache.encode_batch(session, texts)
+
+        # Stamped with the version of the text that was encoded, not the write
+        # time: an edit after the backfill read the row stays newer, so the
+        # swap's catch-up re-encodes it.
+        values = [
+            {
+                "recipe_id": recipe_id,
+                "version_id": version_id,
+                "description_embedding": embeddings[i],
+                "ingredient_embedding": embeddings[len(rows) + i],
+                "updated_at": text_updated_at,
+            }
+            for i, (recipe_id, _, _, text_updated_at) in enumerate(rows)
+        ]
+        statement = insert(RecipeEmbedding).values(values)
+        session.exec(
+            statement.on_conflict_do_update(
+                index_elements=["recipe_id", "version_id"],
+                set_={
+                    "description_embedding": statement.excluded.description_embedding,
+                    "ingredient_embedding": statement.excluded.ingredient_embedding,
+                    "updated_at": statement.excluded.updated_at,
+                },
+            )
+        )
@@ -1,46 +1,70 @@
+from math import ceil
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
-from fastapi_limiter.depends import RateLimiter
 
+from recipe_api.features.search.cache import (
+    QueryEmbeddingCache,
+    SearchResultCache,
+    get_query_embedding_cache,
+    get_search_result_cache,
+)
 from recipe_api.features.search.schemas import (
     SearchRequest,
     SearchResponse,
 )
 from recipe_api.features.search.service import SearchService
-from recipe_api.shared.deps import CurrentUserDep, SessionDep
-from recipe_api.shared.rate_limit import get_rate_limit_key
-from recipe_api.shared.services.embeddings import EmbeddingService, get_embedding_service
-from recipe_api.shared.services.llm import LLMService, get_llm_service
+from recipe_api.shared.deps import AsyncSessionDep, CurrentUserDep, OptionalUserDep
+from recipe_api.shared.rate_limit import RateLimit, body_cost, rate_limit
 
 router = APIRouter(prefix="/search", tags=["search"])
 
+# Search quota is charged per started block of results.
+RESULTS_PER_UNIT = 50
+
 
-def get_search_service(
-    embedding_service: Annotated[EmbeddingService, Depends(get_embedding_service)],
-    llm_service: Annotated[LLMService, Depends(get_llm_service)],
-) -> SearchService:
-    return SearchService(embedding_service, llm_service)
+async def get_search_service() -> SearchService:
+    return SearchService()
 
 
-@router.post("/", response_model=SearchResponse, dependencies=[Depends(RateLimiter(times=10, seconds=60, identifier=get_rate_limit_key))])
-def search_recipes(
+@router.post("/", response_model=SearchResponse)
+@rate_limit(
+    RateLimit(times=10, seconds=60),
+    cost=body_cost(SearchRequest, lambda request: ceil(request.limit / RESULTS_PER_UNIT)),
+)
+async def search_recipes(
     search_request: SearchRequest,
-    session: SessionDep,
+    session: AsyncSessionDep,
     service: Annotated[SearchService, Depends(get_search_service)],
-    current_user: CurrentUserDep | None = None,
+    query_cache: Annotated[QueryEmbeddingCache, Depends(get_query_embedding_cache)],
+    result_cache: Annotated[SearchResultCache, Depends(get_search_result_cache)],
+    current_user: OptionalUserDep,
 ) -> SearchResponse:
-
-    results = service.hybrid_search(
-        session=session,
-        query=search_request.query,
-        limit=search_request.limit,
-        user_id=current_user,
-        boost_popular=True,
-    )
+    cached = await result_cache.get(search_request, boost_popular=True)
+    if cached.hits is not None:
+        results = await service.load_results(session, cached.hits, current_user)
+    else:
+        query_embedding = await query_cache.encode(search_request.query)
+        results = await service.hybrid_search(
+            session=session,
+            query_embedding=query_embedding,
+            limit=search_request.limit,
+            user_id=current_user,
+            boost_popular=True,
+            quality=search_request.quality,
+        )
+        await result_cache.set(cached, results)
 
     return SearchResponse(
         results=results,
         total=len(results),
         query=search_request.query,
     )
+
+
+@router.get("/cache/stats")
+def query_cache_stats(
+    current_user: CurrentUserDep,
+    query_cache: Annotated[QueryEmbeddingCache, Depends(get_query_embedding_cache)],
+) -> dict[str, int]:
+    return query_cache.stats()
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from enum import Enum
+
+from pydantic import BaseModel, Field
 
 from recipe_api.features.recipes.schemas import RecipeRead
 from recipe_api.shared.models.recipe import FoodType
@@ -8,9 +10,18 @@ class RecipeSearchResult(RecipeRead):
     similarity_score: float
     food_type: FoodType | None = None
 
+class SearchQuality(str, Enum):
+    FAST = "fast"
+    BALANCED = "balanced"
+    ACCURATE = "accurate"
+
 class SearchRequest(BaseModel):
     query: str
-    limit: int = 10
+    limit: int = Field(default=10, ge=1, le=100)
+    quality: SearchQuality | None = Field(
+        default=None,
+        description="Recall/latency trade-off for the vector index scan, defaults to balanced",
+    )
 
 class SearchResponse(BaseModel):
     results: list[RecipeSearchResult]
@@ -1,98 +1,199 @@
-
-from sqlmodel import Session, select
-
-from recipe_api.features.search.schemas import RecipeSearchResult
+import uuid
+from typing import Any
+
+from sqlalchemy import Float, cast, func, union_all
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
+
+from recipe_api.features.search.schemas import RecipeSearchResult, SearchQuality
+from recipe_api.features.users.counters import counter_buffer
+from recipe_api.features.users.viewer_state import NO_VIEWER_STATE, load_viewer_state
+from recipe_api.shared.config import settings
+from recipe_api.shared.models.embedding_version import RecipeEmbedding
 from recipe_api.shared.models.recipe import Recipe, RecipeStatus
-from recipe_api.shared.models.user_interaction import UserRecipeInteraction
-from recipe_api.shared.services.embeddings import EmbeddingService
-from recipe_api.shared.services.llm import LLMService
+from recipe_api.shared.services.embedding_versions import (
+    ActiveEmbeddingModel,
+    active_embedding_model,
+)
+
+# (hnsw.ef_search, ivfflat.probes) per quality hint. pgvector caps ef_search at 1000.
+SEARCH_QUALITY_PARAMS: dict[SearchQuality, tuple[int, int]] = {
+    SearchQuality.FAST: (40, 1),
+    SearchQuality.BALANCED: (100, 10),
+    SearchQuality.ACCURATE: (400, 40),
+}
+MAX_EF_SEARCH = 1000
 
 
 class SearchService:
-    def __init__(self, embedding_service: EmbeddingService, llm_service: LLMService):
-        self.embedding_service = embedding_service
-        self.llm_service = llm_service
+    def __init__(self, active_model: ActiveEmbeddingModel = active_embedding_model) -> None:
+        self.active_model = active_model
 
-    def search_recipes(
+    async def apply_search_quality(
         self,
-        session: Session,
-        query: str,
-        limit: int = 10,
-        user_id: str | None = None,
-    ) -> list[RecipeSearchResult]:
-
-        from sqlalchemy import func
-
-        query_embedding = self.embedding_service.encode(query)
-
-        desc_similarity = 1 - Recipe.description_embedding.cosine_distance(query_embedding)
-        ing_similarity = 1 - Recipe.ingredient_embedding.cosine_distance(query_embedding)
-        max_similarity = func.greatest(desc_similarity, ing_similarity)
-
-        stmt = (
+        session: AsyncSession,
+        quality: SearchQuality | None,
+        k: int,
+    ) -> None:
+        """Set the ANN scan knobs for the current transaction only.
+
+        An HNSW scan returns at most `ef_search` rows, so it is never set below
+        the number of candidates the KNN subqueries ask for.
+        """
+        ef_search, probes = SEARCH_QUALITY_PARAMS[quality or SearchQuality.BALANCED]
+        ef_search = min(max(ef_search, k), MAX_EF_SEARCH)
+        await session.exec(
             select(
-                Recipe,
-                desc_similarity.label("desc_similarity"),
-                ing_similarity.label("ing_similarity"),
-                max_similarity.label("max_similarity"),
+                func.set_config("hnsw.ef_search", str(ef_search), True),
+                func.set_config("ivfflat.probes", str(probes), True),
             )
+        )
+
+    def candidate_window(self, limit: int, boost_popular: bool) -> int:
+        return max(limit, settings.search_candidate_window) if boost_popular else limit
+
+    def knn_statement(
+        self,
+        column: Any,
+        query_embedding: list[float],
+        k: int,
+        version_id: int,
+    ) -> SelectOfScalar[Any]:
+        """Nearest published recipes by a single `recipe_embeddings` column.
+
+        Ordering by the bare `<=>` distance with a LIMIT is what lets Postgres
+        serve this from the column's ANN index instead of a sequential scan.
+        The version filter only discards index candidates while a re-embed
+        backfill is running or a retired version awaits pruning.
+        """
+        distance = column.cosine_distance(query_embedding)
+        return (
+            select(col(RecipeEmbedding.recipe_id).label("id"), (1 - distance).label("similarity"))
+            .join(Recipe, col(Recipe.id) == RecipeEmbedding.recipe_id)
             .where(
-                Recipe.description_embedding.is_not(None),
-                Recipe.ingredient_embedding.is_not(None),
+                column.is_not(None),
+                RecipeEmbedding.version_id == version_id,
                 Recipe.status == RecipeStatus.PUBLISHED,
             )
-            .order_by(max_similarity.desc())
-            .limit(limit)
+            .order_by(distance)
+            .limit(k)
         )
 
-        result = session.exec(stmt)
-
-        recipes = []
-        for row in result:
-            recipe = row[0]
-            max_sim = row[3]
-
-            is_liked = False
-            is_favorited = False
-            if user_id:
-                interaction = session.exec(
-                    select(UserRecipeInteraction).where(
-                        UserRecipeInteraction.user_id == user_id,
-                        UserRecipeInteraction.recipe_id == recipe.id,
-                    )
-                ).first()
-                if interaction:
-                    is_liked = interaction.is_liked
-                    is_favorited = interaction.is_favorite
-
-            recipes.append(
-                RecipeSearchResult(
-                    **recipe.model_dump(),
-                    similarity_score=max_sim,
-                    is_liked=is_liked,
-                    is_favorited=is_favorited,
-                )
+    def ranking_statement(
+        self,
+        query_embedding: list[float],
+        limit: int = 10,
+        boost_popular: bool = True,
+        *,
+        version_id: int,
+    ) -> SelectOfScalar[Any]:
+        """Rank published recipes against `query_embedding` entirely in SQL.
+
+        Candidates come from one index-backed KNN query per embedding column;
+        a recipe found by both keeps its best similarity. With `boost_popular`
+        the `search_candidate_window` candidates are then re-ranked by the
+        blended similarity/popularity score, so popular recipes just outside
+        the top `limit` can still be boosted in.
+        """
+        window = self.candidate_window(limit, boost_popular)
+        nearest = union_all(
+            self.knn_statement(
+                RecipeEmbedding.description_embedding, query_embedding, window, version_id
+            ),
+            self.knn_statement(
+                RecipeEmbedding.ingredient_embedding, query_embedding, window, version_id
+            ),
+        ).subquery("nearest")
+        candidates = (
+            select(nearest.c.id, func.max(nearest.c.similarity).label("similarity"))
+            .group_by(nearest.c.id)
+            .subquery("candidates")
+        )
+
+        score = candidates.c.similarity
+        if boost_popular:
+            popularity = (
+                cast(Recipe.like_count + Recipe.favorite_count * 2, Float)
+                / settings.search_popularity_scale
+            )
+            score = (
+                score * settings.search_similarity_weight
+                + popularity * settings.search_popularity_weight
             )
 
-        return recipes
+        return (
+            select(Recipe, score.label("score"))
+            .join(candidates, candidates.c.id == Recipe.id)
+            .order_by(score.desc())
+            .limit(limit)
+        )
 
-    def hybrid_search(
+    async def search_recipes(
         self,
-        session: Session,
-        query: str,
+        session: AsyncSession,
+        query_embedding: list[float],
         limit: int = 10,
         user_id: str | None = None,
-        boost_popular: bool = True,
+        boost_popular: bool = False,
+        quality: SearchQuality | None = None,
     ) -> list[RecipeSearchResult]:
-        results = self.search_recipes(session, query, limit * 2, user_id)
+        version = await self.active_model.get()
+        await self.apply_search_quality(
+            session, quality, self.candidate_window(limit, boost_popular)
+        )
+        result = await session.exec(
+            self.ranking_statement(query_embedding, limit, boost_popular, version_id=version.id)
+        )
+        return await self._build_results(session, list(result.all()), user_id)
 
-        if boost_popular:
-            for result in results:
-                popularity_score = (result.like_count + result.favorite_count * 2) / 100
-                result.similarity_score = (
-                    result.similarity_score * 0.7 + popularity_score * 0.3
-                )
+    async def load_results(
+        self,
+        session: AsyncSession,
+        hits: list[tuple[uuid.UUID, float]],
+        user_id: str | None = None,
+    ) -> list[RecipeSearchResult]:
+        """Rebuild a cached ranking with one id-batch fetch.
+
+        Recipes that were unpublished since the ranking was cached are dropped.
+        """
+        result = await session.exec(
+            select(Recipe).where(
+                Recipe.id.in_([recipe_id for recipe_id, _ in hits]),  # type: ignore[attr-defined]
+                Recipe.status == RecipeStatus.PUBLISHED,
+            )
+        )
+        by_id = {recipe.id: recipe for recipe in result.all()}
 
-            results.sort(key=lambda x: x.similarity_score, reverse=True)
+        rows = [(by_id[recipe_id], score) for recipe_id, score in hits if recipe_id in by_id]
+        return await self._build_results(session, rows, user_id)
 
-        return results[:limit]
+    async def _build_results(
+        self,
+        session: AsyncSession,
+        rows: list[tuple[Recipe, float]],
+        user_id: str | None,
+    ) -> list[RecipeSearchResult]:
+        viewer_state = await load_viewer_state(session, user_id, (recipe.id for recipe, _ in rows))
+
+        return await counter_buffer.merge([
+            RecipeSearchResult(
+                **recipe.model_dump(),
+                **viewer_state.get(recipe.id, NO_VIEWER_STATE)._asdict(),
+                similarity_score=score,
+            )
+            for recipe, score in rows
+        ])
+
+    async def hybrid_search(
+        self,
+        session: AsyncSession,
+        query_embedding: list[float],
+        limit: int = 10,
+        user_id: str | None = None,
+        boost_popular: bool = True,
+        quality: SearchQuality | None = None,
+    ) -> list[RecipeSearchResult]:
+        return await self.search_recipes(
+            session, query_embedding, limit, user_id, boost_popular, quality
+        )
@@ -0,0 +1,160 @@
+import random
+from collections.abc import Generator
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import Engine, delete, func
+from sqlmodel import Session, col, select
+
+from recipe_api.features.search.reembed import (
+    ReembedPipeline,
+    ReembedProgress,
+    prune_retired_embeddings,
+)
+from recipe_api.shared.config import settings
+from recipe_api.shared.models.embedding_version import (
+    EmbeddingVersion,
+    EmbeddingVersionStatus,
+    RecipeEmbedding,
+)
+from recipe_api.shared.models.job_checkpoint import JobCheckpoint
+from recipe_api.shared.models.recipe import Recipe, RecipeStatus
+from recipe_api.shared.services.embedding_versions import active_embedding_model
+from recipe_api.shared.services.embeddings import EmbeddingService
+
+
+class BackfillInterruptedError(Exception):
+    pass
+
+
+@pytest.fixture(name="pipeline")
+def pipeline_fixture(engine: Engine, session: Session) -> Generator[ReembedPipeline, None, None]:
+    # Re-embedding with the model already in use keeps other tests' vectors valid.
+    yield ReembedPipeline(engine, EmbeddingService(settings.embedding_model), batch_size=2)
+
+    # Other tests' recipes keep their vectors under whichever version is active.
+    inactive = select(EmbeddingVersion.id).where(
+        col(EmbeddingVersion.status) != EmbeddingVersionStatus.ACTIVE
+    )
+    session.exec(delete(RecipeEmbedding).where(col(RecipeEmbedding.version_id).in_(inactive)))
+    session.exec(delete(JobCheckpoint))
+    session.exec(
+        delete(EmbeddingVersion).where(
+            col(EmbeddingVersion.status) != EmbeddingVersionStatus.ACTIVE
+        )
+    )
+    session.commit()
+    active_embedding_model.invalidate()
+
+
+def _stop_after_first_batch(progress: ReembedProgress) -> None:
+    raise BackfillInterruptedError
+
+
+@pytest.mark.e2e
+async def test_backfill_resumes_from_checkpoint_and_swap_activates(
+    pipeline: ReembedPipeline, session: Session
+) -> None:
+    rng = random.Random(7)
+    active_embedding_model.invalidate()
+    previous_version_id = (await active_embedding_model.get()).id
+    for i in range(5):
+        recipe = Recipe(
+            name=f"Reembed Recipe {i}",
+            description=f"Reembed description {i}",
+            created_by="reembed-test",
+            status=RecipeStatus.PUBLISHED,
+        )
+        session.add(recipe)
+        session.add(
+            RecipeEmbedding(
+                recipe_id=recipe.id,
+                version_id=previous_version_id,
+                description_embedding=[rng.uniform(-1, 1) for _ in range(384)],
+                ingredient_embedding=[rng.uniform(-1, 1) for _ in range(384)],
+            )
+        )
+    session.commit()
+    embeddable = session.exec(
+        select(func.count()).where(RecipeEmbedding.version_id == previous_version_id)
+    ).one()
+
+    version = pipeline.get_or_create_version()
+    pipeline.on_progress = _stop_after_first_batch
+    with pytest.raises(BackfillInterruptedError):
+        pipeline.backfill(version)
+
+    checkpoint = session.get(JobCheckpoint, pipeline.checkpoint_name(version))
+    assert checkpoint is not None
+    assert pipeline.get_or_create_version().id == version.id
+
+    pipeline.on_progress = None
+    progress = pipeline.backfill(version)
+    assert progress.processed == embeddable - 2
+
+    pipeline.swap(version)
+    session.expire_all()
+
+    activated = session.get(EmbeddingVersion, version.id)
+    assert activated is not None
+    assert activated.status == EmbeddingVersionStatus.ACTIVE
+    assert session.get(JobCheckpoint, pipeline.checkpoint_name(version)) is None
+    assert (await active_embedding_model.get()).id == version.id
+    assert active_embedding_model() == settings.embedding_model
+    assert session.get(EmbeddingVersion, previous_version_id).status == EmbeddingVersionStatus.RETIRED  # type: ignore[union-attr]
+
+    reembedded = session.exec(select(Recipe).where(Recipe.created_by == "reembed-test")).first()
+    assert reembedded is not None
+    assert session.get(RecipeEmbedding, (reembedded.id, version.id)) is not None
+    # Processes that haven't reloaded the version yet keep searching these.
+    assert session.get(RecipeEmbedding, (reembedded.id, previous_version_id)) is not None
+
+    assert prune_retired_embeddings(session) == 0
+    assert prune_retired_embeddings(session, grace=timedelta(0)) > 0
+    session.commit()
+    assert session.get(RecipeEmbedding, (reembedded.id, previous_version_id)) is None
+
+
+@pytest.mark.e2e
+async def test_swap_reencodes_recipes_edited_during_the_backfill(
+    pipeline: ReembedPipeline, session: Session
+) -> None:
+    rng = random.Random(11)
+    active_embedding_model.invalidate()
+    previous_version_id = (await active_embedding_model.get()).id
+    recipe = Recipe(
+        name="Edited Mid Backfill",
+        description="A plain tomato soup",
+        created_by="reembed-test",
+        status=RecipeStatus.PUBLISHED,
+    )
+    session.add(recipe)
+    session.add(
+        RecipeEmbedding(
+            recipe_id=recipe.id,
+            version_id=previous_version_id,
+            description_embedding=[rng.uniform(-1, 1) for _ in range(384)],
+            ingredient_embedding=[rng.uniform(-1, 1) for _ in range(384)],
+        )
+    )
+    session.commit()
+
+    version = pipeline.get_or_create_version()
+    pipeline.backfill(version)
+    backfilled = session.get(RecipeEmbedding, (recipe.id, version.id))
+    assert backfilled is not None
+    assert backfilled.updated_at == recipe.updated_at
+
+    recipe.description = "A smoky roasted red pepper soup"
+    recipe.updated_at = datetime.utcnow()
+    session.add(recipe)
+    session.commit()
+
+    assert pipeline.swap(version) >= 1
+    session.expire_all()
+
+    reencoded = session.get(RecipeEmbedding, (recipe.id, version.id))
+    assert reencoded is not None
+    assert reencoded.updated_at == recipe.updated_at
+    expected = pipeline.embedding_service.encode(recipe.description)
+    assert list(reencoded.description_embedding) == pytest.approx(expected, abs=1e-5)
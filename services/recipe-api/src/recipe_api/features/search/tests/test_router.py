@@ -0,0 +1,54 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from recipe_api.features.recipes.tests.utils import create_test_recipe
+from recipe_api_client import AuthenticatedClient
+from recipe_api_client.api.recipes import update_recipe_recipes_recipe_id_patch
+from recipe_api_client.api.search import search_recipes_search_post
+from recipe_api_client.models.recipe_status import RecipeStatus
+from recipe_api_client.models.recipe_update import RecipeUpdate
+from recipe_api_client.models.search_request import SearchRequest
+from recipe_api_client.models.search_response import SearchResponse
+
+
+@pytest.mark.e2e
+def test_repeated_query_is_served_from_embedding_cache(
+    user1_client: AuthenticatedClient,
+) -> None:
+    before = user1_client.get_httpx_client().get("/search/cache/stats").json()
+
+    # Different limits miss the result cache but share the query vector.
+    for query, limit in (("Vegan Dessert", 10), ("  vegan   dessert ", 5)):
+        response = search_recipes_search_post.sync_detailed(
+            client=user1_client, body=SearchRequest(query=query, limit=limit)
+        )
+        assert response.status_code == 200
+
+    after = user1_client.get_httpx_client().get("/search/cache/stats").json()
+    assert after["misses"] - before["misses"] <= 1
+    assert after["local_hits"] - before["local_hits"] >= 1
+
+
+@pytest.mark.e2e
+def test_cache_stats_require_a_user(client: TestClient) -> None:
+    assert client.get("/search/cache/stats").status_code == 401
+
+
+@pytest.mark.e2e
+def test_publishing_a_recipe_invalidates_cached_results(user1_client: AuthenticatedClient) -> None:
+    body = SearchRequest(query="smoky chipotle black bean chili", limit=50)
+
+    response = search_recipes_search_post.sync_detailed(client=user1_client, body=body)
+    assert response.status_code == 200
+
+    recipe = create_test_recipe(
+        user1_client, title="Chipotle Chili", description="Smoky chipotle black bean chili"
+    )
+    update_recipe_recipes_recipe_id_patch.sync_detailed(
+        client=user1_client, recipe_id=recipe.id, body=RecipeUpdate(status=RecipeStatus.PUBLISHED)
+    )
+
+    response = search_recipes_search_post.sync_detailed(client=user1_client, body=body)
+    assert response.status_code == 200
+    assert isinstance(response.parsed, SearchResponse)
+    assert any(r.id == recipe.id for r in response.parsed.results)
@@ -0,0 +1,71 @@
+import random
+
+import pytest
+from sqlalchemy import func, text
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from recipe_api.features.search.schemas import SearchQuality
+from recipe_api.features.search.service import SearchService
+from recipe_api.shared.models.embedding_version import RecipeEmbedding
+from recipe_api.shared.models.recipe import Recipe, RecipeStatus
+from recipe_api.shared.services.embedding_versions import active_embedding_model
+
+
+def _random_embedding(rng: random.Random) -> list[float]:
+    return [rng.uniform(-1, 1) for _ in range(384)]
+
+
+@pytest.mark.e2e
+async def test_ranking_query_uses_both_embedding_indexes(session: Session) -> None:
+    rng = random.Random(42)
+    version_id = (await active_embedding_model.get()).id
+    for i in range(50):
+        recipe = Recipe(
+            name=f"Explain Recipe {i}",
+            created_by="explain-test",
+            status=RecipeStatus.PUBLISHED,
+        )
+        session.add(recipe)
+        session.add(
+            RecipeEmbedding(
+                recipe_id=recipe.id,
+                version_id=version_id,
+                description_embedding=_random_embedding(rng),
+                ingredient_embedding=_random_embedding(rng),
+            )
+        )
+    session.commit()
+
+    service = SearchService()
+    statement = service.ranking_statement(_random_embedding(rng), limit=5, version_id=version_id)
+    compiled = statement.compile(
+        dialect=session.get_bind().dialect, compile_kwargs={"literal_binds": True}
+    )
+
+    connection = session.connection()
+    # The test table is tiny, so keep the planner from preferring a seq scan.
+    connection.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = "\n".join(row[0] for row in connection.execute(text(f"EXPLAIN {compiled}")))
+    session.rollback()
+
+    assert "idx_description_embedding" in plan
+    assert "idx_ingredient_embedding" in plan
+
+
+@pytest.mark.e2e
+async def test_search_quality_is_scoped_to_the_transaction(async_session: AsyncSession) -> None:
+    service = SearchService()
+
+    async def setting(name: str) -> str:
+        return (await async_session.exec(select(func.current_setting(name)))).one()
+
+    await service.apply_search_quality(async_session, SearchQuality.ACCURATE, k=10)
+    assert await setting("hnsw.ef_search") == "400"
+    assert await setting("ivfflat.probes") == "40"
+
+    await service.apply_search_quality(async_session, SearchQuality.FAST, k=100)
+    assert await setting("hnsw.ef_search") == "100"
+
+    await async_session.rollback()
+    assert await setting("hnsw.ef_search") != "100"
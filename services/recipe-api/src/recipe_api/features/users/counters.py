@@ -0,0 +1,182 @@
+import asyncio
+import contextlib
+import logging
+import uuid
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, TypeVar
+
+from redis.exceptions import RedisError
+from sqlalchemy import Integer, Uuid, column, func, update, values
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from recipe_api.features.recipes.schemas import RecipeRead
+from recipe_api.shared.config import settings
+from recipe_api.shared.db import get_async_db_session
+from recipe_api.shared.models.recipe import Recipe
+from recipe_api.shared.redis import get_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+PENDING_COUNTS_KEY = "recipe-counters:pending"
+COUNTERS = ("like_count", "favorite_count")
+# Transaction-level advisory lock shared by the flush and count reconciliation.
+COUNTERS_LOCK_KEY = 0x7265636970650001
+
+CounterDeltas = dict[uuid.UUID, dict[str, int]]
+RecipeReadT = TypeVar("RecipeReadT", bound=RecipeRead)
+
+
+def _field(recipe_id: uuid.UUID, counter: str) -> str:
+    return f"{recipe_id}:{counter}"
+
+
+def _fields(recipe_ids: Iterable[uuid.UUID]) -> list[str]:
+    return [_field(recipe_id, counter) for recipe_id in set(recipe_ids) for counter in COUNTERS]
+
+
+def lock_counters() -> Any:
+    """Serialize with other flushes and reconcile batches until commit.
+
+    A flush takes it before draining the hash and a reconcile batch before
+    reading what is pending, so reconciliation never subtracts deltas that a
+    concurrent flush has already applied (or misses ones it is applying).
+    """
+    return select(func.pg_advisory_xact_lock(COUNTERS_LOCK_KEY))
+
+
+def parse_deltas(raw: Mapping[str, str | bytes]) -> CounterDeltas:
+    """Group the pending hash by recipe, dropping fields that netted out to 0."""
+    deltas: CounterDeltas = {}
+    for field, value in raw.items():
+        recipe_id, counter = field.rsplit(":", 1)
+        if counter not in COUNTERS or not int(value):
+            continue
+        deltas.setdefault(uuid.UUID(recipe_id), dict.fromkeys(COUNTERS, 0))[counter] = int(value)
+    return deltas
+
+
+class CounterBuffer:
+    """Write-behind buffer for `recipes.like_count` / `favorite_count`.
+
+    With `counter_write_behind` on, toggles `HINCRBY` a per-recipe delta into
+    one Redis hash instead of row-locking the recipe, and `flush` applies the
+    aggregated deltas in a single batched UPDATE. Reads add whatever is still
+    pending, so counts stay current between flushes.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession] = get_async_db_session) -> None:
+        self.session_factory = session_factory
+
+    async def add(self, recipe_id: uuid.UUID, counter: str, delta: int) -> None:
+        await get_redis().hincrby(PENDING_COUNTS_KEY, _field(recipe_id, counter), delta)
+
+    async def pending(self, recipe_ids: Iterable[uuid.UUID]) -> CounterDeltas:
+        fields = _fields(recipe_ids)
+        if not fields:
+            return {}
+        try:
+            counts = await get_redis().hmget(PENDING_COUNTS_KEY, fields)
+        except RedisError:
+            logger.warning("Could not read pending counter deltas", exc_info=True)
+            return {}
+        return parse_deltas({f: v for f, v in zip(fields, counts, strict=True) if v is not None})
+
+    def pending_sync(self, recipe_ids: Iterable[uuid.UUID]) -> CounterDeltas:
+        """Blocking `pending` for batch jobs; Redis errors propagate."""
+        fields = _fields(recipe_ids)
+        if not fields:
+            return {}
+        counts = get_sync_redis().hmget(PENDING_COUNTS_KEY, fields)
+        return parse_deltas({f: v for f, v in zip(fields, counts, strict=True) if v is not None})
+
+    async def merge(self, recipes: list[RecipeReadT]) -> list[RecipeReadT]:
+        if not settings.counter_write_behind or not recipes:
+            return recipes
+
+        pending = await self.pending(recipe.id for recipe in recipes)
+        return [
+            recipe.model_copy(
+                update={
+                    counter: getattr(recipe, counter) + pending[recipe.id][counter]
+                    for counter in COUNTERS
+                }
+            )
+            if recipe.id in pending
+            else recipe
+            for recipe in recipes
+        ]
+
+    async def flush(self) -> int:
+        """Move every pending delta into `recipes`; returns the recipes updated.
+
+        The hash is read and cleared in one MULTI under `lock_counters`, so
+        toggles landing during the flush start a fresh hash for the next one.
+        If the UPDATE fails or is interrupted the deltas are added back.
+        """
+        async with self.session_factory() as session:
+            await session.exec(lock_counters())
+            async with get_redis().pipeline(transaction=True) as pipe:
+                pipe.hgetall(PENDING_COUNTS_KEY)
+                pipe.delete(PENDING_COUNTS_KEY)
+                raw, _ = await pipe.execute()
+
+            deltas = parse_deltas(raw)
+            if not deltas:
+                return 0
+
+            # Sorted ids lock rows in a deterministic order.
+            rows = [
+                (recipe_id, *(deltas[recipe_id][counter] for counter in COUNTERS))
+                for recipe_id in sorted(deltas)
+            ]
+            batch = values(
+                column("id", Uuid),
+                *(column(counter, Integer) for counter in COUNTERS),
+                name="deltas",
+            ).data(rows)
+            recipes = Recipe.__table__.c  # type: ignore[attr-defined]
+            statement = (
+                update(Recipe)
+                .where(recipes.id == batch.c.id)
+                .values({counter: recipes[counter] + batch.c[counter] for counter in COUNTERS})
+            )
+
+            try:
+                await session.exec(statement)
+                await session.commit()
+            # BaseException too: a cancel between the drain and the commit
+            # would otherwise lose the deltas.
+            except BaseException:
+                async with get_redis().pipeline(transaction=True) as pipe:
+                    for recipe_id, counters in deltas.items():
+                        for counter, delta in counters.items():
+                            if delta:
+                                pipe.hincrby(PENDING_COUNTS_KEY, _field(recipe_id, counter), delta)
+                    await pipe.execute()
+                raise
+
+        return len(rows)
+
+    async def run(self, interval_seconds: float, stop: asyncio.Event) -> None:
+        """Flush every `interval_seconds` until `stop` is set, then once more.
+
+        Stop it through the event rather than by cancelling the task, so the
+        last flush runs to completion.
+        """
+        while not stop.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), interval_seconds)
+            await self._flush_logged()
+
+    async def _flush_logged(self) -> None:
+        try:
+            await self.flush()
+        except (RedisError, SQLAlchemyError):
+            logger.warning("Counter flush failed; deltas stay pending", exc_info=True)
+        except Exception:
+            # Keep the loop alive: the next flush may well succeed.
+            logger.exception("Unexpected error flushing counters")
+
+counter_buffer = CounterBuffer()
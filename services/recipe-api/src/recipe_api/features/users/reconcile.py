@@ -0,0 +1,187 @@
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from sqlalchemy import Engine, Integer, Uuid, column, func, update, values
+from sqlmodel import Session, col, select
+
+from recipe_api.features.users.counters import COUNTERS, counter_buffer, lock_counters
+from recipe_api.shared.config import settings
+from recipe_api.shared.models.job_checkpoint import JobCheckpoint
+from recipe_api.shared.models.recipe import Recipe
+from recipe_api.shared.models.user_interaction import UserRecipeInteraction
+
+CHECKPOINT_NAME = "reconcile-counts"
+# Toggles committing after a run started but stamped just before it are
+# picked up by the next run.
+CHECKPOINT_OVERLAP = timedelta(minutes=1)
+# With write-behind, a toggle commits before it buffers its delta. Recipes
+# touched this recently are left to the next run (within CHECKPOINT_OVERLAP).
+SETTLING_MARGIN = timedelta(seconds=30)
+
+
+@dataclass
+class CountDrift:
+    recipe_id: uuid.UUID
+    counter: str
+    stored: int
+    actual: int
+
+
+@dataclass
+class ReconcileResult:
+    checked: int = 0
+    deferred: int = 0
+    drift: list[CountDrift] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def corrected(self) -> int:
+        return len({d.recipe_id for d in self.drift})
+
+
+class CountReconciler:
+    """Recomputes `like_count` / `favorite_count` from `user_recipe_interactions`.
+
+    Recipes are processed in id batches: each batch locks its recipe rows,
+    counts the interactions with one grouped aggregate and rewrites only the
+    rows whose counts differ. Holding the row locks means a toggle that is
+    still in flight moves the counter after the rewrite, not before it, and
+    deltas still pending in the write-behind buffer are left out of the
+    target so the next flush lands on the right value. Each batch holds
+    `lock_counters` too, so no flush applies deltas between the pending read
+    and the commit. A toggle only buffers its delta after committing, so
+    recipes with interactions newer than `SETTLING_MARGIN` are deferred to
+    the next run rather than compared without it.
+
+    Incremental runs only revisit recipes with interactions updated since
+    the previous run's checkpoint; the first run (or `full=True`) checks
+    every recipe.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        batch_size: int = 500,
+        on_batch: Callable[[ReconcileResult], None] | None = None,
+    ) -> None:
+        self.engine = engine
+        self.batch_size = batch_size
+        self.on_batch = on_batch
+
+    def run(self, full: bool = False) -> ReconcileResult:
+        started_at = datetime.utcnow()
+        started = time.perf_counter()
+        since = None if full else self._since()
+
+        result = ReconcileResult()
+        for recipe_ids in self._touched(since):
+            with Session(self.engine) as session:
+                drift, deferred = self._reconcile(session, recipe_ids)
+                session.commit()
+            result.drift += drift
+            result.deferred += deferred
+            result.checked += len(recipe_ids)
+            result.elapsed_seconds = time.perf_counter() - started
+            if self.on_batch:
+                self.on_batch(result)
+
+        with Session(self.engine) as session:
+            session.merge(
+                JobCheckpoint(
+                    name=CHECKPOINT_NAME, position=(started_at - CHECKPOINT_OVERLAP).isoformat()
+                )
+            )
+            session.commit()
+
+        result.elapsed_seconds = time.perf_counter() - started
+        return result
+
+    def _since(self) -> datetime | None:
+        with Session(self.engine) as session:
+            checkpoint = session.get(JobCheckpoint, CHECKPOINT_NAME)
+            return datetime.fromisoformat(checkpoint.position) if checkpoint else None
+
+    def _touched(self, since: datetime | None) -> Iterator[list[uuid.UUID]]:
+        if since is None:
+            statement = select(Recipe.id).order_by(Recipe.id)
+        else:
+            statement = (
+                select(UserRecipeInteraction.recipe_id)
+                .where(UserRecipeInteraction.updated_at >= since)
+                .distinct()
+                .order_by(UserRecipeInteraction.recipe_id)
+            )
+
+        with Session(self.engine) as session:
+            result = session.exec(statement.execution_options(yield_per=self.batch_size))
+            for partition in result.partitions():
+                yield list(partition)
+
+    def _reconcile(
+        self, session: Session, recipe_ids: list[uuid.UUID]
+    ) -> tuple[list[CountDrift], int]:
+        """Returns the drifted counters and how many recipes were deferred."""
+        session.exec(lock_counters())
+        stored = {
+            recipe_id: {"like_count": like_count, "favorite_count": favorite_count}
+            for recipe_id, like_count, favorite_count in session.exec(
+                select(Recipe.id, Recipe.like_count, Recipe.favorite_count)
+                .where(col(Recipe.id).in_(recipe_ids))
+                .order_by(Recipe.id)
+                .with_for_update()
+            ).all()
+        }
+        actual = {recipe_id: dict.fromkeys(COUNTERS, 0) for recipe_id in stored}
+        for recipe_id, like_count, favorite_count in session.exec(
+            select(
+                UserRecipeInteraction.recipe_id,
+                func.count().filter(col(UserRecipeInteraction.is_liked)),
+                func.count().filter(col(UserRecipeInteraction.is_favorite)),
+            )
+            .where(col(UserRecipeInteraction.recipe_id).in_(list(stored)))
+            .group_by(UserRecipeInteraction.recipe_id)
+        ).all():
+            actual[recipe_id] = {"like_count": like_count, "favorite_count": favorite_count}
+
+        deferred = 0
+        if settings.counter_write_behind:
+            for recipe_id, deltas in counter_buffer.pending_sync(stored).items():
+                for counter, delta in deltas.items():
+                    actual[recipe_id][counter] -= delta
+            # Checked after the aggregate, so every interaction it counted is
+            # visible here too.
+            settling = session.exec(
+                select(UserRecipeInteraction.recipe_id)
+                .where(
+                    col(UserRecipeInteraction.recipe_id).in_(list(stored)),
+                    UserRecipeInteraction.updated_at > datetime.utcnow() - SETTLING_MARGIN,
+                )
+                .distinct()
+            ).all()
+            for recipe_id in settling:
+                del stored[recipe_id]
+            deferred = len(settling)
+
+        drift = [
+            CountDrift(recipe_id, counter, stored[recipe_id][counter], actual[recipe_id][counter])
+            for recipe_id in stored
+            for counter in COUNTERS
+            if stored[recipe_id][counter] != actual[recipe_id][counter]
+        ]
+        corrected = sorted({d.recipe_id for d in drift})
+        if corrected:
+            batch = values(
+                column("id", Uuid),
+                *(column(counter, Integer) for counter in COUNTERS),
+                name="counts",
+            ).data([(r, *(actual[r][counter] for counter in COUNTERS)) for r in corrected])
+            recipes = Recipe.__table__.c  # type: ignore[attr-defined]
+            session.exec(
+                update(Recipe)
+                .where(recipes.id == batch.c.id)
+                .values({counter: batch.c[counter] for counter in COUNTERS})
+            )
+        return drift, deferred
@@ -1,95 +1,120 @@
 import uuid
 from datetime import datetime
+from typing import Any
 
 from fastapi import HTTPException, status
-from sqlmodel import Session, select
+from redis.exceptions import RedisError
+from sqlalchemy import Update, case, not_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from recipe_api.features.recipes.schemas import RecipeRead
+from recipe_api.features.users.counters import counter_buffer
+from recipe_api.features.users.viewer_state import ViewerState
+from recipe_api.shared.config import settings
 from recipe_api.shared.models.recipe import Recipe
 from recipe_api.shared.models.user_interaction import UserRecipeInteraction
 
+FOREIGN_KEY_VIOLATION = "23503"
+
 
 class UserService:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
-    def toggle_favorite(self, recipe_id: uuid.UUID, user_id: str) -> dict[str, bool]:
-        recipe = self.session.get(Recipe, recipe_id)
-        if not recipe:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Recipe not found",
-            )
-        interaction = self.session.exec(
-            select(UserRecipeInteraction).where(
-                UserRecipeInteraction.user_id == user_id,
-                UserRecipeInteraction.recipe_id == recipe_id,
-            )
-        ).first()
+    async def toggle_favorite(self, recipe_id: uuid.UUID, user_id: str) -> dict[str, bool]:
+        is_favorite = await self._toggle(recipe_id, user_id, "is_favorite", "favorite_count")
+        return {"is_favorite": is_favorite}
 
-        if not interaction:
-            interaction = UserRecipeInteraction(
-                user_id=user_id,
-                recipe_id=recipe_id,
-                is_favorite=True,
-            )
-            recipe.favorite_count += 1
-        else:
-            interaction.is_favorite = not interaction.is_favorite
-            interaction.updated_at = datetime.utcnow()
-            recipe.favorite_count += 1 if interaction.is_favorite else -1
+    async def toggle_like(self, recipe_id: uuid.UUID, user_id: str) -> dict[str, bool]:
+        is_liked = await self._toggle(recipe_id, user_id, "is_liked", "like_count")
+        return {"is_liked": is_liked}
+
+    async def _toggle(self, recipe_id: uuid.UUID, user_id: str, flag: str, counter: str) -> bool:
+        """Flip one interaction flag and move the recipe counter in one statement.
 
-        self.session.add(interaction)
-        self.session.add(recipe)
-        self.session.commit()
+        The upsert creates the interaction (flag on) or flips the existing one,
+        and the counter moves by +/-1 from its value inside the UPDATE, so
+        concurrent toggles neither race on the interaction row nor lose
+        counter updates. A missing recipe surfaces as the FK violation.
 
-        return {"is_favorite": interaction.is_favorite}
+        With `counter_write_behind` on, the counter is left alone and its
+        delta goes to the Redis buffer after the commit instead.
+        """
+        interactions = UserRecipeInteraction.__table__.c  # type: ignore[attr-defined]
+        now = datetime.utcnow()
+        toggled = (
+            insert(UserRecipeInteraction)
+            .values(
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": user_id,
+                    "recipe_id": recipe_id,
+                    "is_favorite": False,
+                    "is_liked": False,
+                    flag: True,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+            .on_conflict_do_update(
+                index_elements=["user_id", "recipe_id"],
+                set_={flag: not_(interactions[flag]), "updated_at": now},
+            )
+            .returning(interactions[flag])
+            .cte("toggled")
+        )
+        statement = select(toggled.c[flag])
+        if not settings.counter_write_behind:
+            delta = select(case((toggled.c[flag], 1), else_=-1)).scalar_subquery()
+            statement = statement.add_cte(self._count(recipe_id, counter, delta).cte("counted"))
 
-    def toggle_like(self, recipe_id: uuid.UUID, user_id: str) -> dict[str, bool]:
-        recipe = self.session.get(Recipe, recipe_id)
-        if not recipe:
+        try:
+            result = await self.session.exec(statement)
+            value = bool(result.one())
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            if getattr(e.orig, "pgcode", None) != FOREIGN_KEY_VIOLATION:
+                raise
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Recipe not found",
-            )
+            ) from e
 
-        interaction = self.session.exec(
-            select(UserRecipeInteraction).where(
-                UserRecipeInteraction.user_id == user_id,
-                UserRecipeInteraction.recipe_id == recipe_id,
-            )
-        ).first()
-
-        if not interaction:
-            interaction = UserRecipeInteraction(
-                user_id=user_id,
-                recipe_id=recipe_id,
-                is_liked=True,
-            )
-            recipe.like_count += 1
-        else:
-            interaction.is_liked = not interaction.is_liked
-            interaction.updated_at = datetime.utcnow()
-            recipe.like_count += 1 if interaction.is_liked else -1
+        if settings.counter_write_behind:
+            await self._buffer_count(recipe_id, counter, 1 if value else -1)
+        return value
 
-        self.session.add(interaction)
-        self.session.add(recipe)
-        self.session.commit()
+    def _count(self, recipe_id: uuid.UUID, counter: str, delta: Any) -> Update:
+        recipes = Recipe.__table__.c  # type: ignore[attr-defined]
+        return update(Recipe).where(recipes.id == recipe_id).values({counter: recipes[counter] + delta})
 
-        return {"is_liked": interaction.is_liked}
+    async def _buffer_count(self, recipe_id: uuid.UUID, counter: str, delta: int) -> None:
+        try:
+            await counter_buffer.add(recipe_id, counter, delta)
+        except RedisError:
+            # Without Redis the toggle still has to count; take the row lock.
+            await self.session.exec(self._count(recipe_id, counter, delta))
+            await self.session.commit()
 
-    def get_my_favorites(self, user_id: str) -> list[RecipeRead]:
+    async def get_my_favorites(self, user_id: str) -> list[RecipeRead]:
         statement = (
-            select(Recipe)
+            select(Recipe, UserRecipeInteraction.is_liked)
             .join(UserRecipeInteraction)
             .where(
                 UserRecipeInteraction.user_id == user_id,
                 UserRecipeInteraction.is_favorite == True,  # noqa: E712
             )
         )
-        recipes = self.session.exec(statement).all()
+        rows = (await self.session.exec(statement)).all()
 
-        return [
-            RecipeRead.model_validate(recipe, from_attributes=True)
-            for recipe in recipes
-        ]
+        # The viewer state is already on the joined interaction row.
+        return await counter_buffer.merge([
+            RecipeRead.model_validate(recipe, from_attributes=True).model_copy(
+                update=ViewerState(is_liked=is_liked, is_favorited=True)._asdict()
+            )
+            for recipe, is_liked in rows
+        ])
@@ -0,0 +1,102 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from recipe_api.features.users.counters import CounterBuffer, parse_deltas
+from recipe_api.features.users.service import UserService
+from recipe_api.shared.config import settings
+from recipe_api.shared.models.recipe import Recipe, RecipeStatus
+
+USERS = 50
+
+
+@pytest.mark.unit
+def test_parse_deltas_groups_by_recipe() -> None:
+    first, second = uuid.uuid4(), uuid.uuid4()
+
+    deltas = parse_deltas(
+        {
+            f"{first}:like_count": "3",
+            f"{first}:favorite_count": "-1",
+            f"{second}:like_count": "0",
+            f"{second}:favorite_count": "2",
+        }
+    )
+
+    assert deltas == {
+        first: {"like_count": 3, "favorite_count": -1},
+        second: {"like_count": 0, "favorite_count": 2},
+    }
+
+
+@pytest.mark.unit
+def test_parse_deltas_drops_netted_out_recipes() -> None:
+    recipe_id = uuid.uuid4()
+
+    assert parse_deltas({f"{recipe_id}:like_count": "0", f"{recipe_id}:favorite_count": "0"}) == {}
+
+
+@pytest.mark.unit
+async def test_run_survives_errors_and_flushes_on_stop(monkeypatch: pytest.MonkeyPatch) -> None:
+    buffer = CounterBuffer()
+    stop = asyncio.Event()
+    flushes = 0
+
+    async def flush() -> int:
+        nonlocal flushes
+        flushes += 1
+        if flushes == 1:
+            raise ValueError("unexpected")
+        return 0
+
+    monkeypatch.setattr(buffer, "flush", flush)
+    task = asyncio.create_task(buffer.run(0.01, stop))
+    while flushes < 2:
+        await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # A stop mid-interval wakes the loop for one last flush.
+    flushes = 0
+    task = asyncio.create_task(buffer.run(60, stop))
+    await asyncio.sleep(0)
+    stop.set()
+    await asyncio.wait_for(task, timeout=5)
+    assert flushes == 1
+
+
+@pytest.mark.e2e
+async def test_write_behind_counts_flush_to_postgres(
+    async_engine: AsyncEngine, session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "counter_write_behind", True)
+    buffer = CounterBuffer(lambda: AsyncSession(async_engine, expire_on_commit=False))
+    await buffer.flush()
+    recipe = Recipe(name="Viral Recipe", created_by="counter-test", status=RecipeStatus.PUBLISHED)
+    session.add(recipe)
+    session.commit()
+
+    async def toggle_like(user_id: str) -> None:
+        async with AsyncSession(async_engine, expire_on_commit=False) as user_session:
+            await UserService(user_session).toggle_like(recipe.id, user_id)
+
+    await asyncio.gather(*(toggle_like(f"counter-user-{i}") for i in range(USERS)))
+
+    session.expire_all()
+    stored = session.get(Recipe, recipe.id)
+    assert stored is not None
+    assert stored.like_count == 0
+    assert await buffer.pending([recipe.id]) == {recipe.id: {"like_count": USERS, "favorite_count": 0}}
+
+    assert await buffer.flush() == 1
+
+    session.expire_all()
+    stored = session.get(Recipe, recipe.id)
+    assert stored is not None
+    assert stored.like_count == USERS
+    assert await buffer.pending([recipe.id]) == {}
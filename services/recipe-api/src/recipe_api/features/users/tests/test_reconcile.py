@@ -0,0 +1,164 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import Engine, delete, update
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import Session, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from recipe_api.features.users.counters import CounterBuffer, lock_counters
+from recipe_api.features.users.reconcile import (
+    CHECKPOINT_NAME,
+    SETTLING_MARGIN,
+    CountDrift,
+    CountReconciler,
+)
+from recipe_api.shared.config import settings
+from recipe_api.shared.models.job_checkpoint import JobCheckpoint
+from recipe_api.shared.models.recipe import Recipe, RecipeStatus
+from recipe_api.shared.models.user_interaction import UserRecipeInteraction
+
+
+@pytest.fixture
+def reconciler(engine: Engine, session: Session) -> CountReconciler:
+    session.exec(delete(JobCheckpoint).where(JobCheckpoint.name == CHECKPOINT_NAME))  # type: ignore[arg-type]
+    session.commit()
+    return CountReconciler(engine, batch_size=2)
+
+
+def _recipe(session: Session, name: str, like_count: int, favorite_count: int, likes: int) -> Recipe:
+    recipe = Recipe(
+        name=name,
+        created_by="reconcile-test",
+        status=RecipeStatus.PUBLISHED,
+        like_count=like_count,
+        favorite_count=favorite_count,
+    )
+    session.add(recipe)
+    session.commit()
+    session.add_all(
+        UserRecipeInteraction(user_id=f"{name}-user-{i}", recipe_id=recipe.id, is_liked=True)
+        for i in range(likes)
+    )
+    session.commit()
+    return recipe
+
+
+def _settle(session: Session, recipe: Recipe) -> None:
+    """Age a recipe's interactions past the write-behind settling margin."""
+    session.exec(
+        update(UserRecipeInteraction)
+        .where(col(UserRecipeInteraction.recipe_id) == recipe.id)
+        .values(updated_at=datetime.utcnow() - SETTLING_MARGIN - timedelta(seconds=5))
+    )
+    session.commit()
+
+
+@pytest.mark.e2e
+def test_reconcile_rewrites_only_drifted_counts(
+    reconciler: CountReconciler, session: Session
+) -> None:
+    drifted = _recipe(session, "drifted", like_count=5, favorite_count=1, likes=2)
+    exact = _recipe(session, "exact", like_count=3, favorite_count=0, likes=3)
+    exact_updated_at = exact.updated_at
+
+    result = reconciler.run(full=True)
+
+    assert CountDrift(drifted.id, "like_count", 5, 2) in result.drift
+    assert CountDrift(drifted.id, "favorite_count", 1, 0) in result.drift
+    assert all(d.recipe_id != exact.id for d in result.drift)
+
+    session.expire_all()
+    stored = session.get(Recipe, drifted.id)
+    assert stored is not None
+    assert (stored.like_count, stored.favorite_count) == (2, 0)
+    untouched = session.get(Recipe, exact.id)
+    assert untouched is not None
+    assert untouched.updated_at == exact_updated_at
+
+
+@pytest.mark.e2e
+def test_incremental_reconcile_skips_untouched_recipes(
+    reconciler: CountReconciler, session: Session
+) -> None:
+    stale = _recipe(session, "stale", like_count=9, favorite_count=0, likes=1)
+    reconciler.run(full=True)
+
+    # Drift on a recipe nobody interacted with since the last run stays put...
+    session.merge(
+        JobCheckpoint(name=CHECKPOINT_NAME, position=(datetime.utcnow() + timedelta(hours=1)).isoformat())
+    )
+    stored = session.get(Recipe, stale.id)
+    assert stored is not None
+    stored.like_count = 7
+    session.commit()
+
+    result = reconciler.run()
+    assert result.checked == 0
+
+    # ...until it gets a new interaction.
+    session.add(UserRecipeInteraction(user_id="stale-user-new", recipe_id=stale.id, is_liked=True))
+    session.merge(
+        JobCheckpoint(name=CHECKPOINT_NAME, position=(datetime.utcnow() - timedelta(minutes=1)).isoformat())
+    )
+    session.commit()
+
+    result = reconciler.run()
+    assert [d for d in result.drift if d.recipe_id == stale.id] == [
+        CountDrift(stale.id, "like_count", 7, 2)
+    ]
+
+
+@pytest.mark.e2e
+async def test_reconcile_and_flush_do_not_double_count_pending_deltas(
+    reconciler: CountReconciler,
+    engine: Engine,
+    async_engine: AsyncEngine,
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "counter_write_behind", True)
+    buffer = CounterBuffer(lambda: AsyncSession(async_engine, expire_on_commit=False))
+    await buffer.flush()
+    # Three likes committed, two of them still buffered in Redis.
+    buffered = _recipe(session, "buffered", like_count=0, favorite_count=0, likes=3)
+    _settle(session, buffered)
+    await buffer.add(buffered.id, "like_count", 2)
+
+    result = reconciler.run(full=True)
+    assert CountDrift(buffered.id, "like_count", 0, 1) in result.drift
+
+    # A reconcile batch holding the lock keeps the flush from draining.
+    with Session(engine) as batch:
+        batch.exec(lock_counters())
+        flush = asyncio.create_task(buffer.flush())
+        await asyncio.sleep(0.5)
+        assert not flush.done()
+        assert await buffer.pending([buffered.id]) == {
+            buffered.id: {"like_count": 2, "favorite_count": 0}
+        }
+    assert await flush == 1
+
+    session.expire_all()
+    stored = session.get(Recipe, buffered.id)
+    assert stored is not None
+    assert stored.like_count == 3
+    assert [d for d in reconciler.run(full=True).drift if d.recipe_id == buffered.id] == []
+
+
+@pytest.mark.e2e
+def test_write_behind_reconcile_defers_recipes_with_settling_toggles(
+    reconciler: CountReconciler, session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "counter_write_behind", True)
+    # Committed toggles whose deltas haven't reached the buffer yet.
+    settling = _recipe(session, "settling", like_count=0, favorite_count=0, likes=2)
+
+    result = reconciler.run(full=True)
+    assert all(d.recipe_id != settling.id for d in result.drift)
+    assert result.deferred >= 1
+
+    _settle(session, settling)
+    result = reconciler.run()
+    assert CountDrift(settling.id, "like_count", 0, 2) in result.drift
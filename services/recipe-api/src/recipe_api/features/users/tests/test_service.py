@@ -0,0 +1,58 @@
+import asyncio
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import Session, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from recipe_api.features.users.service import UserService
+from recipe_api.shared.models.recipe import Recipe, RecipeStatus
+from recipe_api.shared.models.user_interaction import UserRecipeInteraction
+
+USERS = 200
+
+
+async def _toggle_like(async_engine: AsyncEngine, recipe_id: uuid.UUID, user_id: str) -> bool:
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        result = await UserService(session).toggle_like(recipe_id, user_id)
+        return result["is_liked"]
+
+
+@pytest.mark.e2e
+async def test_concurrent_toggles_keep_counts_exact(
+    async_engine: AsyncEngine, session: Session
+) -> None:
+    recipe = Recipe(name="Contended Recipe", created_by="toggle-test", status=RecipeStatus.PUBLISHED)
+    session.add(recipe)
+    session.commit()
+    users = [f"toggle-user-{i}" for i in range(USERS)]
+
+    # Everyone likes at once. Then even-indexed users toggle once more and
+    # odd-indexed users twice, with both of their requests racing on one row.
+    liked = await asyncio.gather(*(_toggle_like(async_engine, recipe.id, u) for u in users))
+    assert all(liked)
+
+    second_round = users[::2] + users[1::2] * 2
+    await asyncio.gather(*(_toggle_like(async_engine, recipe.id, u) for u in second_round))
+
+    session.expire_all()
+    stored = session.get(Recipe, recipe.id)
+    assert stored is not None
+    liked_rows = session.exec(
+        select(func.count()).where(
+            UserRecipeInteraction.recipe_id == recipe.id,
+            UserRecipeInteraction.is_liked == True,  # noqa: E712
+        )
+    ).one()
+    assert liked_rows == USERS // 2
+    assert stored.like_count == liked_rows
+    assert stored.favorite_count == 0
+
+
+@pytest.mark.e2e
+async def test_toggle_on_missing_recipe_is_not_found(async_session: AsyncSession) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await UserService(async_session).toggle_favorite(uuid.uuid4(), "toggle-user")
+    assert exc_info.value.status_code == 404
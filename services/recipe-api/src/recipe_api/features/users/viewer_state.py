@@ -0,0 +1,47 @@
+import uuid
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from recipe_api.shared.models.user_interaction import UserRecipeInteraction
+
+
+class ViewerState(NamedTuple):
+    is_liked: bool = False
+    is_favorited: bool = False
+
+
+NO_VIEWER_STATE = ViewerState()
+
+
+async def load_viewer_state(
+    session: AsyncSession,
+    user_id: str | None,
+    recipe_ids: Iterable[uuid.UUID],
+) -> dict[uuid.UUID, ViewerState]:
+    """Fetch the like/favorite flags of `user_id` for all `recipe_ids` in one query.
+
+    Recipes the user never interacted with are absent from the result; callers
+    should fall back to `NO_VIEWER_STATE`.
+    """
+    ids = list(set(recipe_ids))
+    if user_id is None or not ids:
+        return {}
+
+    result = await session.exec(
+        select(
+            UserRecipeInteraction.recipe_id,
+            UserRecipeInteraction.is_liked,
+            UserRecipeInteraction.is_favorite,
+        ).where(
+            UserRecipeInteraction.user_id == user_id,
+            UserRecipeInteraction.recipe_id.in_(ids),  # type: ignore[attr-defined]
+        )
+    )
+
+    return {
+        recipe_id: ViewerState(is_liked=is_liked, is_favorited=is_favorite)
+        for recipe_id, is_liked, is_favorite in result.all()
+    }
@@ -1,27 +1,63 @@
+import asyncio
+import contextlib
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi_limiter import FastAPILimiter
-from fastapi_limiter.depends import RateLimiter
-from redis import asyncio as aioredis
+from fastapi.responses import JSONResponse
 
 from recipe_api.features.generate.router import router as generate_router
 from recipe_api.features.health.router import router as health_router
+from recipe_api.features.recipes.pagination import NEXT_CURSOR_HEADER
 from recipe_api.features.recipes.router import router as recipes_router
 from recipe_api.features.search.router import router as search_router
+from recipe_api.features.users.counters import counter_buffer
 from recipe_api.features.users.router import router as users_router
 from recipe_api.shared.config import settings
-from recipe_api.shared.rate_limit import get_rate_limit_key
+from recipe_api.shared.db import async_engine
+from recipe_api.shared.rate_limit import RateLimit, RateLimiter
+from recipe_api.shared.redis import close_redis
+from recipe_api.shared.services.embedding_executor import get_embedding_executor
+from recipe_api.shared.services.embedding_versions import EmbeddingVersionUnavailableError
+from recipe_api.shared.services.jwks import jwks_store
+from recipe_api.shared.warmup import create_warmup
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    redis = aioredis.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
-    await FastAPILimiter.init(redis)
+    embedding_executor = get_embedding_executor()
+    embedding_executor.start()
+    # Serve /health right away; /ready passes once warmup is done.
+    app.state.warmup = warmup = create_warmup()
+    warmup_task = asyncio.create_task(warmup.run(), name="warmup")
+    background_tasks = [
+        warmup_task,
+        asyncio.create_task(
+            jwks_store.refresh_forever(settings.clerk_jwks_refresh_seconds), name="jwks-refresh"
+        ),
+    ]
+    counter_flush_stop = asyncio.Event()
+    counter_flush = (
+        asyncio.create_task(
+            counter_buffer.run(settings.counter_flush_interval_seconds, counter_flush_stop),
+            name="counter-flush",
+        )
+        if settings.counter_write_behind
+        else None
+    )
     yield
-    await redis.close()
+    # Not cancelled: a cancel mid-flush could drop deltas, so let it finish.
+    counter_flush_stop.set()
+    if counter_flush:
+        await counter_flush
+    for task in background_tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await embedding_executor.stop()
+    await close_redis()
+    await async_engine.dispose()
 
 app = FastAPI(
     title="Recipe API",
@@ -29,7 +65,7 @@ app = FastAPI(
     version="0.1.0",
     lifespan=lifespan,
     swagger_ui_parameters={"persistAuthorization": True},
-    dependencies=[Depends(RateLimiter(times=60, seconds=60, identifier=get_rate_limit_key))],
+    dependencies=[Depends(RateLimiter(RateLimit(times=60, seconds=60)))],
 )
 
 app.add_middleware(
@@ -38,8 +74,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+
+@app.exception_handler(EmbeddingVersionUnavailableError)
+async def embedding_version_unavailable(
+    request: Request, exc: EmbeddingVersionUnavailableError
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={"detail": str(exc)}
+    )
+
+
 app.include_router(recipes_router)
 app.include_router(search_router)
 app.include_router(users_router)
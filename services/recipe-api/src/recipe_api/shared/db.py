@@ -1,9 +1,14 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
 
+from sqlalchemy import make_url, text
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from recipe_api.shared.config import settings
 
+# Sync engine for batch commands (re-embed, reconcile-counts).
 engine = create_engine(
     settings.database_url,
     echo=settings.log_level == "debug",
@@ -13,9 +18,37 @@ engine = create_engine(
 )
 
 
-def get_session() -> Generator[Session, None, None]:
-    with Session(engine) as session:
-        yield session
+def async_database_url(url: str) -> str:
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+# Request path and Temporal activities. pgvector's SQLAlchemy type sends and
+# reads vectors in text format, which asyncpg handles without a custom codec.
+async_engine = create_async_engine(
+    async_database_url(settings.database_url),
+    echo=settings.log_level == "debug",
+    pool_pre_ping=True,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+)
+
 
 def get_db_session() -> Session:
     return Session(engine)
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+def get_async_db_session() -> AsyncSession:
+    return AsyncSession(async_engine, expire_on_commit=False)
+
+
+async def warm_pool() -> None:
+    """Open `pool_size` connections up front so early requests don't pay for connecting."""
+    async with AsyncExitStack() as stack:
+        for _ in range(async_engine.pool.size()):  # type: ignore[attr-defined]
+            connection = await stack.enter_async_context(async_engine.connect())
+            await connection.execute(text("SELECT 1"))
@@ -1,30 +1,64 @@
-from typing import Annotated
+from typing import Annotated, Any
 
-from clerk_backend_api import Clerk
-from clerk_backend_api.security import verify_token
-from clerk_backend_api.security.types import VerifyTokenOptions
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from recipe_api.shared.config import settings
-from recipe_api.shared.db import get_session
-
-clerk_client = Clerk(bearer_auth=settings.clerk_secret_key)
+from recipe_api.shared.db import get_async_session
+from recipe_api.shared.services.jwks import jwks_store
+from recipe_api.shared.services.token_claims import TokenClaimsCache, token_key
 
 security = HTTPBearer()
 optional_security = HTTPBearer(auto_error=False)
 
+token_claims_cache = TokenClaimsCache(settings.token_claims_cache_size)
+
+
+def verify_clerk_token(token: str) -> dict[str, Any]:
+    return jwks_store.verify(token)
+
+
+def verify_request_token(request: Request, token: str) -> dict[str, Any]:
+    """`verify_clerk_token`, run at most once per request and, for a token it
+    accepts, once per process.
+
+    The rate limiters and the user dependencies all resolve the same bearer
+    token, so the outcome is kept on `request.state`, and accepted tokens are
+    also kept in `token_claims_cache` until they expire.
+    """
+    key = token_key(token)
+    verified: dict[str, dict[str, Any] | Exception] | None = getattr(
+        request.state, "verified_tokens", None
+    )
+    if verified is None:
+        verified = request.state.verified_tokens = {}
+
+    if key not in verified:
+        claims = token_claims_cache.get(key)
+        if claims is None:
+            try:
+                claims = verify_clerk_token(token)
+            except Exception as e:
+                verified[key] = e
+                raise
+            token_claims_cache.set(key, claims)
+        verified[key] = claims
+
+    outcome = verified[key]
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
+
 
 def get_current_user_id(
+    request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
 ) -> str:
     token = credentials.credentials
 
     try:
-        verified_token = verify_token(
-            token, VerifyTokenOptions(secret_key=settings.clerk_secret_key)
-        )
+        verified_token = verify_request_token(request, token)
         user_id = verified_token.get("sub")
         if not user_id:
             raise HTTPException(
@@ -40,6 +74,7 @@ def get_current_user_id(
 
 
 def get_optional_user_id(
+    request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(optional_security)],
 ) -> str | None:
     if credentials is None:
@@ -47,14 +82,12 @@ def get_optional_user_id(
 
     token = credentials.credentials
     try:
-        verified_token = verify_token(
-            token, VerifyTokenOptions(secret_key=settings.clerk_secret_key)
-        )
+        verified_token = verify_request_token(request, token)
         return verified_token.get("sub")
     except Exception:
         return None
 
 
-SessionDep = Annotated[Session, Depends(get_session)]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
 CurrentUserDep = Annotated[str, Depends(get_current_user_id)]
 OptionalUserDep = Annotated[str | None, Depends(get_optional_user_id)]
@@ -1,7 +1,16 @@
+from recipe_api.shared.models.embedding_cache import EmbeddingCacheEntry
+from recipe_api.shared.models.embedding_version import EmbeddingVersion, RecipeEmbedding
 from recipe_api.shared.models.generation_log import GenerationLog
+from recipe_api.shared.models.job_checkpoint import JobCheckpoint
 from recipe_api.shared.models.recipe import Recipe
 from recipe_api.shared.models.user_interaction import UserRecipeInteraction
 
-__all__ = ["Recipe", "UserRecipeInteraction", "GenerationLog"]
-
-
+__all__ = [
+    "Recipe",
+    "UserRecipeInteraction",
+    "GenerationLog",
+    "EmbeddingCacheEntry",
+    "EmbeddingVersion",
+    "RecipeEmbedding",
+    "JobCheckpoint",
+]
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Any
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Column
+from sqlmodel import Field, SQLModel
+
+
+class EmbeddingCacheEntry(SQLModel, table=True):
+    __tablename__ = "embedding_cache"  # type: ignore
+
+    # Model name plus inference backend, see EmbeddingService.model_id.
+    model: str = Field(primary_key=True, max_length=255)
+    # sha256 hex digest of the normalized text.
+    content_hash: str = Field(primary_key=True, max_length=64)
+    # Unsized, so vectors of models with different dimensions can coexist.
+    embedding: Any = Field(sa_column=Column(Vector(), nullable=False))
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Bumped at most daily on hits; `uv run prune-embedding-cache` drops stale rows.
+    last_used_at: datetime = Field(default_factory=datetime.utcnow, index=True)
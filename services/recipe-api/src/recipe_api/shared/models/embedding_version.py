@@ -0,0 +1,75 @@
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Column, text
+from sqlmodel import Field, Index, SQLModel
+
+
+class EmbeddingVersionStatus(str, Enum):
+    BACKFILLING = "BACKFILLING"
+    ACTIVE = "ACTIVE"
+    RETIRED = "RETIRED"
+
+
+class EmbeddingVersion(SQLModel, table=True):
+    """A model whose vectors are (being) stored for every recipe.
+
+    Exactly one version is ACTIVE: its model encodes search queries and
+    recipe writes, and search ranks its `recipe_embeddings` rows. See
+    `uv run reembed`.
+    """
+
+    __tablename__ = "embedding_versions"  # type: ignore
+
+    id: int | None = Field(default=None, primary_key=True)
+    model: str = Field(max_length=255)
+    status: EmbeddingVersionStatus = Field(default=EmbeddingVersionStatus.BACKFILLING)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    activated_at: datetime | None = Field(default=None)
+    retired_at: datetime | None = Field(default=None)
+
+    __table_args__ = (
+        Index(
+            "idx_embedding_versions_single_active",
+            "status",
+            unique=True,
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
+    )
+
+
+class RecipeEmbedding(SQLModel, table=True):
+    """A recipe's vectors under one embedding version.
+
+    Kept out of `recipes` so that counter and status updates there don't
+    rewrite ~3 KB of vectors each time. Search reads the ACTIVE version's
+    rows; a retired version's are pruned once every process has moved off it.
+    """
+
+    __tablename__ = "recipe_embeddings"  # type: ignore
+
+    recipe_id: uuid.UUID = Field(foreign_key="recipes.id", primary_key=True, ondelete="CASCADE")
+    version_id: int = Field(foreign_key="embedding_versions.id", primary_key=True)
+    description_embedding: Any = Field(default=None, sa_column=Column(Vector(384)))
+    ingredient_embedding: Any = Field(default=None, sa_column=Column(Vector(384)))
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    __table_args__ = (
+        Index(
+            "idx_description_embedding",
+            "description_embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"description_embedding": "vector_cosine_ops"},
+        ),
+        Index(
+            "idx_ingredient_embedding",
+            "ingredient_embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"ingredient_embedding": "vector_cosine_ops"},
+        ),
+    )
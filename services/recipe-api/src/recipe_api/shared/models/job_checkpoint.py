@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class JobCheckpoint(SQLModel, table=True):
+    """Resume position of a long-running batch job, e.g. the last id processed."""
+
+    __tablename__ = "job_checkpoints"  # type: ignore
+
+    name: str = Field(primary_key=True, max_length=255)
+    position: str
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -3,7 +3,6 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pgvector.sqlalchemy import Vector
 from sqlalchemy import Column, Index
 from sqlalchemy.dialects.postgresql import JSON
 from sqlmodel import Field, SQLModel
@@ -48,21 +47,12 @@ class Recipe(SQLModel, table=True):
     ingredients: list[dict[str, Any]] = Field(default_factory=list, sa_column=Column(JSON))
     instructions: str = Field(default="")
     food_type: FoodType | None = Field(default=None)
-    status: RecipeStatus = Field(default=RecipeStatus.DRAFT, index=True)
+    status: RecipeStatus = Field(default=RecipeStatus.DRAFT)
     is_generated: bool = Field(default=False)
-    created_by: str = Field(index=True)
+    created_by: str = Field()
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
-    description_embedding: Any = Field(
-        default=None,
-        sa_column=Column(Vector(384)),
-    )
-    ingredient_embedding: Any = Field(
-        default=None,
-        sa_column=Column(Vector(384)),
-    )
-
     like_count: int = Field(default=0)
     favorite_count: int = Field(default=0)
 
@@ -73,18 +63,10 @@ class Recipe(SQLModel, table=True):
     generation_prompt: str | None = Field(default=None)
 
     __table_args__ = (
-        Index(
-            "idx_description_embedding",
-            "description_embedding",
-            postgresql_using="ivfflat",
-            postgresql_with={"lists": 100},
-            postgresql_ops={"description_embedding": "vector_cosine_ops"},
-        ),
-        Index(
-            "idx_ingredient_embedding",
-            "ingredient_embedding",
-            postgresql_using="ivfflat",
-            postgresql_with={"lists": 100},
-            postgresql_ops={"ingredient_embedding": "vector_cosine_ops"},
-        ),
+        # Keyset pagination: newest published recipes, and an owner's own.
+        # Not partial on status, since a parameterized `status = $1` can't
+        # be matched against a partial index predicate.
+        Index("ix_recipes_status_created_at", "status", "created_at", "id"),
+        Index("ix_recipes_created_by_created_at", "created_by", "created_at", "id"),
     )
+
@@ -15,4 +15,8 @@ class UserRecipeInteraction(SQLModel, table=True):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
-    __table_args__ = (Index("idx_user_recipe_unique", "user_id", "recipe_id", unique=True),)
+    __table_args__ = (
+        Index("idx_user_recipe_unique", "user_id", "recipe_id", unique=True),
+        # Incremental count reconciliation scans interactions touched since its last run.
+        Index("idx_user_recipe_updated_at", "updated_at", "recipe_id"),
+    )
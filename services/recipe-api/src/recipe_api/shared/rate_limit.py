@@ -1,8 +1,158 @@
-from clerk_backend_api.security import verify_token
-from clerk_backend_api.security.types import VerifyTokenOptions
-from fastapi import Request
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from math import ceil
+from typing import Any, TypeVar
 
-from recipe_api.shared.config import settings
+from fastapi import HTTPException, Request, status
+from pydantic import BaseModel, ValidationError
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+
+from recipe_api.shared.deps import verify_request_token
+from recipe_api.shared.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMITS_ATTR = "__rate_limits__"
+KEY_PREFIX = "rate-limit"
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Any])
+
+RequestCost = Callable[[Request], Awaitable[int]]
+
+# Sliding-window counter over every limit of a request, in one call.
+#
+# KEYS: one hash per limit, holding used units per window number.
+# ARGV: now_ms, requested, lease_share, refund and refund_ms, then times,
+# window_ms and the request's weight (units per request, at most times)
+# per key.
+#
+# `refund` requests charged at `refund_ms` for an expired lease went
+# unspent; they are taken back out of that window first, if it still counts.
+#
+# Each limit estimates its usage as the current window's count plus the
+# previous window's, weighted by how much of it still overlaps the sliding
+# window. If every limit has room for the request's weight, they are all
+# charged the same grant: up to `requested` requests, but at most
+# `lease_share` of the tightest limit's free capacity, times the weight.
+# Returns {granted, retry_after_ms}.
+SLIDING_WINDOW_LUA = """
+-- How long until one more request fits, as the previous window slides out.
+local function wait_ms(times, weight, count, previous, elapsed, window_ms)
+    local room = times - weight
+    if count <= room then
+        return math.max(1, math.ceil(window_ms - (room - count) * window_ms / previous - elapsed))
+    end
+    return math.max(1, math.ceil(window_ms - elapsed + window_ms - room * window_ms / count))
+end
+
+local now = tonumber(ARGV[1])
+local grant = tonumber(ARGV[2])
+local share = tonumber(ARGV[3])
+local refund = tonumber(ARGV[4])
+local refund_at = tonumber(ARGV[5])
+local retry_after = 0
+local windows = {}
+
+for i, key in ipairs(KEYS) do
+    local times = tonumber(ARGV[3 + 3 * i])
+    local window_ms = tonumber(ARGV[4 + 3 * i])
+    local weight = tonumber(ARGV[5 + 3 * i])
+    local current = math.floor(now / window_ms)
+    local elapsed = now - current * window_ms
+    if refund > 0 then
+        local charged = math.floor(refund_at / window_ms)
+        if charged >= current - 1 then
+            local field = string.format('%d', charged)
+            if redis.call('HINCRBY', key, field, -refund * weight) <= 0 then
+                redis.call('HDEL', key, field)
+            end
+        end
+    end
+    local count = tonumber(redis.call('HGET', key, string.format('%d', current)) or '0')
+    local previous = tonumber(redis.call('HGET', key, string.format('%d', current - 1)) or '0')
+    local free = math.floor(times - count - previous * (window_ms - elapsed) / window_ms)
+    if free < weight then
+        retry_after = math.max(
+            retry_after, wait_ms(times, weight, count, previous, elapsed, window_ms)
+        )
+    else
+        grant = math.min(grant, math.max(1, math.floor(free / weight * share)))
+    end
+    windows[i] = {current, window_ms, weight}
+end
+
+if retry_after > 0 then
+    return {0, retry_after}
+end
+
+for i, key in ipairs(KEYS) do
+    local current, window_ms, weight = windows[i][1], windows[i][2], windows[i][3]
+    redis.call('HINCRBY', key, string.format('%d', current), grant * weight)
+    redis.call('HDEL', key, string.format('%d', current - 2))
+    redis.call('PEXPIRE', key, window_ms * 2)
+end
+return {grant, 0}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    times: int
+    seconds: int
+
+    @property
+    def window_ms(self) -> int:
+        return self.seconds * 1000
+
+    @property
+    def name(self) -> str:
+        return f"{self.times}/{self.seconds}s"
+
+
+@dataclass(frozen=True)
+class RouteLimits:
+    limits: tuple[RateLimit, ...]
+    # Units one request takes from `limits`; the global limits count requests.
+    cost: RequestCost | None = None
+
+
+NO_ROUTE_LIMITS = RouteLimits(())
+
+# A limit and the units one request takes from it.
+Charge = tuple[RateLimit, int]
+
+
+def rate_limit(
+    *limits: RateLimit, cost: RequestCost | None = None
+) -> Callable[[EndpointT], EndpointT]:
+    """Declare limits for one route; they are checked together with the global ones.
+
+    Apply below the route decorator.
+    """
+
+    def decorate(endpoint: EndpointT) -> EndpointT:
+        setattr(endpoint, RATE_LIMITS_ATTR, RouteLimits(limits, cost))
+        return endpoint
+
+    return decorate
+
+
+def body_cost[BodyT: BaseModel](model: type[BodyT], cost: Callable[[BodyT], int]) -> RequestCost:
+    """Weigh requests by their JSON body. Bodies that don't validate cost 1;
+    FastAPI rejects them before the route runs."""
+
+    async def weigh(request: Request) -> int:
+        try:
+            body = model.model_validate_json(await request.body())
+        except ValidationError:
+            return 1
+        return max(1, cost(body))
+
+    return weigh
 
 
 async def get_rate_limit_key(request: Request) -> str:
@@ -10,9 +160,7 @@ async def get_rate_limit_key(request: Request) -> str:
     if auth_header and auth_header.startswith("Bearer "):
         token = auth_header.split(" ")[1]
         try:
-            verified_token = verify_token(
-                token, VerifyTokenOptions(secret_key=settings.clerk_secret_key)
-            )
+            verified_token = verify_request_token(request, token)
             user_id = verified_token.get("sub")
             if user_id:
                 return f"user:{user_id}"
@@ -22,3 +170,146 @@ async def get_rate_limit_key(request: Request) -> str:
 
     ip = request.client.host if request.client else "127.0.0.1"
     return f"ip:{ip}"
+
+
+@dataclass
+class _Lease:
+    tokens: int = 0
+    expires_at: float = 0.0
+    size: int = 1
+    retry_at: float = 0.0
+    # Wall clock ms when the lease was charged, for refunding unspent tokens.
+    charged_ms: int = 0
+
+
+class RateLimiter:
+    """App-wide rate limit dependency: the global limits plus the route's own
+    (see `rate_limit`), evaluated in a single Lua call per request. Global
+    limits count requests; route limits with a `cost` count its units, and a
+    request costing more than such a limit allows at all is rejected outright.
+
+    A client that keeps calling a route is granted a small lease of requests
+    at a time: it doubles each time the client spends a lease before it
+    expires, up to `max_lease` and `lease_share` of the remaining capacity,
+    and drops back to one request otherwise. The lease is charged in Redis
+    up front and spent in-process for up to `lease_seconds`, so busy clients
+    skip most round trips and replicas can never admit more than the limit
+    together. Requests left unspent when a lease expires are refunded with
+    the client's next call, so bursty clients get their full quota.
+    A rejected client is rejected locally until its Retry-After has passed.
+
+    Counters are kept per client and route. Redis errors let the request
+    through.
+    """
+
+    def __init__(
+        self,
+        *limits: RateLimit,
+        lease_share: float = 0.5,
+        lease_seconds: float = 1.0,
+        max_lease: int = 16,
+        max_local_keys: int = 10_000,
+    ) -> None:
+        self.limits = limits
+        self.lease_share = lease_share
+        self.lease_seconds = lease_seconds
+        self.max_lease = max_lease
+        self.max_local_keys = max_local_keys
+        self._leases: OrderedDict[str, _Lease] = OrderedDict()
+        self._script: AsyncScript | None = None
+
+    async def __call__(self, request: Request) -> None:
+        route_limits = getattr(request.scope.get("endpoint"), RATE_LIMITS_ATTR, NO_ROUTE_LIMITS)
+        cost = await route_limits.cost(request) if route_limits.cost else 1
+        charges = [(limit, 1) for limit in self.limits]
+        charges += [(limit, cost) for limit in route_limits.limits]
+        if not charges:
+            return
+        # Would never fit, however long the client waits.
+        if any(weight > limit.times for limit, weight in charges):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="Request costs more than its rate limit allows",
+            )
+
+        route = request.scope.get("route")
+        path = getattr(route, "path", request.url.path)
+        key = f"{await get_rate_limit_key(request)}:{request.method}:{path}"
+
+        retry_after_ms = await self.hit(key, charges)
+        if retry_after_ms:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too Many Requests",
+                headers={"Retry-After": str(ceil(retry_after_ms / 1000))},
+            )
+
+    async def hit(self, key: str, charges: Sequence[Charge]) -> int:
+        """Charge one request's weight to each limit; returns 0 or the ms until
+        retrying can succeed. Requests weighing more than 1 always go to Redis."""
+        lease = self._lease(key)
+        now = time.monotonic()
+        if now < lease.retry_at:
+            return ceil((lease.retry_at - now) * 1000)
+
+        weighted = any(weight > 1 for _, weight in charges)
+        requested = 1
+        refund = 0
+        if not weighted:
+            if now < lease.expires_at:
+                if lease.tokens > 0:
+                    lease.tokens -= 1
+                    return 0
+                lease.size = min(self.max_lease, lease.size * 2)
+            else:
+                lease.size = 1
+                refund, lease.tokens = lease.tokens, 0
+            requested = lease.size
+
+        now_ms = int(time.time() * 1000)
+        try:
+            granted, retry_after_ms = await self._evaluate(
+                key, charges, requested, now_ms, (refund, lease.charged_ms)
+            )
+        except RedisError:
+            logger.warning("Rate limit check failed; letting the request through", exc_info=True)
+            return 0
+
+        # Weighted rejections aren't cached: a lighter request may still fit.
+        if not weighted:
+            lease.tokens = max(0, granted - 1)
+            lease.charged_ms = now_ms
+            lease.expires_at = now + self.lease_seconds
+            lease.retry_at = now + retry_after_ms / 1000
+        return retry_after_ms
+
+    async def _evaluate(
+        self,
+        key: str,
+        charges: Sequence[Charge],
+        requested: int,
+        now_ms: int,
+        refund: tuple[int, int] = (0, 0),
+    ) -> tuple[int, int]:
+        redis = get_redis()
+        if self._script is None:
+            self._script = redis.register_script(SLIDING_WINDOW_LUA)
+        args: list[Any] = [now_ms, requested, self.lease_share, *refund]
+        for limit, weight in charges:
+            args += [limit.times, limit.window_ms, weight]
+        granted, retry_after_ms = await self._script(
+            keys=[f"{KEY_PREFIX}:{key}:{limit.name}" for limit, _ in charges],
+            args=args,
+            client=redis,
+        )
+        return int(granted), int(retry_after_ms)
+
+    def _lease(self, key: str) -> _Lease:
+        lease = self._leases.get(key)
+        if lease is None:
+            lease = self._leases[key] = _Lease()
+            while len(self._leases) > self.max_local_keys:
+                self._leases.popitem(last=False)
+        else:
+            self._leases.move_to_end(key)
+        return lease
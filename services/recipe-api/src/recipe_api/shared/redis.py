@@ -0,0 +1,29 @@
+from redis import Redis
+from redis import asyncio as aioredis
+
+from recipe_api.shared.config import settings
+
+_client: aioredis.Redis | None = None
+_sync_client: Redis | None = None
+
+
+def get_redis() -> aioredis.Redis:
+    global _client
+    if _client is None:
+        _client = aioredis.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
+    return _client
+
+
+def get_sync_redis() -> Redis:
+    """Blocking client for code running outside the event loop (services, activities)."""
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = Redis.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
+    return _sync_client
+
+
+async def close_redis() -> None:
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
@@ -1,7 +1,15 @@
+from recipe_api.shared.services.embedding_cache import EmbeddingCache
+from recipe_api.shared.services.embedding_executor import (
+    EmbeddingExecutor,
+    get_embedding_executor,
+)
 from recipe_api.shared.services.embeddings import EmbeddingService, get_embedding_service
 from recipe_api.shared.services.llm import LLMService, get_llm_service
 
 __all__ = [
+    "EmbeddingCache",
+    "EmbeddingExecutor",
+    "get_embedding_executor",
     "EmbeddingService",
     "get_embedding_service",
     "LLMService",
@@ -0,0 +1,154 @@
+import hashlib
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from recipe_api.shared.models.embedding_cache import EmbeddingCacheEntry
+from recipe_api.shared.services.embedding_executor import EmbeddingExecutor
+from recipe_api.shared.services.embeddings import EmbeddingService
+
+# Hits refresh `last_used_at` only once it is this old, so reads rarely write.
+TOUCH_INTERVAL = timedelta(days=1)
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def prune_embedding_cache(session: Session, unused_for: timedelta) -> int:
+    """Delete entries not hit within `unused_for`; returns how many."""
+    result = session.exec(
+        delete(EmbeddingCacheEntry).where(
+            col(EmbeddingCacheEntry.last_used_at) < datetime.utcnow() - unused_for
+        )
+    )
+    return result.rowcount
+
+
+class EmbeddingCache:
+    """Content-addressed store of document vectors in the `embedding_cache` table.
+
+    Texts are looked up in bulk by (model, sha256 of the whitespace-normalized
+    text); only the misses are run through the model, in a single batch, and
+    written back in the caller's transaction. Search queries don't go through
+    here, they have their own Redis-backed cache.
+
+    `encode_batch` runs the model inline and suits batch jobs;
+    `encode_batch_async` hands inference to the embedding executor's thread.
+
+    Entries record when they were last hit, and `prune_embedding_cache` drops
+    the ones unused for a while: texts of edited or deleted recipes and of retired models.
+    """
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        executor: EmbeddingExecutor | None = None,
+    ) -> None:
+        self.embedding_service = embedding_service
+        self.executor = executor
+
+    def encode_batch(self, session: Session, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+
+        model_id = self.embedding_service.model_id
+        hashes = [content_hash(text) for text in texts]
+        entries = session.exec(self._lookup(model_id, hashes)).all()
+        vectors = self._cached(entries)
+        touch = self._touch(model_id, entries)
+        if touch is not None:
+            session.exec(touch)
+
+        missing = self._missing(hashes, texts, vectors)
+        if missing:
+            encoded = self.embedding_service.encode_batch(list(missing.values()))
+            vectors.update(zip(missing, encoded, strict=True))
+            session.exec(self._store(model_id, missing, vectors))
+
+        return [vectors[h] for h in hashes]
+
+    async def encode_batch_async(
+        self, session: AsyncSession, texts: list[str]
+    ) -> list[list[float]]:
+        if not texts:
+            return []
+        assert self.executor is not None, "encode_batch_async needs an EmbeddingExecutor"
+
+        model_id = self.embedding_service.model_id
+        hashes = [content_hash(text) for text in texts]
+        entries = (await session.exec(self._lookup(model_id, hashes))).all()
+        vectors = self._cached(entries)
+        touch = self._touch(model_id, entries)
+        if touch is not None:
+            await session.exec(touch)
+
+        missing = self._missing(hashes, texts, vectors)
+        if missing:
+            encoded = await self.executor.encode_batch(list(missing.values()))
+            vectors.update(zip(missing, encoded, strict=True))
+            await session.exec(self._store(model_id, missing, vectors))
+
+        return [vectors[h] for h in hashes]
+
+    def encode(self, session: Session, text: str) -> list[float]:
+        return self.encode_batch(session, [text])[0]
+
+    def _lookup(self, model_id: str, hashes: list[str]) -> Any:
+        return select(EmbeddingCacheEntry).where(
+            EmbeddingCacheEntry.model == model_id,
+            col(EmbeddingCacheEntry.content_hash).in_(set(hashes)),
+        )
+
+    def _cached(self, entries: Sequence[EmbeddingCacheEntry]) -> dict[str, list[float]]:
+        return {entry.content_hash: list(entry.embedding) for entry in entries}
+
+    def _touch(self, model_id: str, entries: Sequence[EmbeddingCacheEntry]) -> Any:
+        now = datetime.utcnow()
+        stale = [e.content_hash for e in entries if e.last_used_at < now - TOUCH_INTERVAL]
+        if not stale:
+            return None
+        return (
+            update(EmbeddingCacheEntry)
+            .where(
+                col(EmbeddingCacheEntry.model) == model_id,
+                col(EmbeddingCacheEntry.content_hash).in_(stale),
+            )
+            .values(last_used_at=now)
+        )
+
+    def _missing(
+        self, hashes: list[str], texts: list[str], vectors: dict[str, list[float]]
+    ) -> dict[str, str]:
+        missing = {h: normalize_text(text) for h, text in zip(hashes, texts, strict=True)}
+        return {h: text for h, text in missing.items() if h not in vectors}
+
+    def _store(
+        self, model_id: str, missing: dict[str, str], vectors: dict[str, list[float]]
+    ) -> Any:
+        now = datetime.utcnow()
+        return (
+            insert(EmbeddingCacheEntry)
+            .values(
+                [
+                    {
+                        "model": model_id,
+                        "content_hash": h,
+                        "embedding": vectors[h],
+                        "created_at": now,
+                        "last_used_at": now,
+                    }
+                    for h in missing
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["model", "content_hash"])
+        )
@@ -0,0 +1,117 @@
+import asyncio
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from recipe_api.shared.config import settings
+from recipe_api.shared.services.embeddings import EmbeddingService, get_embedding_service
+
+
+class EmbeddingExecutor:
+    """Coalesces concurrent encode requests into batched forward passes.
+
+    Requests are queued and flushed as one `encode_batch` call once
+    `max_batch_size` texts are waiting or `max_wait_ms` passed since the first
+    one arrived. Inference runs on a dedicated thread, so awaiting callers never
+    block the event loop, and requests arriving while a batch is running are
+    picked up together by the next flush.
+    """
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        self.embedding_service = embedding_service
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding")
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future[list[float]]]] | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._worker is not None and not self._worker.done():
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run(), name="embedding-executor")
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._worker
+        self._worker = None
+
+        assert self._queue is not None
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Embedding executor stopped"))
+
+    async def encode(self, text: str) -> list[float]:
+        self.start()
+        assert self._queue is not None
+        future: asyncio.Future[list[float]] = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def encode_batch(self, texts: list[str]) -> list[list[float]]:
+        return list(await asyncio.gather(*(self.encode(text) for text in texts)))
+
+    async def _collect(self) -> list[tuple[str, asyncio.Future[list[float]]]]:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            pending = [(text, future) for text, future in batch if not future.cancelled()]
+            if not pending:
+                continue
+
+            try:
+                vectors = await loop.run_in_executor(
+                    self._pool,
+                    self.embedding_service.encode_batch,
+                    [text for text, _ in pending],
+                )
+            except asyncio.CancelledError:
+                for _, future in pending:
+                    future.cancel()
+                raise
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), vector in zip(pending, vectors, strict=True):
+                if not future.done():
+                    future.set_result(vector)
+
+
+@lru_cache
+def get_embedding_executor() -> EmbeddingExecutor:
+    return EmbeddingExecutor(
+        get_embedding_service(),
+        max_batch_size=settings.embedding_batch_max_size,
+        max_wait_ms=settings.embedding_batch_max_wait_ms,
+    )
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from recipe_api.shared.config import settings
+from recipe_api.shared.db import get_async_db_session
+from recipe_api.shared.models.embedding_version import EmbeddingVersion, EmbeddingVersionStatus
+
+logger = logging.getLogger(__name__)
+
+
+class ActiveVersion(NamedTuple):
+    id: int
+    model: str
+
+
+class EmbeddingVersionUnavailableError(RuntimeError):
+    """The active embedding version has never been loaded and can't be right now."""
+
+
+def select_active_version() -> Any:
+    return select(EmbeddingVersion.id, EmbeddingVersion.model).where(
+        EmbeddingVersion.status == EmbeddingVersionStatus.ACTIVE
+    )
+
+
+def activate_default_version() -> Any:
+    """Make `settings.embedding_model` ACTIVE on a database that has no version yet."""
+    now = datetime.utcnow()
+    return (
+        insert(EmbeddingVersion)
+        .values(
+            model=settings.embedding_model,
+            status=EmbeddingVersionStatus.ACTIVE,
+            created_at=now,
+            activated_at=now,
+        )
+        # Another process may have won the race for the single ACTIVE row.
+        .on_conflict_do_nothing(index_elements=["status"], index_where=text("status = 'ACTIVE'"))
+    )
+
+
+class ActiveEmbeddingModel:
+    """The ACTIVE `embedding_versions` row: the model to encode with and the
+    version id whose `recipe_embeddings` rows search reads and writes update.
+
+    `get` loads it over the async engine and caches it per process for
+    `embedding_version_refresh_seconds`, so a swap is picked up by every API
+    replica and worker within that window without a restart. A database that
+    never ran a re-embed gets a version for `settings.embedding_model` on
+    first lookup. Calling the instance returns the last loaded model without
+    any I/O; request paths await `get` (or `for_write`) before encoding.
+    """
+
+    def __init__(
+        self,
+        refresh_seconds: float,
+        session_factory: Callable[[], AsyncSession] = get_async_db_session,
+    ) -> None:
+        self.refresh_seconds = refresh_seconds
+        self.session_factory = session_factory
+        self._version: ActiveVersion | None = None
+        self._expires_at = 0.0
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    def __call__(self) -> str:
+        return self._version.model if self._version else settings.embedding_model
+
+    async def get(self) -> ActiveVersion:
+        """The active version; raises `EmbeddingVersionUnavailableError` if it
+        was never loaded and loading fails. A failed refresh keeps the last one."""
+        if self._version is None or time.monotonic() >= self._expires_at:
+            async with self._refresh_lock():
+                if self._version is None or time.monotonic() >= self._expires_at:
+                    loaded = await self._load()
+                    if loaded is not None or self._version is not None:
+                        self._version = loaded or self._version
+                        self._expires_at = time.monotonic() + self.refresh_seconds
+
+        if self._version is None:
+            raise EmbeddingVersionUnavailableError(
+                "The active embedding version could not be loaded"
+            )
+        return self._version
+
+    async def for_write(self, session: AsyncSession) -> ActiveVersion:
+        """The active version, share-locked in `session`'s transaction.
+
+        A swap locks the ACTIVE row, so it waits for this transaction: rows
+        written here are either re-encoded by the swap's catch-up or written
+        after it under the new version. If the cached version was retired in
+        the meantime it is replaced, so callers encode with the right model
+        as long as they call this first.
+        """
+        await self.get()
+        # A row retired while we waited drops out of the result; the new
+        # ACTIVE row is only visible to a fresh statement.
+        for _ in range(2):
+            row = (await session.exec(select_active_version().with_for_update(read=True))).first()
+            if row is not None:
+                version = ActiveVersion(*row)
+                if version != self._version:
+                    self._version = version
+                    self._expires_at = time.monotonic() + self.refresh_seconds
+                return version
+        raise EmbeddingVersionUnavailableError("No embedding version is active")
+
+    def invalidate(self) -> None:
+        self._expires_at = 0.0
+
+    def _refresh_lock(self) -> asyncio.Lock:
+        # Locks bind to the loop that first waits on them.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock, self._lock_loop = asyncio.Lock(), loop
+        return self._lock
+
+    async def _load(self) -> ActiveVersion | None:
+        try:
+            async with self.session_factory() as session:
+                row = (await session.exec(select_active_version())).first()
+                if row is None:
+                    await session.exec(activate_default_version())
+                    await session.commit()
+                    row = (await session.exec(select_active_version())).first()
+                return ActiveVersion(*row) if row else None
+        except SQLAlchemyError:
+            logger.warning("Could not load the active embedding version", exc_info=True)
+            return None
+
+
+active_embedding_model = ActiveEmbeddingModel(settings.embedding_version_refresh_seconds)
@@ -1,16 +1,101 @@
+import threading
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from sentence_transformers import SentenceTransformer
+from recipe_api.shared.config import EmbeddingBackend, settings
+from recipe_api.shared.services.embedding_versions import (
+    ActiveEmbeddingModel,
+    active_embedding_model,
+)
 
-from recipe_api.shared.config import settings
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
+# ONNX exports shipped in the sentence-transformers model repos. The int8 file
+# is dynamically quantized and runs on any AVX2 CPU.
+DEFAULT_ONNX_FILES: dict[EmbeddingBackend, str] = {
+    "onnx": "onnx/model.onnx",
+    "onnx-int8": "onnx/model_quint8_avx2.onnx",
+}
+
+
+def load_embedding_model(model_name: str, backend: EmbeddingBackend) -> "SentenceTransformer":
+    # Imported here: sentence_transformers pulls in torch, which processes
+    # that never encode (migrations, SDK generation) shouldn't pay for.
+    from sentence_transformers import SentenceTransformer
+
+    if backend == "torch":
+        return SentenceTransformer(model_name)
+
+    file_name = settings.embedding_onnx_file or DEFAULT_ONNX_FILES[backend]
+    return SentenceTransformer(
+        model_name, backend="onnx", model_kwargs={"file_name": file_name}
+    )
 
-class EmbeddingService:
+
+class EmbeddingModelRegistry:
+    """Loads each SentenceTransformer at most once per process, on first use.
+
+    Every EmbeddingService in the API process or a Temporal worker shares the
+    loaded weights, no matter how many services or concurrent activities ask.
+    """
 
     def __init__(self) -> None:
-        self.model = SentenceTransformer(settings.embedding_model)
+        self._models: dict[tuple[str, EmbeddingBackend], SentenceTransformer] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model_name: str, backend: EmbeddingBackend = "torch") -> "SentenceTransformer":
+        key = (model_name, backend)
+        model = self._models.get(key)
+        if model is None:
+            with self._lock:
+                model = self._models.get(key)
+                if model is None:
+                    model = load_embedding_model(model_name, backend)
+                    self._models[key] = model
+        return model
+
+
+model_registry = EmbeddingModelRegistry()
+
+
+class EmbeddingService:
+    """Encodes text with a fixed model, or by default the active embedding version's."""
+
+    def __init__(
+        self,
+        model_name: str | None = None,
+        registry: EmbeddingModelRegistry = model_registry,
+        backend: EmbeddingBackend | None = None,
+        active_model: ActiveEmbeddingModel = active_embedding_model,
+    ) -> None:
+        self._model_name = model_name
+        self._active_model = active_model
+        self.backend = backend or settings.embedding_backend
+        self.registry = registry
         self.dimension = settings.embedding_dimension
 
+    @property
+    def model_name(self) -> str:
+        return self._model_name or self._active_model()
+
+    @property
+    def model_id(self) -> str:
+        """Identifies the vector space: backends of one model differ slightly."""
+        if self.backend == "torch":
+            return self.model_name
+        return f"{self.model_name}:{self.backend}"
+
+    async def current_model_id(self) -> str:
+        """`model_id`, after reloading the active version if its lookup is stale."""
+        if self._model_name is None:
+            await self._active_model.get()
+        return self.model_id
+
+    @property
+    def model(self) -> "SentenceTransformer":
+        return self.registry.get(self.model_name, self.backend)
+
     def encode(self, text: str) -> list[float]:
         embedding = self.model.encode(text, convert_to_numpy=True)
         return embedding.tolist()
@@ -0,0 +1,150 @@
+import asyncio
+import contextlib
+import json
+import logging
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import httpx
+import jwt
+
+from recipe_api.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Tokens signed by an unknown kid trigger at most one early JWKS fetch per interval.
+UNKNOWN_KID_REFETCH_SECONDS = 10.0
+CLOCK_SKEW = timedelta(seconds=5)
+
+
+class JWKSKeyStore:
+    """Clerk's session-token signing keys, held in memory so verification
+    never waits on Clerk.
+
+    Keys come from, in order: `clerk_jwt_key` (the instance's PEM public key),
+    `clerk_jwks_file` (a saved JWKS document), or Clerk's `/v1/jwks` endpoint.
+    The first two are static, for offline and test environments. Remote keys
+    are loaded at startup and refreshed by `refresh_forever`; they are never
+    fetched on the request path. A token naming a kid the store hasn't seen
+    fails verification and wakes the refresh task for an early fetch, so a
+    rotated key is picked up within moments.
+    """
+
+    def __init__(
+        self,
+        jwt_key: str | None = None,
+        jwks_file: str | None = None,
+        api_url: str = "https://api.clerk.com",
+        secret_key: str | None = None,
+    ) -> None:
+        self.jwt_key = jwt_key or None
+        self.jwks_file = jwks_file or None
+        self.api_url = api_url
+        self.secret_key = secret_key
+        self._keys: dict[str | None, Any] = {}
+        self._fetched_at = 0.0
+        self._refresh_requested_at = 0.0
+        self._lock = threading.Lock()
+        self._wake: asyncio.Event | None = None
+        self._wake_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def remote(self) -> bool:
+        return self.jwt_key is None and self.jwks_file is None
+
+    def load(self) -> None:
+        if self.jwt_key is not None:
+            # A single PEM key verifies every token, whatever its kid. Env
+            # files often carry it on one line with literal "\n"s.
+            pem = self.jwt_key.replace("\\n", "\n")
+            rsa = jwt.algorithms.RSAAlgorithm(jwt.algorithms.RSAAlgorithm.SHA256)
+            self._keys = {None: rsa.prepare_key(pem)}
+        elif self.jwks_file is not None:
+            self._keys = self._parse(json.loads(Path(self.jwks_file).read_text()))
+        else:
+            self._keys = self._parse(self._fetch())
+        self._fetched_at = time.monotonic()
+        logger.info(f"Loaded {len(self._keys)} Clerk signing key(s)")
+
+    def verify(self, token: str) -> dict[str, Any]:
+        """Decode a Clerk session token, checking its signature, `exp` and `nbf`."""
+        kid = jwt.get_unverified_header(token).get("kid")
+        claims: dict[str, Any] = jwt.decode(
+            token,
+            self._key(kid),
+            algorithms=["RS256"],
+            options={"verify_iss": False},
+            leeway=CLOCK_SKEW,
+        )
+        return claims
+
+    async def refresh_forever(self, interval_seconds: float) -> None:
+        """Reload remote keys every `interval_seconds`, or early when a token
+        names an unknown kid; keeps the old keys on failure."""
+        if not self.remote:
+            return
+        self._wake_loop, self._wake = asyncio.get_running_loop(), asyncio.Event()
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), interval_seconds)
+            self._wake.clear()
+            try:
+                await asyncio.to_thread(self.load)
+            except (httpx.HTTPError, jwt.PyJWTError, ValueError):
+                logger.warning("Could not refresh Clerk signing keys", exc_info=True)
+
+    def _key(self, kid: str | None) -> Any:
+        key = self._keys.get(None, self._keys.get(kid))
+        if key is None:
+            if self.remote:
+                self._request_refresh()
+            else:
+                with self._lock:
+                    if not self._keys:
+                        self.load()
+                key = self._keys.get(None, self._keys.get(kid))
+        if key is None:
+            raise jwt.InvalidKeyError(f"No Clerk signing key matches kid {kid!r}")
+        return key
+
+    def _request_refresh(self) -> None:
+        # Called from the event loop and from sync dependencies' threads alike.
+        with self._lock:
+            now = time.monotonic()
+            if now - max(self._fetched_at, self._refresh_requested_at) < UNKNOWN_KID_REFETCH_SECONDS:
+                return
+            self._refresh_requested_at = now
+        loop, wake = self._wake_loop, self._wake
+        if loop is not None and wake is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wake.set)
+
+    def _fetch(self) -> dict[str, Any]:
+        response = httpx.get(
+            f"{self.api_url}/v1/jwks",
+            headers={"Authorization": f"Bearer {self.secret_key}"},
+            timeout=5.0,
+        )
+        response.raise_for_status()
+        jwks: dict[str, Any] = response.json()
+        return jwks
+
+    def _parse(self, jwks: dict[str, Any]) -> dict[str | None, Any]:
+        keys: dict[str | None, Any] = {
+            key.key_id: key.key
+            for key in jwt.PyJWKSet.from_dict(jwks).keys
+            if key.key_id is not None
+        }
+        if not keys:
+            raise ValueError("The JWKS document has no signing keys")
+        return keys
+
+
+jwks_store = JWKSKeyStore(
+    jwt_key=settings.clerk_jwt_key,
+    jwks_file=settings.clerk_jwks_file,
+    api_url=settings.clerk_api_url,
+    secret_key=settings.clerk_secret_key,
+)
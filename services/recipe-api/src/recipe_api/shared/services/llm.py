@@ -1,10 +1,50 @@
-from openai import OpenAI
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from recipe_api.shared.config import settings
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+    from openai.types.chat import ChatCompletionMessageParam
+
+
+@lru_cache
+def get_async_openai_client() -> "AsyncOpenAI":
+    """The process-wide async vLLM client.
+
+    All callers share one httpx pool sized to the worker's activity
+    concurrency, so every running activity can keep a request in flight
+    without opening a new connection per call.
+    """
+    import httpx
+    from openai import AsyncOpenAI
+
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_connections,
+        ),
+        timeout=httpx.Timeout(
+            settings.llm_timeout_seconds, connect=settings.llm_connect_timeout_seconds
+        ),
+    )
+    return AsyncOpenAI(
+        base_url=settings.vllm_base_url,
+        api_key=settings.vllm_api_key or "EMPTY",
+        http_client=http_client,
+    )
+
+
+async def close_async_openai_client() -> None:
+    if get_async_openai_client.cache_info().currsize:
+        await get_async_openai_client().close()
+        get_async_openai_client.cache_clear()
+
 
 class LLMService:
     def __init__(self) -> None:
+        from openai import OpenAI
+
         self.client = OpenAI(
             base_url=settings.vllm_base_url,
             api_key=settings.vllm_api_key or "EMPTY",
@@ -18,14 +58,9 @@ class LLMService:
         temperature: float = 0.7,
         system_prompt: str | None = None,
     ) -> str:
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=messages,
+            messages=self._messages(prompt, system_prompt),
             max_tokens=max_tokens,
             temperature=temperature,
         )
@@ -39,8 +74,23 @@ class LLMService:
         temperature: float = 0.7,
         system_prompt: str | None = None,
     ) -> str:
-        # TODO: Use AsyncOpenAI for true async support
-        return self.generate(prompt, max_tokens, temperature, system_prompt)
+        response = await get_async_openai_client().chat.completions.create(
+            model=self.model,
+            messages=self._messages(prompt, system_prompt),
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+
+        return response.choices[0].message.content or ""
+
+    def _messages(
+        self, prompt: str, system_prompt: str | None
+    ) -> list["ChatCompletionMessageParam"]:
+        messages: list[ChatCompletionMessageParam] = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return messages
 
 
 def get_llm_service() -> LLMService:
@@ -0,0 +1,81 @@
+import importlib.util
+import time
+
+import numpy as np
+import pytest
+
+from recipe_api.shared.config import EmbeddingBackend, settings
+from recipe_api.shared.services.embeddings import EmbeddingModelRegistry, EmbeddingService
+
+needs_onnx = pytest.mark.skipif(
+    importlib.util.find_spec("onnxruntime") is None,
+    reason="ONNX backends need the 'onnx' extra",
+)
+ONNX_BACKENDS = [pytest.param(backend, marks=needs_onnx) for backend in ("onnx", "onnx-int8")]
+
+SAMPLE_TEXTS = [
+    "Creamy garlic parmesan pasta with sauteed mushrooms",
+    "chicken dinner",
+    "vegan dessert",
+    "Quick breakfast burrito with scrambled eggs, black beans and salsa",
+    "Slow-cooked beef stew with carrots, potatoes and fresh thyme",
+    "flour sugar butter eggs vanilla baking powder",
+    "Refreshing watermelon mint cooler for hot summer afternoons",
+    "gluten-free dairy-free lunch bowl",
+]
+
+# Minimum cosine similarity to the reference torch model, per text.
+PARITY_THRESHOLDS: dict[EmbeddingBackend, float] = {
+    "onnx": 0.999,
+    "onnx-int8": 0.97,
+}
+
+
+@pytest.fixture(scope="module", name="registry")
+def registry_fixture() -> EmbeddingModelRegistry:
+    return EmbeddingModelRegistry()
+
+
+def _cosine(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    a = a / np.linalg.norm(a, axis=1, keepdims=True)
+    b = b / np.linalg.norm(b, axis=1, keepdims=True)
+    return np.sum(a * b, axis=1)
+
+
+@pytest.mark.e2e
+@pytest.mark.parametrize("backend", ONNX_BACKENDS)
+def test_backend_matches_reference_model(
+    registry: EmbeddingModelRegistry, backend: EmbeddingBackend
+) -> None:
+    reference = EmbeddingService(settings.embedding_model, registry, backend="torch")
+    candidate = EmbeddingService(settings.embedding_model, registry, backend=backend)
+
+    expected = np.array(reference.encode_batch(SAMPLE_TEXTS))
+    actual = np.array(candidate.encode_batch(SAMPLE_TEXTS))
+
+    assert actual.shape == expected.shape == (len(SAMPLE_TEXTS), settings.embedding_dimension)
+    assert _cosine(actual, expected).min() >= PARITY_THRESHOLDS[backend]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("backend", ["torch", *ONNX_BACKENDS])
+def test_backend_throughput(registry: EmbeddingModelRegistry, backend: EmbeddingBackend) -> None:
+    service = EmbeddingService(settings.embedding_model, registry, backend=backend)
+    service.encode_batch(SAMPLE_TEXTS)  # warm up
+
+    rounds = 50
+    start = time.perf_counter()
+    for i in range(rounds):
+        service.encode(SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)])
+    single_per_sec = rounds / (time.perf_counter() - start)
+
+    batch = SAMPLE_TEXTS * 4
+    start = time.perf_counter()
+    for _ in range(rounds // 5):
+        service.encode_batch(batch)
+    batched_per_sec = (rounds // 5) * len(batch) / (time.perf_counter() - start)
+
+    print(
+        f"\n{backend:<10} {single_per_sec:8.1f} texts/s single  "
+        f"{batched_per_sec:8.1f} texts/s batched"
+    )
@@ -0,0 +1,86 @@
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import update
+from sqlmodel import Session, col, select
+
+from recipe_api.shared.models.embedding_cache import EmbeddingCacheEntry
+from recipe_api.shared.services.embedding_cache import (
+    EmbeddingCache,
+    content_hash,
+    prune_embedding_cache,
+)
+
+
+@pytest.fixture(name="embedding_service")
+def embedding_service_fixture() -> Mock:
+    service = Mock()
+    service.model_id = f"test-model-{uuid.uuid4()}"
+    service.encode_batch.side_effect = lambda texts: [
+        [float(len(text)), 1.0, 0.0] for text in texts
+    ]
+    return service
+
+
+@pytest.mark.unit
+def test_content_hash_ignores_whitespace_differences() -> None:
+    assert content_hash("  Garlic   butter\nsauce ") == content_hash("Garlic butter sauce")
+    assert content_hash("Garlic butter sauce") != content_hash("garlic butter sauce")
+
+
+@pytest.mark.e2e
+def test_only_unseen_texts_are_encoded(session: Session, embedding_service: Mock) -> None:
+    cache = EmbeddingCache(embedding_service)
+
+    first = cache.encode_batch(session, ["tomato soup", "basil", "tomato  soup"])
+    session.commit()
+    second = cache.encode_batch(session, ["basil", "onion", "tomato soup"])
+    session.commit()
+
+    assert [call.args[0] for call in embedding_service.encode_batch.call_args_list] == [
+        ["tomato soup", "basil"],
+        ["onion"],
+    ]
+    assert first[0] == first[2] == second[2]
+    assert first[1] == second[0]
+
+
+@pytest.mark.e2e
+def test_entries_are_scoped_to_the_model(session: Session, embedding_service: Mock) -> None:
+    EmbeddingCache(embedding_service).encode(session, "pancakes")
+    session.commit()
+
+    other_model = Mock(model_id=f"other-model-{uuid.uuid4()}")
+    other_model.encode_batch.return_value = [[0.0, 0.0, 1.0]]
+    assert EmbeddingCache(other_model).encode(session, "pancakes") == [0.0, 0.0, 1.0]
+    other_model.encode_batch.assert_called_once_with(["pancakes"])
+
+
+@pytest.mark.e2e
+def test_prune_drops_only_unused_entries(session: Session, embedding_service: Mock) -> None:
+    cache = EmbeddingCache(embedding_service)
+    cache.encode_batch(session, ["old stew", "fresh salad"])
+    session.commit()
+
+    long_ago = datetime.utcnow() - timedelta(days=90)
+    session.exec(
+        update(EmbeddingCacheEntry)
+        .where(col(EmbeddingCacheEntry.model) == embedding_service.model_id)
+        .values(last_used_at=long_ago)
+    )
+    session.commit()
+    # A hit refreshes the entry, so it survives the prune.
+    cache.encode(session, "fresh salad")
+    session.commit()
+
+    assert prune_embedding_cache(session, timedelta(days=30)) >= 1
+    session.commit()
+
+    remaining = session.exec(
+        select(EmbeddingCacheEntry.content_hash).where(
+            EmbeddingCacheEntry.model == embedding_service.model_id
+        )
+    ).all()
+    assert remaining == [content_hash("fresh salad")]
@@ -0,0 +1,52 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from recipe_api.shared.services.embedding_executor import EmbeddingExecutor
+from recipe_api.shared.services.embeddings import EmbeddingService
+
+
+def _fake_embedding_service() -> Mock:
+    service = Mock(spec=EmbeddingService)
+    service.encode_batch.side_effect = lambda texts: [[float(len(text))] for text in texts]
+    return service
+
+
+@pytest.mark.unit
+async def test_concurrent_requests_are_flushed_as_one_batch() -> None:
+    service = _fake_embedding_service()
+    executor = EmbeddingExecutor(service, max_batch_size=32, max_wait_ms=50)
+
+    texts = [f"query {'x' * i}" for i in range(10)]
+    vectors = await asyncio.gather(*(executor.encode(text) for text in texts))
+    await executor.stop()
+
+    assert vectors == [[float(len(text))] for text in texts]
+    service.encode_batch.assert_called_once_with(texts)
+
+
+@pytest.mark.unit
+async def test_batches_are_capped_at_max_batch_size() -> None:
+    service = _fake_embedding_service()
+    executor = EmbeddingExecutor(service, max_batch_size=4, max_wait_ms=50)
+
+    vectors = await executor.encode_batch([str(i) for i in range(10)])
+    await executor.stop()
+
+    assert len(vectors) == 10
+    assert [len(call.args[0]) for call in service.encode_batch.call_args_list] == [4, 4, 2]
+
+
+@pytest.mark.unit
+async def test_model_errors_propagate_to_every_caller() -> None:
+    service = Mock(spec=EmbeddingService)
+    service.encode_batch.side_effect = RuntimeError("model unavailable")
+    executor = EmbeddingExecutor(service, max_wait_ms=10)
+
+    results = await asyncio.gather(
+        executor.encode("a"), executor.encode("b"), return_exceptions=True
+    )
+    await executor.stop()
+
+    assert all(isinstance(result, RuntimeError) for result in results)
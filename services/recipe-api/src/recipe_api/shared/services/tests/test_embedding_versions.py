@@ -0,0 +1,41 @@
+from types import TracebackType
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from recipe_api.shared.services.embedding_versions import (
+    ActiveEmbeddingModel,
+    ActiveVersion,
+    EmbeddingVersionUnavailableError,
+)
+
+
+class UnreachableSession:
+    async def __aenter__(self) -> "UnreachableSession":
+        raise OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        return None
+
+
+@pytest.mark.unit
+async def test_unloadable_version_raises_unavailable() -> None:
+    active_model = ActiveEmbeddingModel(30.0, session_factory=UnreachableSession)  # type: ignore[arg-type]
+
+    with pytest.raises(EmbeddingVersionUnavailableError):
+        await active_model.get()
+
+
+@pytest.mark.unit
+async def test_failed_refresh_keeps_the_last_version() -> None:
+    active_model = ActiveEmbeddingModel(30.0, session_factory=UnreachableSession)  # type: ignore[arg-type]
+    active_model._version = ActiveVersion(3, "some/model")
+    active_model.invalidate()
+
+    assert await active_model.get() == ActiveVersion(3, "some/model")
+    assert active_model() == "some/model"
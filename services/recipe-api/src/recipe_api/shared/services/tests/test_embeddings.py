@@ -0,0 +1,42 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from recipe_api.shared.services import embeddings
+from recipe_api.shared.services.embeddings import EmbeddingModelRegistry, EmbeddingService
+
+
+@pytest.fixture(name="model_loads")
+def model_loads_fixture(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    loads: list[str] = []
+
+    def load_model(model_name: str, backend: str) -> Mock:
+        loads.append(model_name)
+        time.sleep(0.01)
+        return Mock()
+
+    monkeypatch.setattr(embeddings, "load_embedding_model", load_model)
+    return loads
+
+
+@pytest.mark.unit
+def test_registry_loads_each_model_once_under_concurrency(model_loads: list[str]) -> None:
+    registry = EmbeddingModelRegistry()
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        models = list(pool.map(lambda _: registry.get("model-a"), range(64)))
+
+    assert model_loads == ["model-a"]
+    assert all(model is models[0] for model in models)
+
+
+@pytest.mark.unit
+def test_services_share_the_model_and_load_it_lazily(model_loads: list[str]) -> None:
+    registry = EmbeddingModelRegistry()
+    services = [EmbeddingService("model-a", registry) for _ in range(6)]
+    assert model_loads == []
+
+    assert services[0].model is services[-1].model
+    assert model_loads == ["model-a"]
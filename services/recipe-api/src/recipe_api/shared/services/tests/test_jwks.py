@@ -0,0 +1,105 @@
+import asyncio
+import contextlib
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from recipe_api.shared.services.jwks import JWKSKeyStore
+
+
+@pytest.fixture(name="signing_key", scope="module")
+def signing_key_fixture() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _jwks(key: rsa.RSAPrivateKey, kid: str) -> dict[str, Any]:
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(key.public_key()))
+    return {"keys": [{**jwk, "kid": kid, "use": "sig", "alg": "RS256"}]}
+
+
+def _token(key: rsa.RSAPrivateKey, kid: str, expires_in: float = 60) -> str:
+    claims = {"sub": "user_123", "exp": int(time.time() + expires_in), "nbf": int(time.time())}
+    return jwt.encode(claims, key, algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.mark.unit
+def test_verifies_against_jwks_file(signing_key: rsa.RSAPrivateKey, tmp_path: Path) -> None:
+    jwks_file = tmp_path / "jwks.json"
+    jwks_file.write_text(json.dumps(_jwks(signing_key, "ins_1")))
+    store = JWKSKeyStore(jwks_file=str(jwks_file))
+
+    assert store.verify(_token(signing_key, "ins_1"))["sub"] == "user_123"
+    with pytest.raises(jwt.ExpiredSignatureError):
+        store.verify(_token(signing_key, "ins_1", expires_in=-60))
+    with pytest.raises(jwt.InvalidKeyError):
+        store.verify(_token(signing_key, "ins_2"))
+
+
+@pytest.mark.unit
+def test_verifies_against_single_line_pem(signing_key: rsa.RSAPrivateKey) -> None:
+    pem = signing_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    store = JWKSKeyStore(jwt_key=pem.replace("\n", "\\n"))
+
+    assert store.verify(_token(signing_key, "any-kid"))["sub"] == "user_123"
+
+    other = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    with pytest.raises(jwt.InvalidSignatureError):
+        store.verify(_token(other, "any-kid"))
+
+
+@pytest.mark.unit
+async def test_unknown_kid_wakes_the_refresh_instead_of_fetching_inline(
+    signing_key: rsa.RSAPrivateKey, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fetches: list[str] = []
+    served = {"kid": "ins_1"}
+
+    def fetch() -> dict[str, Any]:
+        fetches.append(served["kid"])
+        return _jwks(signing_key, served["kid"])
+
+    store = JWKSKeyStore(secret_key="sk_test")
+    monkeypatch.setattr(store, "_fetch", fetch)
+    store.load()
+    refresh = asyncio.create_task(store.refresh_forever(3600))
+    await asyncio.sleep(0)
+
+    for _ in range(3):
+        store.verify(_token(signing_key, "ins_1"))
+    assert fetches == ["ins_1"]
+
+    # A rotated key fails this request and is fetched in the background...
+    served["kid"] = "ins_2"
+    monkeypatch.setattr("recipe_api.shared.services.jwks.UNKNOWN_KID_REFETCH_SECONDS", 0.0)
+    with pytest.raises(jwt.InvalidKeyError):
+        store.verify(_token(signing_key, "ins_2"))
+    assert fetches == ["ins_1"]
+    monkeypatch.setattr("recipe_api.shared.services.jwks.UNKNOWN_KID_REFETCH_SECONDS", 60.0)
+    async with asyncio.timeout(5):
+        while True:
+            try:
+                claims = store.verify(_token(signing_key, "ins_2"))
+                break
+            except jwt.InvalidKeyError:
+                await asyncio.sleep(0.01)
+    assert claims["sub"] == "user_123"
+    assert fetches == ["ins_1", "ins_2"]
+
+    # ...and unknown kids can't make the store call out more than once per interval.
+    for _ in range(3):
+        with pytest.raises(jwt.InvalidKeyError):
+            store.verify(_token(signing_key, "forged"))
+    await asyncio.sleep(0.05)
+    assert fetches == ["ins_1", "ins_2"]
+
+    refresh.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await refresh
@@ -0,0 +1,77 @@
+import time
+from typing import Any
+
+import pytest
+from starlette.requests import Request
+
+from recipe_api.shared import deps
+from recipe_api.shared.services.token_claims import TokenClaimsCache, token_key
+
+
+def _request() -> Request:
+    return Request({"type": "http", "headers": []})
+
+
+@pytest.fixture(name="verify_calls")
+def verify_calls_fixture(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+
+    def verify(token: str) -> dict[str, Any]:
+        calls.append(token)
+        if token == "bad":
+            raise ValueError("invalid signature")
+        return {"sub": f"user-{token}", "exp": time.time() + 60}
+
+    deps.token_claims_cache.clear()
+    monkeypatch.setattr(deps, "verify_clerk_token", verify)
+    return calls
+
+
+@pytest.mark.unit
+def test_cache_drops_expired_and_unexpiring_tokens() -> None:
+    cache = TokenClaimsCache(maxsize=10)
+
+    cache.set("live", {"sub": "a", "exp": time.time() + 60})
+    cache.set("expired", {"sub": "b", "exp": time.time() - 1})
+    cache.set("no-exp", {"sub": "c"})
+
+    assert cache.get("live") == {"sub": "a", "exp": pytest.approx(time.time() + 60, abs=5)}
+    assert cache.get("expired") is None
+    assert cache.get("no-exp") is None
+
+
+@pytest.mark.unit
+def test_cache_evicts_least_recently_used() -> None:
+    cache = TokenClaimsCache(maxsize=2)
+    exp = time.time() + 60
+
+    cache.set("a", {"exp": exp})
+    cache.set("b", {"exp": exp})
+    cache.get("a")
+    cache.set("c", {"exp": exp})
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+@pytest.mark.unit
+def test_token_is_verified_once_across_requests(verify_calls: list[str]) -> None:
+    for _ in range(3):
+        request = _request()
+        assert deps.verify_request_token(request, "good")["sub"] == "user-good"
+        assert deps.verify_request_token(request, "good")["sub"] == "user-good"
+
+    assert verify_calls == ["good"]
+    assert deps.token_claims_cache.get(token_key("good")) is not None
+
+
+@pytest.mark.unit
+def test_rejected_token_is_verified_once_per_request(verify_calls: list[str]) -> None:
+    for _ in range(2):
+        request = _request()
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                deps.verify_request_token(request, "bad")
+
+    assert verify_calls == ["bad", "bad"]
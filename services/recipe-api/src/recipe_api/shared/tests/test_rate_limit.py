@@ -0,0 +1,142 @@
+import asyncio
+import uuid
+from collections.abc import Sequence
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from pydantic import BaseModel
+
+from recipe_api.shared.config import Settings
+from recipe_api.shared.rate_limit import (
+    KEY_PREFIX,
+    Charge,
+    RateLimit,
+    RateLimiter,
+    body_cost,
+    rate_limit,
+)
+from recipe_api.shared.redis import get_redis
+
+
+class Batch(BaseModel):
+    amount: int
+
+
+def _app(limiter: RateLimiter) -> FastAPI:
+    app = FastAPI(dependencies=[Depends(limiter)])
+
+    @app.get("/open")
+    async def open_route() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.get("/limited")
+    @rate_limit(RateLimit(times=2, seconds=60))
+    async def limited_route() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.get("/bursty")
+    @rate_limit(RateLimit(times=10, seconds=60))
+    async def bursty_route() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.post("/weighted")
+    @rate_limit(RateLimit(times=10, seconds=60), cost=body_cost(Batch, lambda b: b.amount))
+    async def weighted_route(batch: Batch) -> dict[str, int]:
+        return {"amount": batch.amount}
+
+    return app
+
+
+def _client(app: FastAPI) -> httpx.AsyncClient:
+    transport = httpx.ASGITransport(app=app, client=(str(uuid.uuid4()), 0))
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+@pytest.mark.e2e
+async def test_route_and_global_limits_apply_together(test_settings: Settings) -> None:
+    app = _app(RateLimiter(RateLimit(times=3, seconds=60), lease_seconds=0))
+
+    async with _client(app) as client:
+        limited = [(await client.get("/limited")).status_code for _ in range(3)]
+        opened = [(await client.get("/open")).status_code for _ in range(4)]
+        rejected = await client.get("/limited")
+
+    assert limited == [200, 200, 429]
+    assert opened == [200, 200, 200, 429]
+    # The full current window still weighs on the next one, so the wait can
+    # run past the end of this window but never past the next.
+    assert 0 < int(rejected.headers["Retry-After"]) <= 120
+
+
+@pytest.mark.e2e
+async def test_route_limits_charge_the_request_cost(test_settings: Settings) -> None:
+    app = _app(RateLimiter(lease_seconds=0))
+
+    async with _client(app) as client:
+        heavy = [(await client.post("/weighted", json={"amount": 4})).status_code for _ in range(3)]
+        # The two units left still fit a lighter request.
+        light = await client.post("/weighted", json={"amount": 2})
+        rejected = await client.post("/weighted", json={"amount": 1})
+
+    assert heavy == [200, 200, 429]
+    assert light.status_code == 200
+    assert rejected.status_code == 429
+
+
+@pytest.mark.unit
+async def test_requests_costing_more_than_the_limit_are_rejected() -> None:
+    app = _app(RateLimiter(lease_seconds=0))
+
+    async with _client(app) as client:
+        response = await client.post("/weighted", json={"amount": 11})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.e2e
+async def test_bursts_get_the_full_quota(test_settings: Settings) -> None:
+    app = _app(RateLimiter(lease_seconds=0.05))
+
+    statuses = []
+    async with _client(app) as client:
+        for _ in range(10):
+            statuses += [(await client.get("/bursty")).status_code for _ in range(2)]
+            # The lease expires with a request unspent, which is refunded.
+            await asyncio.sleep(0.1)
+
+    assert statuses == [200] * 10 + [429] * 10
+
+
+class CountingRateLimiter(RateLimiter):
+    redis_calls = 0
+
+    async def _evaluate(
+        self,
+        key: str,
+        charges: Sequence[Charge],
+        requested: int,
+        now_ms: int,
+        refund: tuple[int, int] = (0, 0),
+    ) -> tuple[int, int]:
+        self.redis_calls += 1
+        return await super()._evaluate(key, charges, requested, now_ms, refund)
+
+
+@pytest.mark.e2e
+async def test_leases_skip_redis_without_exceeding_the_limit(test_settings: Settings) -> None:
+    limiter = CountingRateLimiter(RateLimit(times=50, seconds=60), lease_seconds=60)
+    key = f"lease-test-{uuid.uuid4()}"
+    charges = [(limit, 1) for limit in limiter.limits]
+
+    assert [await limiter.hit(key, charges) for _ in range(50)] == [0] * 50
+    # Leases grow while they are used up, so most requests skip Redis.
+    assert limiter.redis_calls <= 15
+
+    counts = await get_redis().hgetall(f"{KEY_PREFIX}:{key}:{limiter.limits[0].name}")
+    assert sum(int(count) for count in counts.values()) == 50
+
+    # Past the limit, one call learns the wait and the rest are rejected locally.
+    calls = limiter.redis_calls
+    assert all([await limiter.hit(key, charges) > 0 for _ in range(10)])
+    assert limiter.redis_calls == calls + 1
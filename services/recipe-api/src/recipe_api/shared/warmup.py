@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from recipe_api.shared.db import warm_pool
+from recipe_api.shared.services.embedding_executor import get_embedding_executor
+from recipe_api.shared.services.embedding_versions import active_embedding_model
+from recipe_api.shared.services.jwks import jwks_store
+from recipe_api.shared.temporal import get_temporal_client
+
+logger = logging.getLogger(__name__)
+
+WARMUP_TEXTS = [
+    "creamy garlic pasta",
+    "quick vegan breakfast",
+    "chicken, rice, soy sauce, ginger",
+    "chocolate chip cookies",
+]
+
+
+@dataclass
+class WarmupStep:
+    name: str
+    run: Callable[[], Awaitable[object]]
+    # Optional steps only hold readiness back until their first attempt; if
+    # that fails they keep retrying in the background.
+    required: bool = True
+
+
+class Warmup:
+    """Runs startup warmup steps concurrently, retrying each until it succeeds.
+
+    The instance is ready once every required step succeeded and every
+    optional step was attempted at least once.
+    """
+
+    def __init__(
+        self,
+        steps: list[WarmupStep],
+        retry_seconds: float = 1.0,
+        max_retry_seconds: float = 30.0,
+    ) -> None:
+        self.steps = steps
+        self.retry_seconds = retry_seconds
+        self.max_retry_seconds = max_retry_seconds
+        self.pending = {step.name for step in steps}
+        self.errors: dict[str, str] = {}
+
+    @property
+    def ready(self) -> bool:
+        return not self.pending
+
+    async def run(self) -> None:
+        await asyncio.gather(*(self._run_step(step) for step in self.steps))
+
+    async def _run_step(self, step: WarmupStep) -> None:
+        delay = self.retry_seconds
+        while True:
+            try:
+                await step.run()
+            except Exception as e:
+                logger.warning(f"Warmup step {step.name} failed, retrying in {delay:.0f}s: {e}")
+                self.errors[step.name] = str(e)
+                if not step.required:
+                    self.pending.discard(step.name)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_retry_seconds)
+                continue
+
+            logger.info(f"Warmup step {step.name} done")
+            self.errors.pop(step.name, None)
+            self.pending.discard(step.name)
+            return
+
+
+async def warm_embedding_model() -> None:
+    # The active version decides which model the dummy batch loads.
+    await active_embedding_model.get()
+    await get_embedding_executor().encode_batch(WARMUP_TEXTS)
+
+
+def create_warmup() -> Warmup:
+    """Loads the embedding model with a dummy batch, pre-connects the DB pool and
+    Temporal, and loads Clerk's signing keys."""
+    return Warmup(
+        [
+            WarmupStep("embedding_model", warm_embedding_model),
+            WarmupStep("database", warm_pool),
+            WarmupStep("temporal", get_temporal_client, required=False),
+            # Until this succeeds tokens fail verification, and the first one
+            # wakes the JWKS refresh task early.
+            WarmupStep("clerk_jwks", lambda: asyncio.to_thread(jwks_store.load), required=False),
+        ]
+    )
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import time
 import uuid
@@ -9,10 +10,12 @@ from recipe_api.features.generate.log_service import GenerationLogService
 from recipe_api.features.generate.prompts import RecipePrompts
 from recipe_api.features.generate.schemas import GenerateRecipeInput
 from recipe_api.features.recipes.service import RecipeService
-from recipe_api.shared.db import get_db_session
+from recipe_api.features.users.reconcile import CountReconciler
+from recipe_api.shared.config import settings
+from recipe_api.shared.db import engine, get_async_db_session
 from recipe_api.shared.models.generation_log import LogGenerationStep as LogStep
 from recipe_api.shared.models.recipe import GenerationStatus, GenerationStep
-from recipe_api.shared.services.embeddings import EmbeddingService
+from recipe_api.shared.services.embedding_executor import get_embedding_executor
 
 
 @activity.defn
@@ -20,9 +23,9 @@ async def create_recipe_placeholder(input_data: dict) -> str:
     workflow_input = GenerateRecipeInput(**input_data)
     activity.logger.info(f"Creating placeholder for workflow: {workflow_input.workflow_id}")
 
-    with get_db_session() as session:
-        svc = RecipeService(session, EmbeddingService())
-        recipe = svc.create_placeholder(
+    async with get_async_db_session() as session:
+        svc = RecipeService(session, get_embedding_executor())
+        recipe = await svc.create_placeholder(
             user_id=workflow_input.user_id,
             workflow_id=workflow_input.workflow_id,
             prompt=workflow_input.prompt,
@@ -40,9 +43,9 @@ async def generate_recipe_content(
     activity.logger.info(f"Generating recipe for: {workflow_input.prompt}")
     recipe_uuid = uuid.UUID(recipe_id)
 
-    with get_db_session() as session:
-        recipe_svc = RecipeService(session, EmbeddingService())
-        recipe_svc.update_generation_status(
+    async with get_async_db_session() as session:
+        recipe_svc = RecipeService(session, get_embedding_executor())
+        await recipe_svc.update_generation_status(
             recipe_uuid,
             step=GenerationStep.GENERATING,
             status=GenerationStatus.IN_PROGRESS,
@@ -55,16 +58,16 @@ async def generate_recipe_content(
     raw_response = ""
 
     try:
-        parsed_data, raw_response, _ = llm_svc.generate_content(workflow_input)
+        parsed_data, raw_response, _ = await llm_svc.generate_content(workflow_input)
         return parsed_data
     except Exception as e:
         error = str(e)
         raise
     finally:
         duration_ms = int((time.time() - start_time) * 1000)
-        with get_db_session() as session:
+        async with get_async_db_session() as session:
             log_svc = GenerationLogService(session)
-            log_svc.log_llm_call(
+            await log_svc.log_llm_call(
                 recipe_id=recipe_uuid,
                 workflow_id=workflow_id,
                 step=LogStep.GENERATE,
@@ -91,9 +94,9 @@ async def review_recipe_quality(
     activity.logger.info(f"Reviewing recipe: {recipe_data.get('name', 'Unknown')}")
     recipe_uuid = uuid.UUID(recipe_id)
 
-    with get_db_session() as session:
-        recipe_svc = RecipeService(session, EmbeddingService())
-        recipe_svc.update_generation_status(recipe_uuid, step=GenerationStep.REVIEWING)
+    async with get_async_db_session() as session:
+        recipe_svc = RecipeService(session, get_embedding_executor())
+        await recipe_svc.update_generation_status(recipe_uuid, step=GenerationStep.REVIEWING)
 
     llm_svc = GenerationLLMService()
     start_time = time.time()
@@ -102,16 +105,16 @@ async def review_recipe_quality(
     raw_response = ""
 
     try:
-        parsed_data, raw_response = llm_svc.review_quality(recipe_data)
+        parsed_data, raw_response = await llm_svc.review_quality(recipe_data)
         return parsed_data
     except Exception as e:
         error = str(e)
         raise
     finally:
         duration_ms = int((time.time() - start_time) * 1000)
-        with get_db_session() as session:
+        async with get_async_db_session() as session:
             log_svc = GenerationLogService(session)
-            log_svc.log_llm_call(
+            await log_svc.log_llm_call(
                 recipe_id=recipe_uuid,
                 workflow_id=workflow_id,
                 step=LogStep.REVIEW,
@@ -139,9 +142,9 @@ async def fix_recipe_issues(
     activity.logger.info(f"Fixing recipe: {recipe_data.get('name', 'Unknown')}")
     recipe_uuid = uuid.UUID(recipe_id)
 
-    with get_db_session() as session:
-        recipe_svc = RecipeService(session, EmbeddingService())
-        recipe_svc.update_generation_status(recipe_uuid, step=GenerationStep.FIXING)
+    async with get_async_db_session() as session:
+        recipe_svc = RecipeService(session, get_embedding_executor())
+        await recipe_svc.update_generation_status(recipe_uuid, step=GenerationStep.FIXING)
 
     llm_svc = GenerationLLMService()
     start_time = time.time()
@@ -150,7 +153,7 @@ async def fix_recipe_issues(
     raw_response = ""
 
     try:
-        parsed_data, raw_response = llm_svc.fix_issues(recipe_data, review_data)
+        parsed_data, raw_response = await llm_svc.fix_issues(recipe_data, review_data)
         return parsed_data
     except Exception as e:
         error = str(e)
@@ -175,9 +178,9 @@ async def fix_recipe_issues(
             json.dumps(recipe_data, indent=2), json.dumps(issues, indent=2)
         )
 
-        with get_db_session() as session:
+        async with get_async_db_session() as session:
             log_svc = GenerationLogService(session)
-            log_svc.log_llm_call(
+            await log_svc.log_llm_call(
                 recipe_id=recipe_uuid,
                 workflow_id=workflow_id,
                 step=LogStep.FIX,
@@ -198,9 +201,9 @@ async def finalize_recipe(
 ) -> str:
     activity.logger.info(f"Finalizing recipe: {recipe_data.get('name', 'Unknown')}")
 
-    with get_db_session() as session:
-        svc = RecipeService(session, EmbeddingService())
-        recipe = svc.finalize_generated_recipe(
+    async with get_async_db_session() as session:
+        svc = RecipeService(session, get_embedding_executor())
+        recipe = await svc.finalize_generated_recipe(
             recipe_id=uuid.UUID(recipe_id),
             name=recipe_data["name"],
             description=recipe_data["description"],
@@ -217,8 +220,23 @@ async def mark_recipe_failed(
     error: str,
 ) -> None:
     activity.logger.error(f"Marking recipe {recipe_id} as failed: {error}")
-    with get_db_session() as session:
-        svc = RecipeService(session, EmbeddingService())
-        svc.update_generation_status(
+    async with get_async_db_session() as session:
+        svc = RecipeService(session, get_embedding_executor())
+        await svc.update_generation_status(
             uuid.UUID(recipe_id), status=GenerationStatus.FAILED, error=error
         )
+
+
+@activity.defn
+async def reconcile_counts() -> dict:
+    reconciler = CountReconciler(engine, settings.counter_reconcile_batch_size)
+    result = await asyncio.to_thread(reconciler.run)
+    for drift in result.drift:
+        activity.logger.warning(
+            f"Recipe {drift.recipe_id} {drift.counter} drifted: {drift.stored} -> {drift.actual}"
+        )
+    return {
+        "checked": result.checked,
+        "corrected": result.corrected,
+        "drifted_counters": len(result.drift),
+    }
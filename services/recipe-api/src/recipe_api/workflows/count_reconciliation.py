@@ -0,0 +1,26 @@
+from datetime import timedelta
+
+from temporalio import workflow
+
+with workflow.unsafe.imports_passed_through():
+    from recipe_api.workflows.activities import reconcile_counts
+    from recipe_api.workflows.recipe_generation import DB_RETRY_POLICY
+
+RECONCILE_SCHEDULE_ID = "reconcile-counts"
+
+
+@workflow.defn
+class CountReconciliationWorkflow:
+    """Runs `reconcile-counts` over recently touched recipes; started by a schedule."""
+
+    @workflow.run
+    async def run(self) -> dict:
+        result = await workflow.execute_activity(
+            reconcile_counts,
+            start_to_close_timeout=timedelta(minutes=10),
+            retry_policy=DB_RETRY_POLICY,
+        )
+        workflow.logger.info(
+            f"Reconciled {result['checked']} recipes, corrected {result['corrected']}"
+        )
+        return result
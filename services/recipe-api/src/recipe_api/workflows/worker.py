@@ -1,18 +1,34 @@
 import asyncio
 import logging
+from datetime import timedelta
 
-from temporalio.client import Client
+from temporalio.client import (
+    Client,
+    Schedule,
+    ScheduleActionStartWorkflow,
+    ScheduleAlreadyRunningError,
+    ScheduleIntervalSpec,
+    ScheduleOverlapPolicy,
+    SchedulePolicy,
+    ScheduleSpec,
+)
 from temporalio.worker import Worker
 
 from recipe_api.shared.config import settings
+from recipe_api.shared.services.llm import close_async_openai_client
 from recipe_api.workflows.activities import (
     create_recipe_placeholder,
     finalize_recipe,
     fix_recipe_issues,
     generate_recipe_content,
     mark_recipe_failed,
+    reconcile_counts,
     review_recipe_quality,
 )
+from recipe_api.workflows.count_reconciliation import (
+    RECONCILE_SCHEDULE_ID,
+    CountReconciliationWorkflow,
+)
 from recipe_api.workflows.recipe_generation import RecipeGenerationWorkflow
 
 logging.basicConfig(
@@ -22,6 +38,32 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def ensure_reconcile_schedule(client: Client) -> None:
+    """Create the count reconciliation schedule unless a worker already did."""
+    try:
+        await client.create_schedule(
+            RECONCILE_SCHEDULE_ID,
+            Schedule(
+                action=ScheduleActionStartWorkflow(
+                    CountReconciliationWorkflow.run,
+                    id=RECONCILE_SCHEDULE_ID,
+                    task_queue=settings.temporal_task_queue,
+                ),
+                spec=ScheduleSpec(
+                    intervals=[
+                        ScheduleIntervalSpec(
+                            every=timedelta(minutes=settings.counter_reconcile_interval_minutes)
+                        )
+                    ]
+                ),
+                policy=SchedulePolicy(overlap=ScheduleOverlapPolicy.SKIP),
+            ),
+        )
+        logger.info(f"Created schedule {RECONCILE_SCHEDULE_ID}")
+    except ScheduleAlreadyRunningError:
+        pass
+
+
 async def main() -> None:
     logger.info(f"Connecting to Temporal at {settings.temporal_host}")
 
@@ -30,12 +72,14 @@ async def main() -> None:
         namespace=settings.temporal_namespace,
     )
 
+    await ensure_reconcile_schedule(client)
+
     logger.info(f"Starting worker on task queue: {settings.temporal_task_queue}")
 
     worker = Worker(
         client,
         task_queue=settings.temporal_task_queue,
-        workflows=[RecipeGenerationWorkflow],
+        workflows=[RecipeGenerationWorkflow, CountReconciliationWorkflow],
         activities=[
             create_recipe_placeholder,
             generate_recipe_content,
@@ -43,6 +87,7 @@ async def main() -> None:
             fix_recipe_issues,
             finalize_recipe,
             mark_recipe_failed,
+            reconcile_counts,
         ],
         max_concurrent_activities=settings.worker_max_concurrent_activities,
         max_concurrent_workflow_tasks=settings.worker_max_concurrent_workflow_tasks,
@@ -50,7 +95,10 @@ async def main() -> None:
 
     logger.info("Worker started. Waiting for tasks...")
 
-    await worker.run()
+    try:
+        await worker.run()
+    finally:
+        await close_async_openai_client()
 
 
 if __name__ == "__main__":
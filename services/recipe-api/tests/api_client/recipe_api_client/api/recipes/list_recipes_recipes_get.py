@@ -12,15 +12,28 @@ from ...types import UNSET, Response, Unset
 
 def _get_kwargs(
     *,
-    skip: int | Unset = 0,
+    cursor: None | str | Unset = UNSET,
     limit: int | Unset = 20,
+    skip: int | None | Unset = UNSET,
 ) -> dict[str, Any]:
     params: dict[str, Any] = {}
 
-    params["skip"] = skip
+    json_cursor: None | str | Unset
+    if isinstance(cursor, Unset):
+        json_cursor = UNSET
+    else:
+        json_cursor = cursor
+    params["cursor"] = json_cursor
 
     params["limit"] = limit
 
+    json_skip: int | None | Unset
+    if isinstance(skip, Unset):
+        json_skip = UNSET
+    else:
+        json_skip = skip
+    params["skip"] = json_skip
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     _kwargs: dict[str, Any] = {
@@ -70,14 +83,19 @@ def _build_response(
 def sync_detailed(
     *,
     client: AuthenticatedClient,
-    skip: int | Unset = 0,
+    cursor: None | str | Unset = UNSET,
     limit: int | Unset = 20,
+    skip: int | None | Unset = UNSET,
 ) -> Response[HTTPValidationError | list[RecipeRead]]:
     """List Recipes
 
+     Newest first. Pass the `X-Next-Cursor` response header back as `cursor`
+    for the next page; the header is absent on the last page.
+
     Args:
-        skip (int | Unset):  Default: 0.
+        cursor (None | str | Unset):
         limit (int | Unset):  Default: 20.
+        skip (int | None | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -88,8 +106,9 @@ def sync_detailed(
     """
 
     kwargs = _get_kwargs(
-        skip=skip,
+        cursor=cursor,
         limit=limit,
+        skip=skip,
     )
 
     response = client.get_httpx_client().request(
@@ -102,14 +121,19 @@ def sync_detailed(
 def sync(
     *,
     client: AuthenticatedClient,
-    skip: int | Unset = 0,
+    cursor: None | str | Unset = UNSET,
     limit: int | Unset = 20,
+    skip: int | None | Unset = UNSET,
 ) -> HTTPValidationError | list[RecipeRead] | None:
     """List Recipes
 
+     Newest first. Pass the `X-Next-Cursor` response header back as `cursor`
+    for the next page; the header is absent on the last page.
+
     Args:
-        skip (int | Unset):  Default: 0.
+        cursor (None | str | Unset):
         limit (int | Unset):  Default: 20.
+        skip (int | None | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -121,22 +145,28 @@ def sync(
 
     return sync_detailed(
         client=client,
-        skip=skip,
+        cursor=cursor,
         limit=limit,
+        skip=skip,
     ).parsed
 
 
 async def asyncio_detailed(
     *,
     client: AuthenticatedClient,
-    skip: int | Unset = 0,
+    cursor: None | str | Unset = UNSET,
     limit: int | Unset = 20,
+    skip: int | None | Unset = UNSET,
 ) -> Response[HTTPValidationError | list[RecipeRead]]:
     """List Recipes
 
+     Newest first. Pass the `X-Next-Cursor` response header back as `cursor`
+    for the next page; the header is absent on the last page.
+
     Args:
-        skip (int | Unset):  Default: 0.
+        cursor (None | str | Unset):
         limit (int | Unset):  Default: 20.
+        skip (int | None | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -147,8 +177,9 @@ async def asyncio_detailed(
     """
 
     kwargs = _get_kwargs(
-        skip=skip,
+        cursor=cursor,
         limit=limit,
+        skip=skip,
     )
 
     response = await client.get_async_httpx_client().request(**kwargs)
@@ -159,14 +190,19 @@ async def asyncio_detailed(
 async def asyncio(
     *,
     client: AuthenticatedClient,
-    skip: int | Unset = 0,
+    cursor: None | str | Unset = UNSET,
     limit: int | Unset = 20,
+    skip: int | None | Unset = UNSET,
 ) -> HTTPValidationError | list[RecipeRead] | None:
     """List Recipes
 
+     Newest first. Pass the `X-Next-Cursor` response header back as `cursor`
+    for the next page; the header is absent on the last page.
+
     Args:
-        skip (int | Unset):  Default: 0.
+        cursor (None | str | Unset):
         limit (int | Unset):  Default: 20.
+        skip (int | None | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -179,7 +215,8 @@ async def asyncio(
     return (
         await asyncio_detailed(
             client=client,
-            skip=skip,
+            cursor=cursor,
             limit=limit,
+            skip=skip,
         )
     ).parsed
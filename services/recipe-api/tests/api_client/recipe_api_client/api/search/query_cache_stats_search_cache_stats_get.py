@@ -0,0 +1,133 @@
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.query_cache_stats_search_cache_stats_get_response_query_cache_stats_search_cache_stats_get import (
+    QueryCacheStatsSearchCacheStatsGetResponseQueryCacheStatsSearchCacheStatsGet,
+)
+from ...types import Response
+
+
+def _get_kwargs() -> dict[str, Any]:
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": "/search/cache/stats",
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> QueryCacheStatsSearchCacheStatsGetResponseQueryCacheStatsSearchCacheStatsGet | None:
+    if response.status_code == 200:
+        response_200 = (
+            QueryCacheStatsSearchCacheStatsGetResponseQueryCacheStatsSearchCacheStatsGet.from_dict(
+                response.json()
+            )
+        )
+
+        return response_200
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> Response[QueryCacheStatsSearchCacheStatsGetResponseQueryCacheStatsSearchCacheStatsGet]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    *,
+    client: AuthenticatedClient,
+) -> Response[QueryCacheStatsSearchCacheStatsGetResponseQueryCacheStatsSearchCacheStatsGet]:
+    """Query Cache Stats
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[QueryCacheStatsSearchCacheStatsGetResponseQueryCacheStatsSearchCacheStatsGet]
+    """
+
+    kwargs = _get_kwargs()
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    *,
+    client: AuthenticatedClient,
+) -> QueryCacheStatsSearchCacheStatsGetResponseQueryCacheStatsSearchCacheStatsGet | None:
+    """Query Cache Stats
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        QueryCacheStatsSearchCacheStatsGetResponseQueryCacheStatsSearchCacheStatsGet
+    """
+
+    return sync_detailed(
+        client=client,
+    ).parsed
+
+
+async def asyncio_detailed(
+    *,
+    client: AuthenticatedClient,
+) -> Response[QueryCacheStatsSearchCacheStatsGetResponseQueryCacheStatsSearchCacheStatsGet]:
+    """Query Cache Stats
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[QueryCacheStatsSearchCacheStatsGetResponseQueryCacheStatsSearchCacheStatsGet]
+    """
+
+    kwargs = _get_kwargs()
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    *,
+    client: AuthenticatedClient,
+) -> QueryCacheStatsSearchCacheStatsGetResponseQueryCacheStatsSearchCacheStatsGet | None:
+    """Query Cache Stats
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        QueryCacheStatsSearchCacheStatsGetResponseQueryCacheStatsSearchCacheStatsGet
+    """
+
+    return (
+        await asyncio_detailed(
+            client=client,
+        )
+    ).parsed
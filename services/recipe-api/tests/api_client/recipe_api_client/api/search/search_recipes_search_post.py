@@ -8,31 +8,18 @@ from ...client import AuthenticatedClient, Client
 from ...models.http_validation_error import HTTPValidationError
 from ...models.search_request import SearchRequest
 from ...models.search_response import SearchResponse
-from ...types import UNSET, Response, Unset
+from ...types import Response
 
 
 def _get_kwargs(
     *,
     body: SearchRequest,
-    current_user: None | str | Unset = UNSET,
 ) -> dict[str, Any]:
     headers: dict[str, Any] = {}
 
-    params: dict[str, Any] = {}
-
-    json_current_user: None | str | Unset
-    if isinstance(current_user, Unset):
-        json_current_user = UNSET
-    else:
-        json_current_user = current_user
-    params["current_user"] = json_current_user
-
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
-
     _kwargs: dict[str, Any] = {
         "method": "post",
         "url": "/search/",
-        "params": params,
     }
 
     _kwargs["json"] = body.to_dict()
@@ -75,14 +62,12 @@ def _build_response(
 
 def sync_detailed(
     *,
-    client: AuthenticatedClient | Client,
+    client: AuthenticatedClient,
     body: SearchRequest,
-    current_user: None | str | Unset = UNSET,
 ) -> Response[HTTPValidationError | SearchResponse]:
     """Search Recipes
 
     Args:
-        current_user (None | str | Unset):
         body (SearchRequest):
 
     Raises:
@@ -95,7 +80,6 @@ def sync_detailed(
 
     kwargs = _get_kwargs(
         body=body,
-        current_user=current_user,
     )
 
     response = client.get_httpx_client().request(
@@ -107,14 +91,12 @@ def sync_detailed(
 
 def sync(
     *,
-    client: AuthenticatedClient | Client,
+    client: AuthenticatedClient,
     body: SearchRequest,
-    current_user: None | str | Unset = UNSET,
 ) -> HTTPValidationError | SearchResponse | None:
     """Search Recipes
 
     Args:
-        current_user (None | str | Unset):
         body (SearchRequest):
 
     Raises:
@@ -128,20 +110,17 @@ def sync(
     return sync_detailed(
         client=client,
         body=body,
-        current_user=current_user,
     ).parsed
 
 
 async def asyncio_detailed(
     *,
-    client: AuthenticatedClient | Client,
+    client: AuthenticatedClient,
     body: SearchRequest,
-    current_user: None | str | Unset = UNSET,
 ) -> Response[HTTPValidationError | SearchResponse]:
     """Search Recipes
 
     Args:
-        current_user (None | str | Unset):
         body (SearchRequest):
 
     Raises:
@@ -154,7 +133,6 @@ async def asyncio_detailed(
 
     kwargs = _get_kwargs(
         body=body,
-        current_user=current_user,
     )
 
     response = await client.get_async_httpx_client().request(**kwargs)
@@ -164,14 +142,12 @@ async def asyncio_detailed(
 
 async def asyncio(
     *,
-    client: AuthenticatedClient | Client,
+    client: AuthenticatedClient,
     body: SearchRequest,
-    current_user: None | str | Unset = UNSET,
 ) -> HTTPValidationError | SearchResponse | None:
     """Search Recipes
 
     Args:
-        current_user (None | str | Unset):
         body (SearchRequest):
 
     Raises:
@@ -186,6 +162,5 @@ async def asyncio(
         await asyncio_detailed(
             client=client,
             body=body,
-            current_user=current_user,
         )
     ).parsed
@@ -8,12 +8,18 @@ from .generate_status_response import GenerateStatusResponse
 from .health_health_get_response_health_health_get import HealthHealthGetResponseHealthHealthGet
 from .http_validation_error import HTTPValidationError
 from .ingredient_item import IngredientItem
+from .query_cache_stats_search_cache_stats_get_response_query_cache_stats_search_cache_stats_get import (
+    QueryCacheStatsSearchCacheStatsGetResponseQueryCacheStatsSearchCacheStatsGet,
+)
+from .readiness_response import ReadinessResponse
+from .readiness_response_errors import ReadinessResponseErrors
 from .recipe_create import RecipeCreate
 from .recipe_read import RecipeRead
 from .recipe_search_result import RecipeSearchResult
 from .recipe_status import RecipeStatus
 from .recipe_update import RecipeUpdate
 from .root_get_response_root_get import RootGetResponseRootGet
+from .search_quality import SearchQuality
 from .search_request import SearchRequest
 from .search_response import SearchResponse
 from .toggle_favorite_users_recipes_recipe_id_favorite_post_response_toggle_favorite_users_recipes_recipe_id_favorite_post import (
@@ -33,12 +39,16 @@ __all__ = (
     "HealthHealthGetResponseHealthHealthGet",
     "HTTPValidationError",
     "IngredientItem",
+    "QueryCacheStatsSearchCacheStatsGetResponseQueryCacheStatsSearchCacheStatsGet",
+    "ReadinessResponse",
+    "ReadinessResponseErrors",
     "RecipeCreate",
     "RecipeRead",
     "RecipeSearchResult",
     "RecipeStatus",
     "RecipeUpdate",
     "RootGetResponseRootGet",
+    "SearchQuality",
     "SearchRequest",
     "SearchResponse",
     "ToggleFavoriteUsersRecipesRecipeIdFavoritePostResponseToggleFavoriteUsersRecipesRecipeIdFavoritePost",
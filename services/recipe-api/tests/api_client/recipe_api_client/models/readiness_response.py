@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+if TYPE_CHECKING:
+    from ..models.readiness_response_errors import ReadinessResponseErrors
+
+
+T = TypeVar("T", bound="ReadinessResponse")
+
+
+@_attrs_define
+class ReadinessResponse:
+    """
+    Attributes:
+        ready (bool):
+        pending (list[str]):
+        errors (ReadinessResponseErrors):
+    """
+
+    ready: bool
+    pending: list[str]
+    errors: ReadinessResponseErrors
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        ready = self.ready
+
+        pending = self.pending
+
+        errors = self.errors.to_dict()
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "ready": ready,
+                "pending": pending,
+                "errors": errors,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.readiness_response_errors import ReadinessResponseErrors
+
+        d = dict(src_dict)
+        ready = d.pop("ready")
+
+        pending = cast(list[str], d.pop("pending"))
+
+        errors = ReadinessResponseErrors.from_dict(d.pop("errors"))
+
+        readiness_response = cls(
+            ready=ready,
+            pending=pending,
+            errors=errors,
+        )
+
+        readiness_response.additional_properties = d
+        return readiness_response
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class SearchQuality(str, Enum):
+    ACCURATE = "accurate"
+    BALANCED = "balanced"
+    FAST = "fast"
+
+    def __str__(self) -> str:
+        return str(self.value)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar
+from typing import Any, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..models.search_quality import SearchQuality
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="SearchRequest")
@@ -17,10 +18,12 @@ class SearchRequest:
     Attributes:
         query (str):
         limit (int | Unset):  Default: 10.
+        quality (None | SearchQuality | Unset): Recall/latency trade-off for the vector index scan, defaults to balanced
     """
 
     query: str
     limit: int | Unset = 10
+    quality: None | SearchQuality | Unset = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
@@ -28,6 +31,14 @@ class SearchRequest:
 
         limit = self.limit
 
+        quality: None | str | Unset
+        if isinstance(self.quality, Unset):
+            quality = UNSET
+        elif isinstance(self.quality, SearchQuality):
+            quality = self.quality.value
+        else:
+            quality = self.quality
+
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update(
@@ -37,6 +48,8 @@ class SearchRequest:
         )
         if limit is not UNSET:
             field_dict["limit"] = limit
+        if quality is not UNSET:
+            field_dict["quality"] = quality
 
         return field_dict
 
@@ -47,9 +60,27 @@ class SearchRequest:
 
         limit = d.pop("limit", UNSET)
 
+        def _parse_quality(data: object) -> None | SearchQuality | Unset:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            try:
+                if not isinstance(data, str):
+                    raise TypeError()
+                quality_type_0 = SearchQuality(data)
+
+                return quality_type_0
+            except (TypeError, ValueError, AttributeError, KeyError):
+                pass
+            return cast(None | SearchQuality | Unset, data)
+
+        quality = _parse_quality(d.pop("quality", UNSET))
+
         search_request = cls(
             query=query,
             limit=limit,
+            quality=quality,
         )
 
         search_request.additional_properties = d
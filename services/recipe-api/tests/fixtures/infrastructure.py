@@ -1,9 +1,12 @@
 import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 from testcontainers.postgres import PostgresContainer
 from testcontainers.redis import RedisContainer
 
 from recipe_api.shared.config import Settings, settings
+from recipe_api.shared.db import async_database_url
 
 
 @pytest.fixture(scope="session", name="postgres_container")
@@ -46,3 +49,16 @@ def engine_fixture(test_settings: Settings):
 def session_fixture(engine):
     with Session(engine) as session:
         yield session
+
+@pytest.fixture(name="async_engine")
+async def async_engine_fixture(engine, test_settings: Settings):
+    async_engine = create_async_engine(
+        async_database_url(test_settings.database_url), pool_size=20, max_overflow=0
+    )
+    yield async_engine
+    await async_engine.dispose()
+
+@pytest.fixture(name="async_session")
+async def async_session_fixture(async_engine):
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session